@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Calendar Benchmark - Sidekick Content Calendar Skill
+
+Plans several years of monthly calendars in memory (no calendar files are
+written) and reports how long date selection, pillar/format scheduling and
+topic filling take. Every month is checked as it is built:
+- each platform's pillar and format counts match their apportioned targets
+  (so each is within one post of the platform's exact share)
+- no pillar runs on two consecutive posts of a platform unless the mix makes it unavoidable
+
+Usage:
+    python benchmark_calendar.py --years 10
+    python benchmark_calendar.py --client-folder "/path/to/client" --start 2025-01 --years 5 --platforms 6
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from contextlib import redirect_stdout
+from datetime import datetime
+from io import StringIO
+
+from generate_calendar import CalendarGenerator, ContentScheduler, parse_months
+from reference_index import ReferenceIndex
+
+
+def min_repeats(counts: dict) -> int:
+    """Fewest back-to-back repeats any ordering of `counts` can have."""
+    total, most = sum(counts.values()), max(counts.values(), default=0)
+    return max(0, 2 * most - total - 1)
+
+
+def check_month(generator, posts) -> list:
+    """Problems found in one month's posts (empty when everything holds)."""
+    by_platform = {}
+    for post in posts:
+        by_platform.setdefault(post['Platform'], []).append(post)
+
+    problems = []
+    for platform, rows in by_platform.items():
+        pillars = [row['Pillar'] for row in rows]
+        if Counter(pillars) != +Counter(ContentScheduler.apportion(generator.pillars, len(rows))):
+            problems.append(f"{platform}: pillar counts differ from the strategy split")
+        repeats = sum(1 for a, b in zip(pillars, pillars[1:]) if a == b)
+        if repeats > min_repeats(Counter(pillars)):
+            problems.append(f"{platform}: {repeats} back-to-back pillar repeats")
+
+        key = 'gbp' if platform == 'GBP' else platform.lower()
+        dist = generator.FORMAT_DISTRIBUTION.get(key, ContentScheduler.DEFAULT_FORMATS)
+        if Counter(row['Format'] for row in rows) != +Counter(ContentScheduler.apportion(dist, len(rows))):
+            problems.append(f"{platform}: format counts differ from the target mix")
+    return problems
+
+
+def run(client_folder, months, extra_platforms=0):
+    generator = CalendarGenerator(client_folder, months[0])
+    with redirect_stdout(StringIO()):
+        generator.load_strategy()
+    # Compile the reference index in memory rather than caching it in the client folder
+    generator._references = ReferenceIndex.load()
+    # Synthetic extra channels to stress scheduling with many platforms
+    for n in range(extra_platforms):
+        generator.platforms[f'channel{n + 1}'] = {'frequency': 3 + n % 5, 'priority': 'Secondary'}
+
+    problems, total_posts = [], 0
+    start = time.perf_counter()
+    for month in months:
+        generator.month = datetime.strptime(month, '%Y-%m')
+        posts = generator.build_posts()
+        total_posts += len(posts)
+        problems.extend(f"{month} {p}" for p in check_month(generator, posts))
+    elapsed = time.perf_counter() - start
+    return total_posts, elapsed, problems
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark multi-year calendar planning')
+    parser.add_argument('--client-folder', default='.', help='Client whose strategy to use (default: built-in defaults)')
+    parser.add_argument('--start', default='2025-01', help='First month YYYY-MM (default: %(default)s)')
+    parser.add_argument('--years', type=int, default=10, help='Years to plan (default: %(default)s)')
+    parser.add_argument('--platforms', type=int, default=0, help='Extra synthetic platforms to add (default: 0)')
+    args = parser.parse_args()
+
+    first = parse_months(args.start)[0]
+    year, month = map(int, first.split('-'))
+    end_index = year * 12 + month - 1 + args.years * 12 - 1
+    months = parse_months(f"{first}..{end_index // 12:04d}-{end_index % 12 + 1:02d}")
+
+    total_posts, elapsed, problems = run(args.client_folder, months, args.platforms)
+    print(f"📅 {len(months)} months, {total_posts:,} posts planned in {elapsed:.3f}s "
+          f"({elapsed / len(months) * 1000:.2f} ms/month, {total_posts / elapsed:,.0f} posts/s)")
+    if problems:
+        for problem in problems[:20]:
+            print(f"   ❌ {problem}")
+        print(f"   {len(problems)} problem(s) found")
+        sys.exit(1)
+    print("   ✅ Exact pillar/format counts, no avoidable back-to-back pillars")
@@ -6,22 +6,184 @@ Generates a monthly content calendar CSV structure with:
 - All posting dates based on frequency targets
 - Pillar distribution matching strategy percentages
 - Platform-specific format assignments
-- Placeholder topics ready for ideation
+- Starter topics from references/topic_banks.md, tagged with key dates
+  from references/holiday_calendar.md (placeholders where no bank matches)
 
 Usage:
     python generate_calendar.py --client-folder "/path/to/client" --month 2025-02
     python generate_calendar.py --client-folder "/path/to/client" --month 2025-02 --strategy "/path/to/strategy.md"
+
+Batch mode (strategy parsed once per client, one summary for the run):
+    python generate_calendar.py --client-folder "/path/to/client" --months 2025-01..2025-06
+    python generate_calendar.py --clients-root "/path/to/clients" --months 2025-01..2025-03 --workers 4
 """
 
 import argparse
 import csv
 import json
-import re
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stdout
 from datetime import datetime, timedelta
+from io import StringIO
+from itertools import islice
 from pathlib import Path
 from collections import defaultdict
 import calendar
 
+import strategy_parser
+from reference_index import CACHE_DIR as REFERENCE_CACHE_DIR, ReferenceIndex
+
+SUMMARY_NAME = 'calendar_batch_summary.json'
+
+
+class PostingScheduler:
+    """Picks posting days for one month, working on day indexes (0 = the 1st).
+
+    The weekday of day i is (first_weekday + i) % 7, so every weekday's days
+    are an arithmetic range from the month start; no per-date datetime objects
+    or list-membership scans are needed. One scheduler serves every platform
+    in the month and caches each weekday's days.
+    """
+
+    def __init__(self, year: int, month: int, blackout_dates=()):
+        self.year, self.month = year, month
+        self.first_weekday, self.num_days = calendar.monthrange(year, month)
+        self.blocked = {d.day - 1 for d in blackout_dates if (d.year, d.month) == (year, month)}
+        self._weekday_days = {}
+        self._dates = None
+
+    def days_on(self, weekday: int) -> list:
+        """Indexes of the non-blackout days falling on `weekday` (0=Monday)."""
+        days = self._weekday_days.get(weekday)
+        if days is None:
+            start = (weekday - self.first_weekday) % 7
+            days = self._weekday_days[weekday] = [i for i in range(start, self.num_days, 7) if i not in self.blocked]
+        return days
+
+    def select(self, posting_days, frequency_per_week: int, min_spacing: int = 1) -> list:
+        """Day indexes for a platform posting `frequency_per_week` times a week.
+
+        Every posting-day date is a candidate; if that is not enough for the
+        month's target, other weekdays fill in (earliest weekday first, then
+        earliest date). Accepted days are at least `min_spacing` days apart.
+        The candidates are then thinned evenly down to the target.
+        """
+        target = frequency_per_week * (self.num_days // 7 + 1)
+        if target <= 0:
+            return []
+        posting_days = set(posting_days)
+        preferred = sorted(i for weekday in posting_days for i in self.days_on(weekday))
+        fallback = (i for weekday in range(7) if weekday not in posting_days for i in self.days_on(weekday))
+
+        if min_spacing <= 1:
+            # Days are distinct, so every candidate is acceptable
+            pool = preferred + list(islice(fallback, max(0, target - len(preferred))))
+        else:
+            # too_close[i] is set once day i is within min_spacing of an accepted day
+            too_close = bytearray(self.num_days)
+            pool = []
+
+            def accept(candidates, limit):
+                for i in candidates:
+                    if len(pool) >= limit:
+                        break
+                    if not too_close[i]:
+                        pool.append(i)
+                        lo, hi = max(0, i - min_spacing + 1), min(self.num_days, i + min_spacing)
+                        too_close[lo:hi] = b'\x01' * (hi - lo)
+
+            accept(preferred, len(preferred))
+            if len(pool) < target:
+                accept(fallback, target)
+
+        pool.sort()
+        step = max(1, len(pool) // target)
+        return pool[::step][:target]
+
+    def dates(self, indexes) -> list:
+        """datetimes for day indexes; the month's datetimes are built once and shared."""
+        if self._dates is None:
+            self._dates = [datetime(self.year, self.month, day) for day in range(1, self.num_days + 1)]
+        return [self._dates[i] for i in indexes]
+
+
+class ContentScheduler:
+    """Deterministic pillar and format assignment for a month's posting slots.
+
+    Counts come from largest-remainder apportionment, so they add up exactly
+    and each is within one post of its exact share. Pillars and formats are
+    apportioned per platform, so every platform's own mix (which the brief
+    checks) matches the strategy. Each platform's sequence is then
+    interleaved: no pillar (or format) lands on two consecutive slots
+    whenever the counts allow it, and otherwise the label furthest behind
+    its share goes next, spreading each one evenly through the month.
+    Work is O(slots x labels).
+    """
+
+    DEFAULT_FORMATS = {'Single Image': 100}
+
+    def __init__(self, pillars: dict, format_distribution: dict):
+        self.pillars = pillars
+        self.format_distribution = format_distribution
+
+    @staticmethod
+    def apportion(weights: dict, total: int) -> dict:
+        """Split `total` items by `weights` with the largest-remainder method.
+
+        Leftover items go to the largest fractional remainders; ties go to the
+        earlier key. Non-positive weights get nothing unless all are zero.
+        """
+        weights = {k: max(w, 0) for k, w in weights.items()}
+        weight_sum = sum(weights.values())
+        if weight_sum <= 0:
+            weights, weight_sum = dict.fromkeys(weights, 1), len(weights)
+        if total <= 0 or not weights:
+            return dict.fromkeys(weights, 0)
+
+        counts, remainders = {}, {}
+        for k, w in weights.items():
+            counts[k], remainders[k] = divmod(total * w, weight_sum)
+            counts[k] = int(counts[k])
+        for k in sorted(remainders, key=lambda k: -remainders[k])[:total - sum(counts.values())]:
+            counts[k] += 1
+        return counts
+
+    @staticmethod
+    def interleave(counts: dict) -> list:
+        """Order exactly counts[label] copies of each label, never two in a row if avoidable."""
+        remaining = {k: c for k, c in counts.items() if c > 0}
+        total = sum(remaining.values())
+        credit = dict.fromkeys(remaining, 0)
+        sequence, prev = [], None
+
+        for slots_left in range(total, 0, -1):
+            for k in credit:
+                credit[k] += counts[k]
+            # A label with more than half the remaining slots must go now or it can't be spaced out
+            forced = [k for k, c in remaining.items() if c > slots_left // 2]
+            if forced:
+                pick = max(forced, key=remaining.get)
+            else:
+                candidates = [k for k, c in remaining.items() if c and k != prev] or [prev]
+                pick = max(candidates, key=credit.get)
+            credit[pick] -= total
+            remaining[pick] -= 1
+            sequence.append(pick)
+            prev = pick
+        return sequence
+
+    def assign(self, slots: dict) -> dict:
+        """{platform: number of posts} -> {platform: (pillars, formats)}, one entry per post."""
+        plan = {}
+        for platform, num_posts in slots.items():
+            pillar_counts = self.apportion(self.pillars, num_posts)
+            format_counts = self.apportion(self.format_distribution.get(platform, self.DEFAULT_FORMATS), num_posts)
+            plan[platform] = (self.interleave(pillar_counts), self.interleave(format_counts))
+        return plan
+
 
 class CalendarGenerator:
     """Generates content calendar CSV from strategy inputs."""
@@ -49,12 +211,29 @@ class CalendarGenerator:
         'gbp': {'Update': 70, 'Offer': 20, 'Event': 10},
     }
 
-    def __init__(self, client_folder: str, month: str, strategy_path: str = None):
+    def __init__(self, client_folder: str, month: str, strategy_path: str = None,
+                 blackout_dates=None, min_spacing: dict = None, industry: str = None,
+                 strategy_days: bool = False):
         self.client_folder = Path(client_folder)
         self.month = datetime.strptime(month, '%Y-%m')
         self.strategy_path = Path(strategy_path) if strategy_path else None
 
-        # Will be populated from strategy or defaults
+        # Scheduling constraints: dates never posted on, and minimum days between
+        # two posts on the same platform (platform -> days, default 1)
+        self.blackout_dates = set(blackout_dates or ())
+        self.min_spacing = dict(min_spacing or {})
+        self._scheduler = None
+
+        # Take posting days from the strategy instead of DEFAULT_POSTING_DAYS
+        self.strategy_days = strategy_days
+
+        # Topic bank industry ('none' = key dates only; default: matched from the pillars)
+        self.industry = industry
+        self._references = None
+        self._topic_bank = None
+
+        # Will be populated from strategy or defaults (once per generator)
+        self.strategy_loaded = False
         self.pillars = {}
         self.platforms = {}
         self.posting_days = {}
@@ -64,22 +243,14 @@ class CalendarGenerator:
 
     def load_strategy(self):
         """Load strategy from file or use defaults."""
-        strategy_file = None
+        self.strategy_loaded = True
 
         # Try to find strategy file
         if self.strategy_path and self.strategy_path.exists():
             strategy_file = self.strategy_path
         else:
             # Look in standard locations
-            candidates = [
-                self.client_folder / "07_Marketing_Channels" / "Social_Media" / "00_MASTER_STRATEGY.md",
-                self.client_folder / "07_Marketing_Channels" / "Social_Media" / "00_SOCIAL_STRATEGY.md",
-                self.client_folder / "SOCIAL_STRATEGY.md",
-            ]
-            for candidate in candidates:
-                if candidate.exists():
-                    strategy_file = candidate
-                    break
+            strategy_file = strategy_parser.find_strategy_file(self.client_folder)
 
         if strategy_file:
             print(f"  📄 Loading strategy: {strategy_file.name}")
@@ -87,66 +258,56 @@ class CalendarGenerator:
         else:
             print("  ⚠️ No strategy file found, using defaults")
             self.pillars = self.DEFAULT_PILLARS.copy()
-            self.platforms = {
-                'instagram': {'frequency': 4, 'priority': 'Primary'},
-                'facebook': {'frequency': 3, 'priority': 'Secondary'},
-                'gbp': {'frequency': 2, 'priority': 'Secondary'},
-            }
+            self.platforms = self._default_platforms()
             self.posting_days = self.DEFAULT_POSTING_DAYS.copy()
 
+    @staticmethod
+    def _default_platforms():
+        return {
+            'instagram': {'frequency': 4, 'priority': 'Primary'},
+            'facebook': {'frequency': 3, 'priority': 'Secondary'},
+            'gbp': {'frequency': 2, 'priority': 'Secondary'},
+        }
+
     def _parse_strategy(self, strategy_file: Path):
-        """Extract pillars and platform info from strategy markdown."""
+        """Take pillars, platforms and (with strategy_days) posting days from the parsed (cached) strategy.
+
+        Whatever the strategy doesn't specify falls back to the defaults, with a warning.
+        """
         try:
-            content = strategy_file.read_text()
-
-            # Extract pillars from table
-            pillar_pattern = r'\|\s*([^|]+)\s*\|\s*(\d+)%\s*\|'
-            pillar_matches = re.findall(pillar_pattern, content)
-
-            if pillar_matches:
-                for name, pct in pillar_matches:
-                    name = name.strip()
-                    if name and not name.startswith('Pillar') and not name.startswith('-'):
-                        self.pillars[name] = int(pct)
-
-            # Normalize to 100%
-            if self.pillars:
-                total = sum(self.pillars.values())
-                if total != 100:
-                    for k in self.pillars:
-                        self.pillars[k] = round(self.pillars[k] * 100 / total)
-            else:
-                self.pillars = self.DEFAULT_PILLARS.copy()
-
-            # Extract platform frequencies
-            platform_pattern = r'\|\s*(Instagram|Facebook|Google Business Profile|GBP)\s*\|[^|]*\|[^|]*\|\s*(\d+)[^|]*\|'
-            platform_matches = re.findall(platform_pattern, content, re.IGNORECASE)
-
-            self.platforms = {}
-            for platform, freq in platform_matches:
-                key = platform.lower()
-                if 'google' in key or key == 'gbp':
-                    key = 'gbp'
-                self.platforms[key] = {'frequency': int(freq), 'priority': 'Primary'}
-
-            if not self.platforms:
-                self.platforms = {
-                    'instagram': {'frequency': 4, 'priority': 'Primary'},
-                    'facebook': {'frequency': 3, 'priority': 'Secondary'},
-                    'gbp': {'frequency': 2, 'priority': 'Secondary'},
-                }
+            strategy = strategy_parser.load_strategy(strategy_file, self.client_folder / strategy_parser.CACHE_DIR)
+        except OSError as e:
+            print(f"  ⚠️ Error reading strategy: {e}")
+            strategy = None
+
+        for warning in strategy.warnings if strategy else []:
+            print(f"  ⚠️ {warning}")
+
+        # Normalize to 100%
+        self.pillars = strategy.pillar_percentages() if strategy else {}
+        if self.pillars:
+            total = sum(self.pillars.values())
+            for k in self.pillars:
+                self.pillars[k] = round(self.pillars[k] * 100 / total)
+        else:
+            print("  ⚠️ Using default pillars")
+            self.pillars = self.DEFAULT_PILLARS.copy()
 
-            self.posting_days = self.DEFAULT_POSTING_DAYS.copy()
+        # Only channels with a calendar output folder are scheduled
+        plans = strategy.platforms if strategy else {}
+        self.platforms = {}
+        self.posting_days = self.DEFAULT_POSTING_DAYS.copy()
+        for key, plan in plans.items():
+            if key not in self.DEFAULT_POSTING_DAYS:
+                print(f"  ℹ️ {plan.name} is in the strategy but has no calendar channel; skipped")
+                continue
+            self.platforms[key] = {'frequency': plan.frequency, 'priority': plan.priority or 'Primary'}
+            if self.strategy_days and plan.posting_days:
+                self.posting_days[key] = plan.posting_days
 
-        except Exception as e:
-            print(f"  ⚠️ Error parsing strategy: {e}")
-            self.pillars = self.DEFAULT_PILLARS.copy()
-            self.platforms = {
-                'instagram': {'frequency': 4, 'priority': 'Primary'},
-                'facebook': {'frequency': 3, 'priority': 'Secondary'},
-                'gbp': {'frequency': 2, 'priority': 'Secondary'},
-            }
-            self.posting_days = self.DEFAULT_POSTING_DAYS.copy()
+        if not self.platforms:
+            print("  ⚠️ Using default platforms")
+            self.platforms = self._default_platforms()
 
     def get_month_dates(self):
         """Get all dates in the target month."""
@@ -159,86 +320,42 @@ class CalendarGenerator:
             dates.append(datetime(year, month, day))
         return dates
 
+    def scheduler(self) -> PostingScheduler:
+        """PostingScheduler for the current month, shared by all platforms."""
+        if self._scheduler is None or (self._scheduler.year, self._scheduler.month) != (self.month.year, self.month.month):
+            self._scheduler = PostingScheduler(self.month.year, self.month.month, self.blackout_dates)
+        return self._scheduler
+
     def assign_posting_dates(self, platform: str, frequency_per_week: int):
         """Assign posting dates for a platform based on frequency."""
-        all_dates = self.get_month_dates()
+        scheduler = self.scheduler()
         posting_days = self.posting_days.get(platform, [0, 2, 4])
-
-        # Get all eligible dates (matching posting days)
-        eligible_dates = [d for d in all_dates if d.weekday() in posting_days]
-
-        # If frequency is higher than eligible days, add more days
-        num_weeks = len(all_dates) // 7 + 1
-        target_posts = frequency_per_week * num_weeks
-
-        if len(eligible_dates) < target_posts:
-            # Add more dates as needed
-            remaining = [d for d in all_dates if d not in eligible_dates]
-            remaining.sort(key=lambda x: x.weekday())  # Prefer start of week
-            eligible_dates.extend(remaining[:target_posts - len(eligible_dates)])
-
-        # Take the number we need, evenly distributed
-        eligible_dates.sort()
-        step = max(1, len(eligible_dates) // target_posts)
-        selected = eligible_dates[::step][:target_posts]
-
-        return sorted(selected)
+        return scheduler.dates(scheduler.select(posting_days, frequency_per_week, self.min_spacing.get(platform, 1)))
 
     def distribute_pillars(self, num_posts: int):
         """Distribute pillars across posts based on percentages."""
-        distribution = []
-
-        for pillar, pct in self.pillars.items():
-            count = round(num_posts * pct / 100)
-            distribution.extend([pillar] * count)
-
-        # Pad or trim to exact count
-        while len(distribution) < num_posts:
-            distribution.append(list(self.pillars.keys())[0])
-        distribution = distribution[:num_posts]
-
-        # Shuffle to avoid clustering
-        import random
-        random.seed(42)  # Reproducible
-        random.shuffle(distribution)
-
-        return distribution
+        return ContentScheduler.interleave(ContentScheduler.apportion(self.pillars, num_posts))
 
     def assign_formats(self, platform: str, num_posts: int):
         """Assign content formats based on platform distribution."""
-        dist = self.FORMAT_DISTRIBUTION.get(platform, {'Single Image': 100})
-        formats = []
-
-        for fmt, pct in dist.items():
-            count = round(num_posts * pct / 100)
-            formats.extend([fmt] * count)
-
-        # Pad or trim
-        while len(formats) < num_posts:
-            formats.append(list(dist.keys())[0])
-        formats = formats[:num_posts]
-
-        return formats
-
-    def generate(self):
-        """Generate the content calendar."""
-        print(f"\n📅 Generating calendar for {self.month.strftime('%B %Y')}")
-        print("=" * 50)
-
-        self.load_strategy()
-
-        print(f"\n  Pillars: {', '.join(f'{k} ({v}%)' for k, v in self.pillars.items())}")
-        print(f"  Platforms: {', '.join(f'{k} ({v['frequency']}/week)' for k, v in self.platforms.items())}")
-
-        # Generate posts for each platform
-        all_posts = []
-
-        for platform, config in self.platforms.items():
-            dates = self.assign_posting_dates(platform, config['frequency'])
-            pillars = self.distribute_pillars(len(dates))
-            formats = self.assign_formats(platform, len(dates))
-
-            for i, date in enumerate(dates):
+        dist = self.FORMAT_DISTRIBUTION.get(platform, ContentScheduler.DEFAULT_FORMATS)
+        return ContentScheduler.interleave(ContentScheduler.apportion(dist, num_posts))
+
+    def build_posts(self):
+        """Plan the month's posts for every platform, sorted by date (nothing is written)."""
+        if not self.strategy_loaded:
+            self.load_strategy()
+
+        dates = {platform: self.assign_posting_dates(platform, config['frequency'])
+                 for platform, config in self.platforms.items()}
+        # Pillars and formats are apportioned per platform, so each platform matches the strategy mix
+        plan = ContentScheduler(self.pillars, self.FORMAT_DISTRIBUTION).assign(
+            {platform: len(platform_dates) for platform, platform_dates in dates.items()})
+
+        slots = []
+        for platform, platform_dates in dates.items():
+            pillars, formats = plan[platform]
+            for i, date in enumerate(platform_dates):
                 post = {
                     'Date': date.strftime('%Y-%m-%d'),
                     'Day': date.strftime('%a'),
@@ -251,10 +368,71 @@ class CalendarGenerator:
                     'Hashtags': self._default_hashtags(platform),
                     'Status': 'Draft',
                 }
-                all_posts.append(post)
+                slots.append((post, date))
 
         # Sort by date
-        all_posts.sort(key=lambda x: (x['Date'], x['Platform']))
+        slots.sort(key=lambda x: (x[0]['Date'], x[0]['Platform']))
+        self._fill_topics(slots)
+        return [post for post, _ in slots]
+
+    def references(self) -> ReferenceIndex:
+        """Key dates and topic banks, compiled once and cached under 90_Archive."""
+        if self._references is None:
+            self._references = ReferenceIndex.load(self.client_folder / REFERENCE_CACHE_DIR)
+        return self._references
+
+    def topic_bank(self):
+        """(industry, {pillar: topic ideas}) for this client; industry is None without a match."""
+        if self._topic_bank is None:
+            index = self.references()
+            if self.industry and self.industry.lower() == 'none':
+                industry = None
+            elif self.industry:
+                industry = index.find_industry(self.industry)
+                if not industry:
+                    print(f"  ⚠️ No topic bank for industry '{self.industry}'")
+            else:
+                industry = index.match_industry(self.pillars)
+            self._topic_bank = (industry, index.topics_for(self.pillars, industry) if industry else {})
+        return self._topic_bank
+
+    def _fill_topics(self, slots):
+        """Pre-fill Topic from the topic bank and the key dates on each post's day.
+
+        Each pillar walks its topic list in date order, so a month never repeats a
+        topic until the list runs out; the starting point moves on every month.
+        """
+        index = self.references()
+        industry, topics = self.topic_bank()
+        per_pillar = defaultdict(int)
+        for post, _ in slots:
+            per_pillar[post['Pillar']] += 1
+        month_number = self.month.year * 12 + self.month.month - 1
+        cursor = {pillar: month_number * count for pillar, count in per_pillar.items()}
+
+        for post, date in slots:
+            pillar = post['Pillar']
+            candidates = topics.get(pillar)
+            if candidates:
+                post['Topic'] = candidates[cursor[pillar] % len(candidates)]
+                cursor[pillar] += 1
+            key_dates = [e['name'] for e in index.on(date.date(), industry or self.industry) if not e['span']]
+            if key_dates:
+                post['Topic'] = f"{' / '.join(key_dates)}: {post['Topic']}"
+
+    def generate(self):
+        """Generate the content calendar."""
+        print(f"\n📅 Generating calendar for {self.month.strftime('%B %Y')}")
+        print("=" * 50)
+
+        if not self.strategy_loaded:
+            self.load_strategy()
+
+        print(f"\n  Pillars: {', '.join(f'{k} ({v}%)' for k, v in self.pillars.items())}")
+        platforms = ', '.join(f"{k} ({v['frequency']}/week)" for k, v in self.platforms.items())
+        print(f"  Platforms: {platforms}")
+
+        all_posts = self.build_posts()
 
         # Write per-channel calendars
         platform_map = {
@@ -290,6 +468,17 @@ class CalendarGenerator:
 
         return all_posts
 
+    def generate_months(self, months: list):
+        """Generate calendars for several months, loading the strategy only once.
+
+        Returns {month: posts} in the order given.
+        """
+        results = {}
+        for month in months:
+            self.month = datetime.strptime(month, '%Y-%m')
+            results[month] = self.generate()
+        return results
+
     def _default_hashtags(self, platform: str):
         """Return placeholder hashtags by platform."""
         if platform == 'gbp':
@@ -299,6 +488,33 @@ class CalendarGenerator:
         else:
             return "#[branded] #[niche1] #[niche2] #[local1] #[local2]"
 
+    def _special_notes(self, posts: list):
+        """Key-dates summary line and Special Content Notes for the month's brief."""
+        index = self.references()
+        industry = self.topic_bank()[0] or self.industry
+        year, month = self.month.year, self.month.month
+        by_date = defaultdict(list)
+        for post in posts:
+            by_date[post['Date']].append(post['Pillar'])
+
+        key_dates, notes, spans = [], [], {}
+        for day, entry in index.in_month(year, month, industry):
+            if entry['span']:
+                spans.setdefault(entry['name'], [day, day])[1] = day
+                continue
+            pillars = by_date.get(day.isoformat())
+            planned = f"on calendar: {', '.join(pillars)}" if pillars else "no post scheduled that day"
+            ideas = f" - {entry['ideas']}" if entry['ideas'] else ""
+            key_dates.append(f"{day.strftime('%b %d')} {entry['name']}")
+            notes.append(f"- {day.strftime('%b %d')} ({day.strftime('%a')}): {entry['name']}{ideas} ({planned})")
+
+        for name, (first, last) in spans.items():
+            notes.append(f"- {first.strftime('%b %d')}-{last.strftime('%d')}: {name}")
+        for entry in index.observances(month, industry):
+            when = "Date varies (confirm)" if entry['varies'] else "All month"
+            notes.append(f"- {when}: {entry['name']}")
+        return ", ".join(key_dates), notes
+
     def _write_csv(self, posts: list, path: Path):
         """Write posts to CSV file."""
         fieldnames = ['Date', 'Day', 'Platform', 'Format', 'Pillar', 'Topic',
@@ -324,13 +540,14 @@ class CalendarGenerator:
         total_posts = len(posts)
         
         platform_label = f" - {platform}" if platform else ""
+        key_dates, notes = self._special_notes(posts)
 
         brief = f"""# Content Calendar Brief - {self.month.strftime('%B %Y')}{platform_label}
 
 ## Month Overview
 - **Total Posts:** {total_posts}
 - **Primary Theme:** [Define monthly theme]
-- **Key Dates:** [List special dates]
+- **Key Dates:** {key_dates or '[List special dates]'}
 
 ## Weekly Themes
 - Week 1: [Theme]
@@ -370,10 +587,9 @@ class CalendarGenerator:
                 row += f" {data['formats'].get(fmt, 0)} |"
             brief += row + "\n"
 
+        brief += "\n## Special Content Notes\n"
+        brief += "\n".join(notes or ["- [Date]: [Special content for event/holiday]", "- [Date]: [Promotional push]"])
         brief += """
-## Special Content Notes
-- [Date]: [Special content for event/holiday]
-- [Date]: [Promotional push]
 
 ## Action Items
 - [ ] Fill in all [TBD] topics
@@ -390,17 +606,179 @@ class CalendarGenerator:
             f.write(brief)
 
 
+def parse_months(spec: str) -> list:
+    """Expand '2025-01..2025-06', '2025-01,2025-03' or '2025-02' into YYYY-MM strings."""
+    months = []
+    for part in spec.split(','):
+        part = part.strip()
+        if '..' in part:
+            start, end = (datetime.strptime(m.strip(), '%Y-%m') for m in part.split('..', 1))
+            if end < start:
+                raise ValueError(f"Month range runs backwards: {part}")
+            index = start.year * 12 + start.month - 1
+            while index <= end.year * 12 + end.month - 1:
+                months.append(f"{index // 12:04d}-{index % 12 + 1:02d}")
+                index += 1
+        elif part:
+            months.append(datetime.strptime(part, '%Y-%m').strftime('%Y-%m'))
+    return list(dict.fromkeys(months))
+
+
+def parse_dates(spec: str) -> set:
+    """Expand '2025-12-24..2025-12-26,2025-07-04' into a set of dates."""
+    dates = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if '..' in part:
+            start, end = (datetime.strptime(d.strip(), '%Y-%m-%d').date() for d in part.split('..', 1))
+            if end < start:
+                raise ValueError(f"Date range runs backwards: {part}")
+            dates.update(start + timedelta(days=n) for n in range((end - start).days + 1))
+        elif part:
+            dates.add(datetime.strptime(part, '%Y-%m-%d').date())
+    return dates
+
+
+def parse_spacing(spec: str) -> dict:
+    """Parse 'gbp=3,instagram=2' into {platform: minimum days between posts}."""
+    spacing = {}
+    for part in spec.split(','):
+        if part.strip():
+            platform, _, days = part.partition('=')
+            spacing[platform.strip().lower()] = max(1, int(days))
+    return spacing
+
+
+def find_clients(root, pattern='client-*'):
+    return sorted(p for p in Path(root).glob(pattern) if p.is_dir())
+
+
+def generate_client(client_folder, months, strategy_path=None, quiet=False, options=None):
+    """Generate every month for one client; never raises, failures land in the result.
+
+    `options` are extra CalendarGenerator keyword arguments (blackout_dates, min_spacing, industry,
+    strategy_days).
+    """
+    result = {'client': Path(client_folder).name, 'status': 'ok', 'error': None, 'months': {}}
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(StringIO()) if quiet else nullcontext():
+            generator = CalendarGenerator(client_folder, months[0], strategy_path, **(options or {}))
+            for month, posts in generator.generate_months(months).items():
+                by_platform = defaultdict(int)
+                for post in posts:
+                    by_platform[post['Platform']] += 1
+                result['months'][month] = {'posts': len(posts), 'platforms': dict(sorted(by_platform.items()))}
+    except Exception as e:
+        result.update(status='failed', error=str(e) or type(e).__name__)
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def _generate_client_job(job):
+    return generate_client(*job)
+
+
+def run_batch(clients, months, strategy_path=None, workers=1, quiet=False, options=None):
+    """Generate `months` for each client folder; returns the summary dict."""
+    workers = max(1, min(workers or os.cpu_count() or 1, len(clients)))
+    jobs = [(str(c), months, strategy_path, quiet, options) for c in clients]
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [_generate_client_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() keeps the summary in client order
+            results = list(pool.map(_generate_client_job, jobs))
+
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'months': months,
+        'workers': workers,
+        'wall_seconds': round(time.perf_counter() - start, 3),
+        'succeeded': sum(1 for r in results if r['status'] == 'ok'),
+        'failed': sum(1 for r in results if r['status'] != 'ok'),
+        'total_posts': sum(m['posts'] for r in results for m in r['months'].values()),
+        'clients': results,
+    }
+
+
+def print_summary(summary):
+    print("\n" + "=" * 60)
+    print(f"✅ BATCH COMPLETE: {summary['succeeded']} succeeded, {summary['failed']} failed, "
+          f"{summary['total_posts']} posts in {summary['wall_seconds']:.1f}s")
+    width = max(len(r['client']) for r in summary['clients'])
+    print(f"   {'client':<{width}}  " + "  ".join(f"{m:>7}" for m in summary['months']) + "    time")
+    for r in summary['clients']:
+        cells = "  ".join(f"{r['months'][m]['posts']:>7}" if m in r['months'] else f"{'-':>7}"
+                          for m in summary['months'])
+        print(f"   {r['client']:<{width}}  {cells}  {r['seconds']:>5.2f}s")
+    for r in summary['clients']:
+        if r['status'] != 'ok':
+            print(f"   ❌ {r['client']}: {r['error']}")
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Generate content calendar CSV')
-    parser.add_argument('--client-folder', required=True, help='Path to client folder')
-    parser.add_argument('--month', required=True, help='Target month (YYYY-MM format)')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--client-folder', help='Path to client folder')
+    target.add_argument('--clients-root', help='Directory of client-* folders to generate in one batch')
+    period = parser.add_mutually_exclusive_group(required=True)
+    period.add_argument('--month', help='Target month (YYYY-MM format)')
+    period.add_argument('--months', help="Several months: '2025-01..2025-06' and/or comma-separated YYYY-MM")
     parser.add_argument('--strategy', help='Path to strategy file (optional)')
+    parser.add_argument('--blackout', help="Dates to never post on: '2025-12-24..2025-12-26' and/or comma-separated YYYY-MM-DD")
+    parser.add_argument('--min-spacing', help="Minimum days between posts per platform, e.g. 'gbp=3,instagram=2' (default: 1)")
+    parser.add_argument('--industry', help="Topic bank to draw topics from, e.g. 'Home Services' "
+                                           "(default: matched from the pillars; 'none' = key dates only)")
+    parser.add_argument('--strategy-days', action='store_true',
+                        help='Post on the days named in the strategy (Days column or channel strategies) '
+                             'instead of the default schedule')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Clients generated in parallel with --clients-root (0 = one per CPU; default: 1)')
+    parser.add_argument('--pattern', default='client-*', help='Glob for client folders (default: %(default)s)')
+    parser.add_argument('--summary', help=f'Summary JSON path (default with --clients-root: <clients-root>/{SUMMARY_NAME})')
+    parser.add_argument('--quiet', action='store_true', help='Only print the batch summary')
 
     args = parser.parse_args()
 
-    generator = CalendarGenerator(
-        client_folder=args.client_folder,
-        month=args.month,
-        strategy_path=args.strategy
-    )
-    generator.generate()
+    try:
+        months = parse_months(args.months) if args.months else [datetime.strptime(args.month, '%Y-%m').strftime('%Y-%m')]
+    except ValueError as e:
+        parser.error(f"Invalid month: {e}")
+    try:
+        options = {
+            'blackout_dates': parse_dates(args.blackout) if args.blackout else None,
+            'min_spacing': parse_spacing(args.min_spacing) if args.min_spacing else None,
+            'industry': args.industry,
+            'strategy_days': args.strategy_days,
+        }
+    except ValueError as e:
+        parser.error(f"Invalid --blackout/--min-spacing: {e}")
+
+    if args.client_folder and len(months) == 1 and not args.summary:
+        generator = CalendarGenerator(
+            client_folder=args.client_folder,
+            month=months[0],
+            strategy_path=args.strategy,
+            **options
+        )
+        generator.generate()
+        sys.exit(0)
+
+    clients = [Path(args.client_folder)] if args.client_folder else find_clients(args.clients_root, args.pattern)
+    if not clients:
+        print(f"❌ No {args.pattern} folders found in {args.clients_root}")
+        sys.exit(1)
+
+    print(f"📁 Generating {len(months)} month(s) for {len(clients)} client(s)")
+    summary = run_batch(clients, months, args.strategy, args.workers, args.quiet, options)
+    print_summary(summary)
+
+    summary_path = args.summary or (Path(args.clients_root) / SUMMARY_NAME if args.clients_root else None)
+    if summary_path:
+        with open(summary_path, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"   📄 Summary: {summary_path}")
+    sys.exit(1 if summary['failed'] else 0)
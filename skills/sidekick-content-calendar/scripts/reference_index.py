@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Reference Index - Sidekick Content Calendar Skill
+
+Compiles references/holiday_calendar.md and references/topic_banks.md into
+one lookup structure for the calendar generator:
+- key dates: fixed ("Jan 1"), nth weekday ("Jan (3rd Mon)", "May (last Mon)"),
+  relative ("Nov (Fri after Thanksgiving)"), week spans ("May (1st week)")
+  and month-long observances ("Black History Month", "Sep: Arts in Education Month")
+- topic banks: industry -> pillar -> numbered topic ideas
+
+The compiled rules are cached as JSON, keyed by the sha256 of both reference
+files (and of this script), so they are re-parsed only when a file changes.
+Rules are expanded into a {date: key dates} dict once per year; after that
+every lookup is a dict access.
+
+Usage:
+    python reference_index.py --year 2025 --month 11
+    python reference_index.py --year 2025 --industry "Home Services"
+"""
+
+import argparse
+import calendar
+import hashlib
+import json
+import os
+import re
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REFERENCES_DIR = Path(__file__).resolve().parent.parent / "references"
+HOLIDAYS_FILE = 'holiday_calendar.md'
+TOPICS_FILE = 'topic_banks.md'
+CACHE_DIR = Path("90_Archive") / "Calendar_Cache"
+CACHE_NAME = 'reference_index.json'
+
+MONTHS = {name.lower(): i for i, name in enumerate(calendar.month_abbr) if name}
+MONTHS.update({name.lower(): i for i, name in enumerate(calendar.month_name) if name})
+WEEKDAYS = {name.lower(): i for i, name in enumerate(calendar.day_abbr)}
+ORDINALS = {'1st': 1, '2nd': 2, '3rd': 3, '4th': 4, '5th': 5, 'last': -1}
+
+# "Jan 1", "Jan (3rd Mon)", "Nov (Fri after Thanksgiving)", "May (1st week)", "Feb (varies)", "Sep"
+DATE_SPEC = re.compile(r'^(?P<month>[A-Za-z]{3,9})\.?(?:\s+(?P<day>\d{1,2})|\s*\((?P<rule>[^)]*)\))?$')
+LIST_ITEM = re.compile(r'^\s*[-*]\s+(.*)$')
+NUMBERED_ITEM = re.compile(r'^\s*\d+[.)]\s+(.*)$')
+SHARE = re.compile(r'\s*\(\d+(?:\.\d+)?%\)\s*$')
+STOPWORDS = {'and', 'the', 'of', 'a', '&'}
+
+
+def tokens(name: str) -> set:
+    """Lower-case words of a pillar or industry name, for loose matching."""
+    return {w for w in re.findall(r'[a-z0-9]+', name.lower()) if w not in STOPWORDS}
+
+
+def related(a: str, b: str) -> bool:
+    """Names share a word, allowing a prefix ('Health' ~ 'Healthcare')."""
+    for x in tokens(a):
+        for y in tokens(b):
+            if x == y or (len(x) > 3 and len(y) > 3 and (x.startswith(y) or y.startswith(x))):
+                return True
+    return False
+
+
+def parse_date_spec(text: str) -> Optional[dict]:
+    """A key-date rule from its date cell, or None if the text isn't a date."""
+    match = DATE_SPEC.match(text.strip())
+    if not match or match.group('month').lower() not in MONTHS:
+        return None
+    rule = {'month': MONTHS[match.group('month').lower()]}
+    if match.group('day'):
+        return {**rule, 'kind': 'fixed', 'day': int(match.group('day'))}
+
+    spec = (match.group('rule') or '').strip().lower()
+    words = spec.split()
+    if not spec:
+        return {**rule, 'kind': 'month'}
+    if spec == 'varies':
+        return {**rule, 'kind': 'month', 'varies': True}
+    if len(words) == 2 and words[0] in ORDINALS and words[1][:3] in WEEKDAYS:
+        return {**rule, 'kind': 'nth', 'nth': ORDINALS[words[0]], 'weekday': WEEKDAYS[words[1][:3]]}
+    if len(words) == 2 and words[0] in ORDINALS and words[1] == 'week':
+        return {**rule, 'kind': 'week', 'nth': ORDINALS[words[0]]}
+    if len(words) >= 3 and words[0][:3] in WEEKDAYS and words[1] == 'after':
+        return {**rule, 'kind': 'after', 'weekday': WEEKDAYS[words[0][:3]], 'ref': ' '.join(words[2:])}
+    return {**rule, 'kind': 'month', 'varies': True}
+
+
+def _holiday_rules(text: str) -> List[dict]:
+    """Key-date rules from holiday_calendar.md (tables and per-month lists)."""
+    rules = []
+    section, heading_month, industry = None, None, None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('## '):
+            section = stripped[3:].strip()
+            heading_month, industry = None, None
+            continue
+        if stripped.startswith('### '):
+            heading = stripped[4:].strip()
+            heading_month = MONTHS.get(heading.lower())
+            # Under "Industry-Specific Dates" each ### is an industry, not a month
+            industry = heading if heading_month is None and section and 'industry' in section.lower() else None
+            continue
+        if section is None or 'tips' in section.lower():
+            continue
+        industry_scope = industry if section and 'industry' in section.lower() else None
+
+        if stripped.startswith('|'):
+            cells = [c.strip() for c in stripped.strip('|').split('|')]
+            rule = parse_date_spec(cells[0]) if cells else None
+            if rule and len(cells) >= 2 and cells[1]:
+                rules.append({**rule, 'name': cells[1], 'ideas': cells[2] if len(cells) > 2 else '',
+                              'industry': industry_scope})
+            continue
+
+        item = LIST_ITEM.match(line)
+        if not item:
+            continue
+        spec, sep, name = item.group(1).partition(':')
+        rule = parse_date_spec(spec) if sep else None
+        if rule:
+            rules.append({**rule, 'name': name.strip(), 'ideas': '', 'industry': industry_scope})
+        elif heading_month:
+            # "- National Mentoring Month" under "### January"
+            rules.append({'month': heading_month, 'kind': 'month', 'name': item.group(1).strip(),
+                          'ideas': '', 'industry': industry_scope})
+
+    # One entry per (date rule, name); the federal table's ideas win over bare list items
+    merged = {}
+    for rule in rules:
+        key = json.dumps({k: v for k, v in rule.items() if k != 'ideas'}, sort_keys=True)
+        if key not in merged or (rule['ideas'] and not merged[key]['ideas']):
+            merged[key] = rule
+    return list(merged.values())
+
+
+def _topic_banks(text: str) -> Dict[str, Dict[str, List[str]]]:
+    """industry -> pillar -> topics from topic_banks.md."""
+    banks, industry, pillar = {}, None, None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('## '):
+            industry, pillar = stripped[3:].strip(), None
+        elif stripped.startswith('### ') and industry:
+            pillar = SHARE.sub('', stripped[4:]).strip()
+            banks.setdefault(industry, {})[pillar] = []
+        elif pillar:
+            item = NUMBERED_ITEM.match(line)
+            if item:
+                banks[industry][pillar].append(item.group(1).strip())
+    return {name: pillars for name, pillars in banks.items() if any(pillars.values())}
+
+
+class ReferenceIndex:
+    """Key dates and topic ideas from the skill's reference files.
+
+    Load with ReferenceIndex.load(); query with on(day), in_month(),
+    observances(month) and topics_for(pillars, industry).
+    """
+
+    def __init__(self, data: dict):
+        self.rules = data['rules']
+        self.banks = data['topics']
+        self._years = {}
+
+    @staticmethod
+    def source_key(references_dir: Path = REFERENCES_DIR) -> str:
+        digest = hashlib.sha256(Path(__file__).read_bytes())
+        for name in (HOLIDAYS_FILE, TOPICS_FILE):
+            path = Path(references_dir) / name
+            digest.update(name.encode())
+            digest.update(path.read_bytes() if path.exists() else b'')
+        return digest.hexdigest()
+
+    @staticmethod
+    def compile(references_dir: Path = REFERENCES_DIR) -> dict:
+        """Parse both reference files (missing files give empty sections)."""
+        def read(name):
+            path = Path(references_dir) / name
+            return path.read_text(encoding='utf-8') if path.exists() else ''
+        return {'rules': _holiday_rules(read(HOLIDAYS_FILE)), 'topics': _topic_banks(read(TOPICS_FILE))}
+
+    @classmethod
+    def load(cls, cache_dir: Path = None, references_dir: Path = REFERENCES_DIR) -> 'ReferenceIndex':
+        """The compiled index, from `cache_dir` when the reference files are unchanged."""
+        if cache_dir is None:
+            return cls(cls.compile(references_dir))
+
+        key = cls.source_key(references_dir)
+        cache_path = Path(cache_dir) / CACHE_NAME
+        if cache_path.exists():
+            try:
+                with open(cache_path) as f:
+                    cached = json.load(f)
+                if cached.get('key') == key:
+                    return cls(cached)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"  ⚠️ Ignoring unreadable reference index: {e}")
+
+        data = cls.compile(references_dir)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'key': key, **data}, f)
+            os.replace(tmp, cache_path)
+        except OSError as e:
+            print(f"  ⚠️ Could not write reference index: {e}")
+        return cls(data)
+
+    # Key dates
+
+    @staticmethod
+    def _nth_weekday(year: int, month: int, weekday: int, nth: int) -> Optional[date]:
+        days = [d for d in range(1, calendar.monthrange(year, month)[1] + 1)
+                if calendar.weekday(year, month, d) == weekday]
+        if nth == -1:
+            return date(year, month, days[-1])
+        return date(year, month, days[nth - 1]) if nth <= len(days) else None
+
+    def _expand(self, year: int) -> Dict[date, List[dict]]:
+        """{date: entries} for one year, each entry {'name', 'ideas', 'industry', 'span'}.
+
+        `span` marks multi-day entries ("Small Business Week"), listed on each of their days.
+        """
+        by_date, by_name = {}, {}
+
+        def add(day, rule):
+            entry = {'name': rule['name'], 'ideas': rule['ideas'], 'industry': rule['industry'],
+                     'span': rule['kind'] == 'week'}
+            by_date.setdefault(day, []).append(entry)
+            by_name.setdefault(rule['name'].lower(), day)
+
+        deferred = []
+        for rule in self.rules:
+            kind, month = rule['kind'], rule['month']
+            if kind == 'fixed' and rule['day'] <= calendar.monthrange(year, month)[1]:
+                add(date(year, month, rule['day']), rule)
+            elif kind == 'nth':
+                day = self._nth_weekday(year, month, rule['weekday'], rule['nth'])
+                if day:
+                    add(day, rule)
+            elif kind == 'week':
+                last = calendar.monthrange(year, month)[1]
+                first = last - 6 if rule['nth'] == -1 else (rule['nth'] - 1) * 7 + 1
+                for d in range(first, min(first + 7, last + 1)):
+                    add(date(year, month, d), rule)
+            elif kind == 'after':
+                deferred.append(rule)
+
+        # "Fri after Thanksgiving": first such weekday after the named date
+        for rule in deferred:
+            ref = by_name.get(rule['ref'])
+            if ref:
+                add(ref + timedelta(days=(rule['weekday'] - ref.weekday() - 1) % 7 + 1), rule)
+        return by_date
+
+    def key_dates(self, year: int) -> Dict[date, List[dict]]:
+        if year not in self._years:
+            self._years[year] = self._expand(year)
+        return self._years[year]
+
+    def on(self, day: date, industry: str = None) -> List[dict]:
+        """Key dates falling on `day`: general ones plus those of `industry`."""
+        return [e for e in self.key_dates(day.year).get(day, ())
+                if not e['industry'] or (industry and related(e['industry'], industry))]
+
+    def in_month(self, year: int, month: int, industry: str = None) -> List[tuple]:
+        """(date, entry) for every key date in the month, in date order."""
+        days = [date(year, month, d) for d in range(1, calendar.monthrange(year, month)[1] + 1)]
+        return [(day, entry) for day in days for entry in self.on(day, industry)]
+
+    def observances(self, month: int, industry: str = None) -> List[dict]:
+        """Month-long observances and events without a fixed date."""
+        return [{'name': r['name'], 'ideas': r['ideas'], 'varies': r.get('varies', False)}
+                for r in self.rules
+                if r['kind'] == 'month' and r['month'] == month
+                and (not r['industry'] or (industry and related(r['industry'], industry)))]
+
+    # Topic banks
+
+    def match_industry(self, pillars) -> Optional[str]:
+        """Topic-bank industry sharing the most pillar names with the strategy.
+
+        At least half the strategy's pillars must appear (by name) in the bank,
+        so a generic strategy isn't handed another industry's topics.
+        """
+        pillars = list(pillars)
+        scores = {}
+        for industry, bank in self.banks.items():
+            names = {name.lower() for name in bank}
+            scores[industry] = sum(1 for p in pillars if p.lower() in names)
+        if not scores:
+            return None
+        best = max(scores.values())
+        leaders = [name for name, score in scores.items() if score == best]
+        if len(leaders) != 1 or best * 2 < len(pillars):
+            return None
+        return leaders[0]
+
+    def find_industry(self, name: str) -> Optional[str]:
+        """Topic-bank industry named (loosely) by `name`."""
+        for industry in self.banks:
+            if industry.lower() == name.lower():
+                return industry
+        return next((industry for industry in self.banks if related(industry, name)), None)
+
+    def topics_for(self, pillars, industry: str) -> Dict[str, List[str]]:
+        """pillar -> topic ideas from `industry`'s bank (exact name first, then a related one)."""
+        bank = self.banks.get(industry, {})
+        lookup = {name.lower(): topics for name, topics in bank.items()}
+        result = {}
+        for pillar in pillars:
+            topics = lookup.get(pillar.lower())
+            if topics is None:
+                topics = next((t for name, t in bank.items() if related(pillar, name)), [])
+            result[pillar] = topics
+        return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Show the key dates and topic banks the calendar generator uses')
+    parser.add_argument('--year', type=int, required=True)
+    parser.add_argument('--month', type=int, help='Only this month (1-12)')
+    parser.add_argument('--industry', help="Include this industry's dates and topics")
+    args = parser.parse_args()
+
+    index = ReferenceIndex.load()
+    industry = index.find_industry(args.industry) if args.industry else None
+    for month in [args.month] if args.month else range(1, 13):
+        print(f"\n{calendar.month_name[month]} {args.year}")
+        spans = set()
+        for day, entry in index.in_month(args.year, month, industry or args.industry):
+            when = day.strftime('%a %b %d')
+            if entry['span']:
+                if entry['name'] in spans:
+                    continue
+                spans.add(entry['name'])
+                when = f"from {when}"
+            print(f"  {when}: {entry['name']}" + (f" - {entry['ideas']}" if entry['ideas'] else ''))
+        for entry in index.observances(month, industry or args.industry):
+            print(f"  {'(date varies)' if entry['varies'] else '(all month)'}: {entry['name']}")
+    if industry:
+        print(f"\nTopic bank: {industry}")
+        for pillar, topics in index.banks[industry].items():
+            print(f"  {pillar}: {len(topics)} topics")
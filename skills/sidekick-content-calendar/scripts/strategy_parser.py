@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Strategy Parser - Sidekick Content Calendar Skill
+
+Reads a client's master social strategy (the sidekick-strategy-creator
+MASTER_STRATEGY_TEMPLATE layout) into a typed Strategy:
+- Content pillars from the "| Pillar | % | Purpose | Example Topics |" table
+- Platforms from the "| Platform | Priority | Role | Frequency | Primary Format |" table
+- Posting days from a Days column in that table, or else from the
+  "| Day | ... |" tables in each channel strategy (Instagram/00_IG_STRATEGY.md, ...)
+
+Tables are found by their header row, not by position, so extra columns,
+reordered sections and template placeholders ("[X]%") are tolerated.
+
+Parsed strategies are cached as JSON in <client>/90_Archive/Strategy_Cache/.
+An entry is reused while every strategy file it was parsed from keeps its
+size and mtime, or only the mtime changed but the sha256 is identical, and
+this parser is unchanged; repeat loads skip parsing entirely. Other skills can import load_strategy() or read
+the cached JSON directly.
+
+Usage:
+    python strategy_parser.py --client-folder "/path/to/client"
+    python strategy_parser.py --strategy "/path/to/00_MASTER_STRATEGY.md"
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SOCIAL_DIR = Path("07_Marketing_Channels") / "Social_Media"
+CACHE_DIR = Path("90_Archive") / "Strategy_Cache"
+
+# Where a client's master strategy may live, in order of preference
+STRATEGY_CANDIDATES = [
+    SOCIAL_DIR / "00_MASTER_STRATEGY.md",
+    SOCIAL_DIR / "00_SOCIAL_STRATEGY.md",
+    Path("SOCIAL_STRATEGY.md"),
+]
+
+# Platform names as written in strategies -> canonical key
+PLATFORM_KEYS = {
+    'instagram': 'instagram', 'ig': 'instagram',
+    'facebook': 'facebook', 'fb': 'facebook',
+    'google business profile': 'gbp', 'google business': 'gbp', 'gbp': 'gbp',
+    'linkedin': 'linkedin', 'tiktok': 'tiktok', 'youtube': 'youtube',
+    'pinterest': 'pinterest', 'x': 'x', 'twitter': 'x', 'threads': 'threads',
+}
+
+# Channel strategy files next to the master strategy (see strategy-creator SKILL.md)
+CHANNEL_FILES = {
+    'instagram': Path("Instagram") / "00_IG_STRATEGY.md",
+    'facebook': Path("Facebook") / "00_FB_STRATEGY.md",
+    'gbp': Path("GBP") / "00_GBP_STRATEGY.md",
+}
+
+WEEKDAYS = {name: i for i, names in enumerate([
+    ('mon', 'monday'), ('tue', 'tues', 'tuesday'), ('wed', 'wednesday'), ('thu', 'thur', 'thurs', 'thursday'),
+    ('fri', 'friday'), ('sat', 'saturday'), ('sun', 'sunday'),
+]) for name in names}
+
+PERCENT = re.compile(r'(\d+(?:\.\d+)?)(?:\s*[-–]\s*(\d+(?:\.\d+)?))?\s*%')
+NUMBER = re.compile(r'(\d+(?:\.\d+)?)(?:\s*[-–]\s*(\d+(?:\.\d+)?))?')
+SEPARATOR_CELL = re.compile(r'^:?-{2,}:?$')
+PLACEHOLDER = re.compile(r'^\[.*\]$')
+
+
+@dataclass
+class Pillar:
+    name: str
+    percent: float
+    purpose: str = ''
+    example_topics: List[str] = field(default_factory=list)
+
+
+@dataclass
+class PlatformPlan:
+    key: str                     # canonical key: instagram, facebook, gbp, linkedin, ...
+    name: str                    # as written in the strategy
+    frequency: int               # posts per week (see parse_frequency)
+    priority: str = ''
+    role: str = ''
+    primary_format: str = ''
+    posting_days: List[int] = field(default_factory=list)  # 0=Monday .. 6=Sunday; empty = not specified
+
+
+@dataclass
+class Strategy:
+    source: str
+    sha256: str
+    pillars: List[Pillar] = field(default_factory=list)
+    platforms: Dict[str, PlatformPlan] = field(default_factory=dict)
+    warnings: List[str] = field(default_factory=list)
+
+    def pillar_percentages(self) -> Dict[str, float]:
+        return {p.name: p.percent for p in self.pillars}
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Strategy':
+        return cls(
+            source=data['source'],
+            sha256=data['sha256'],
+            pillars=[Pillar(**p) for p in data.get('pillars', [])],
+            platforms={k: PlatformPlan(**p) for k, p in data.get('platforms', {}).items()},
+            warnings=list(data.get('warnings', [])),
+        )
+
+
+def split_row(line: str) -> List[str]:
+    """Cells of one markdown table row ('| a | b |' -> ['a', 'b'])."""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in re.split(r'(?<!\\)\|', line)]
+
+
+def parse_tables(text: str) -> List[dict]:
+    """Every markdown table in `text` as {'heading', 'header', 'rows'}.
+
+    `header` is the lower-cased header cells; each row is a dict keyed by
+    them. `heading` is the nearest markdown heading above the table.
+    """
+    tables, heading = [], ''
+    lines = text.splitlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+        if line.startswith('#'):
+            heading = line.lstrip('#').strip()
+        elif (line.startswith('|') and i + 1 < len(lines)
+              and all(SEPARATOR_CELL.match(c) for c in split_row(lines[i + 1]) if c)):
+            header = [c.lower() for c in split_row(line)]
+            rows = []
+            i += 2
+            while i < len(lines) and lines[i].strip().startswith('|'):
+                cells = split_row(lines[i])
+                rows.append(dict(zip(header, cells + [''] * (len(header) - len(cells)))))
+                i += 1
+            tables.append({'heading': heading, 'header': header, 'rows': rows})
+            continue
+        i += 1
+    return tables
+
+
+def _column(header: List[str], *names: str) -> Optional[str]:
+    """First header cell equal to (or, failing that, containing) one of `names`."""
+    for name in names:
+        if name in header:
+            return name
+    for name in names:
+        for cell in header:
+            if name in cell:
+                return cell
+    return None
+
+
+def _number(text: str, pattern=NUMBER) -> Optional[float]:
+    """First number in `text`; a range like '50-60' gives its midpoint."""
+    match = pattern.search(text or '')
+    if not match:
+        return None
+    low, high = match.group(1), match.group(2)
+    return (float(low) + float(high)) / 2 if high else float(low)
+
+
+def parse_frequency(text: str) -> Optional[int]:
+    """Posts per week from '5/week', '3x per week' or 'Daily'.
+
+    Read the way the calendar always has: a range counts as its lower bound
+    ('3-4x/week' -> 3) and the number is not converted from other units.
+    """
+    text = (text or '').lower()
+    if 'daily' in text:
+        return 7
+    match = NUMBER.search(text)
+    if not match:
+        return None
+    return int(float(match.group(1)))
+
+
+def parse_days(text: str) -> List[int]:
+    """Weekday indexes named in `text` ('Mon, Wed, Fri', 'Tuesday/Thursday', 'Mon-Fri', 'Weekdays')."""
+    text = (text or '').lower()
+    if 'weekday' in text:
+        return list(range(5))
+    if 'daily' in text or 'every day' in text:
+        return list(range(7))
+    days = []
+    for start, _, end in re.findall(r'([a-z]+)(\s*[-–]\s*([a-z]+))?', text):
+        first, last = WEEKDAYS.get(start), WEEKDAYS.get(end)
+        if first is None:
+            continue
+        if last is None:
+            span = [first]
+        else:  # 'Fri-Mon' wraps past Sunday
+            span = [(first + n) % 7 for n in range((last - first) % 7 + 1)]
+        days.extend(day for day in span if day not in days)
+    return days
+
+
+def platform_key(name: str) -> Optional[str]:
+    name = re.sub(r'[*_`]', '', name or '').strip().lower()
+    return PLATFORM_KEYS.get(name)
+
+
+def _is_placeholder(text: str) -> bool:
+    return not text or bool(PLACEHOLDER.match(text))
+
+
+def _pillars_from(tables: List[dict]) -> List[Pillar]:
+    for table in tables:
+        header = table['header']
+        name_col = _column(header, 'pillar', 'content pillar')
+        pct_col = _column(header, '%', 'percent', 'share', 'target')
+        if not name_col or not pct_col:
+            continue
+        purpose_col = _column(header, 'purpose', 'goal')
+        topics_col = _column(header, 'example topics', 'topics')
+        pillars = []
+        for row in table['rows']:
+            name = re.sub(r'[*_`]', '', row.get(name_col, '')).strip()
+            percent = _number(row.get(pct_col, ''), PERCENT) or _number(row.get(pct_col, ''))
+            if _is_placeholder(name) or percent is None:
+                continue
+            topics = row.get(topics_col, '') if topics_col else ''
+            pillars.append(Pillar(
+                name=name,
+                percent=percent,
+                purpose=row.get(purpose_col, '') if purpose_col else '',
+                example_topics=[t.strip() for t in topics.split(',') if t.strip() and not _is_placeholder(t.strip())],
+            ))
+        if pillars:
+            return pillars
+    return []
+
+
+def _platforms_from(tables: List[dict]) -> Dict[str, PlatformPlan]:
+    for table in tables:
+        header = table['header']
+        name_col = _column(header, 'platform', 'channel')
+        freq_col = _column(header, 'frequency', 'posts/week', 'cadence')
+        if not name_col or not freq_col:
+            continue
+        days_col = _column(header, 'posting days', 'days')
+        platforms = {}
+        for row in table['rows']:
+            key = platform_key(row.get(name_col, ''))
+            frequency = parse_frequency(row.get(freq_col, ''))
+            if not key or frequency is None or key in platforms:
+                continue
+            platforms[key] = PlatformPlan(
+                key=key,
+                name=row[name_col],
+                frequency=frequency,
+                priority=row.get(_column(header, 'priority') or '', ''),
+                role=row.get(_column(header, 'role') or '', ''),
+                primary_format=row.get(_column(header, 'primary format', 'format') or '', ''),
+                posting_days=parse_days(row.get(days_col, '')) if days_col else [],
+            )
+        if platforms:
+            return platforms
+    return {}
+
+
+def _days_from_channel_file(path: Path) -> List[int]:
+    """Weekdays listed in the first '| Day | ... |' table of a channel strategy."""
+    for table in parse_tables(path.read_text(encoding='utf-8', errors='replace')):
+        if table['header'] and table['header'][0] == 'day':
+            days = []
+            for row in table['rows']:
+                days.extend(d for d in parse_days(row['day']) if d not in days)
+            if days:
+                return sorted(days)
+    return []
+
+
+def _channel_files(strategy_file: Path) -> Dict[str, Path]:
+    base = strategy_file.parent
+    return {key: base / rel for key, rel in CHANNEL_FILES.items() if (base / rel).is_file()}
+
+
+def parse_strategy(strategy_file: Path) -> Strategy:
+    """Parse a master strategy (and its channel strategies) without the cache."""
+    strategy_file = Path(strategy_file)
+    data = strategy_file.read_bytes()
+    tables = parse_tables(data.decode('utf-8', errors='replace'))
+
+    strategy = Strategy(
+        source=str(strategy_file),
+        sha256=hashlib.sha256(data).hexdigest(),
+        pillars=_pillars_from(tables),
+        platforms=_platforms_from(tables),
+    )
+    if not strategy.pillars:
+        strategy.warnings.append("No content pillar table (| Pillar | % | ...) with percentages found")
+    elif abs(sum(p.percent for p in strategy.pillars) - 100) > 0.5:
+        strategy.warnings.append(f"Pillar percentages add up to {sum(p.percent for p in strategy.pillars):g}%, not 100%")
+    if not strategy.platforms:
+        strategy.warnings.append("No platform table (| Platform | ... | Frequency | ...) with frequencies found")
+
+    channel_files = _channel_files(strategy_file)
+    for key, plan in strategy.platforms.items():
+        if not plan.posting_days and key in channel_files:
+            plan.posting_days = _days_from_channel_file(channel_files[key])
+    return strategy
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _source_stats(strategy_file: Path) -> Dict[str, os.stat_result]:
+    """Resolved path -> stat of every file the parse reads."""
+    return {str(path.resolve()): path.stat() for path in [strategy_file, *_channel_files(strategy_file).values()]}
+
+
+def _sources_unchanged(files: Dict[str, dict], stats: Dict[str, os.stat_result]) -> bool:
+    """True if the cached `files` still describe `stats`; hashes only files whose mtime moved.
+
+    Entries whose content turns out unchanged get their mtime updated in place.
+    """
+    if set(files) != set(stats):
+        return False
+    for path, st in stats.items():
+        entry = files[path]
+        if entry['size'] != st.st_size:
+            return False
+        if entry['mtime_ns'] != st.st_mtime_ns:
+            if entry['sha256'] != _sha256(path):
+                return False
+            entry['mtime_ns'] = st.st_mtime_ns
+    return True
+
+
+def _write_cache(cache_path: Path, entry: dict):
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(entry, f, indent=2)
+        os.replace(tmp, cache_path)
+    except OSError as e:
+        print(f"  ⚠️ Could not write strategy cache: {e}")
+
+
+def load_strategy(strategy_file: Path, cache_dir: Path = None) -> Strategy:
+    """Parsed strategy for `strategy_file`, from the cache when its files are unchanged.
+
+    With `cache_dir` None nothing is cached. Each strategy file gets one cache
+    entry (named after its path) recording the size, mtime and sha256 of every
+    file read; files are only re-hashed when their mtime changed.
+    """
+    strategy_file = Path(strategy_file)
+    if cache_dir is None:
+        return parse_strategy(strategy_file)
+
+    parser_hash = _sha256(__file__)
+    stats = _source_stats(strategy_file)
+    path_id = hashlib.sha256(str(strategy_file.resolve()).encode()).hexdigest()[:16]
+    cache_path = Path(cache_dir) / f"strategy_{path_id}.json"
+    if cache_path.exists():
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f)
+            if cached.get('parser') == parser_hash:
+                mtimes = [entry['mtime_ns'] for entry in cached['files'].values()]
+                if _sources_unchanged(cached['files'], stats):
+                    if mtimes != [entry['mtime_ns'] for entry in cached['files'].values()]:
+                        _write_cache(cache_path, cached)
+                    return Strategy.from_dict(cached['strategy'])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"  ⚠️ Ignoring unreadable strategy cache: {e}")
+
+    strategy = parse_strategy(strategy_file)
+    files = {path: {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': _sha256(path)}
+             for path, st in stats.items()}
+    _write_cache(cache_path, {'parser': parser_hash, 'files': files, 'strategy': strategy.to_dict()})
+    return strategy
+
+
+def find_strategy_file(client_folder: Path) -> Optional[Path]:
+    """The client's master strategy, or None."""
+    for candidate in STRATEGY_CANDIDATES:
+        path = Path(client_folder) / candidate
+        if path.is_file():
+            return path
+    return None
+
+
+def load_client_strategy(client_folder: Path, use_cache: bool = True) -> Optional[Strategy]:
+    """Parsed master strategy of a client folder (cached under 90_Archive), or None."""
+    strategy_file = find_strategy_file(client_folder)
+    if strategy_file is None:
+        return None
+    return load_strategy(strategy_file, Path(client_folder) / CACHE_DIR if use_cache else None)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Parse a social strategy into JSON (cached per file hash)')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--client-folder', help='Client folder; the master strategy is located automatically')
+    source.add_argument('--strategy', help='Path to a strategy markdown file')
+    parser.add_argument('--no-cache', action='store_true', help='Parse without reading or writing the cache')
+    args = parser.parse_args()
+
+    if args.client_folder:
+        strategy = load_client_strategy(args.client_folder, use_cache=not args.no_cache)
+        if strategy is None:
+            sys.exit(f"No strategy file found in {args.client_folder}")
+    else:
+        if not Path(args.strategy).is_file():
+            sys.exit(f"Strategy file not found: {args.strategy}")
+        strategy = load_strategy(args.strategy, None)
+
+    for warning in strategy.warnings:
+        print(f"⚠️ {warning}", file=sys.stderr)
+    print(json.dumps(strategy.to_dict(), indent=2))
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Extraction Benchmark - Sidekick Profile Builder
+Checks that the prefiltered ExtractionEngine finds exactly the matches of
+running re.finditer per EXTRACTION_PATTERNS entry, and times both.
+
+Every .md/.txt/.csv/.json file under the folder is compared, plus a few
+built-in one-line documents with case-folding edge cases ('İ', 'ı', 'ſ').
+
+Then times consolidate() on everything extracted from the folder, checks
+that ValueClusterer groups each field exactly like comparing every pair of
+values, and fails if consolidation takes longer than --consolidate-budget.
+
+Usage:
+    python benchmark_extraction.py "/path/to/client"
+    python benchmark_extraction.py "/path/to/client" --repeat 5
+    python benchmark_extraction.py "/path/to/client" --consolidate-budget 0.5
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+from build_profile import DirectorySnapshot, ExtractionEngine, ProfileBuilder, ValueClusterer
+
+# One document each, so no other keyword keeps a pattern from being skipped
+EDGE_CASES = [
+    "DOİNG BUSİNESS AS: Istanbul Grill",       # 'İ' lowercases to 'i̇' with str.lower()
+    "Doıng busıness as: Izmir Bakery",         # dotless 'ı' matches 'i' under IGNORECASE
+    "Family owned ſince 2009",                 # long 'ſ' matches 's'
+    "Find us at LİNKEDİN.COM/company/acme",
+    "Serving the Greater µ-Valley area",
+]
+
+
+def plain_matches(content: str) -> list:
+    """(field, pattern, span, groups) of every match, one re.finditer per pattern."""
+    found = []
+    for field, patterns in ProfileBuilder.EXTRACTION_PATTERNS.items():
+        for pattern in patterns:
+            try:
+                regex = re.compile(pattern, ExtractionEngine.FLAGS)
+            except re.error:
+                continue
+            found.extend((field, pattern, m.span(), m.groups()) for m in regex.finditer(content))
+    return found
+
+
+def engine_matches(engine: ExtractionEngine, content: str) -> list:
+    return [(field, pattern, m.span(), m.groups()) for field, pattern, m in engine.finditer(content)]
+
+
+def load_documents(folder: Path) -> dict:
+    documents = {f'<edge case {n}>': text for n, text in enumerate(EDGE_CASES, 1)}
+    for path in sorted(folder.rglob('*')):
+        if path.is_file() and path.suffix.lower() in DirectorySnapshot.PROCESSABLE_EXTENSIONS:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                documents[str(path.relative_to(folder))] = f.read()
+    return documents
+
+
+def timed(fn, documents: dict, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in documents.values():
+            fn(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class PairwiseClusterer(ValueClusterer):
+    """Compares every pair of values, however many there are."""
+    PAIRWISE_MAX = float('inf')
+
+
+def run_consolidate(folder: Path, repeat: int, budget: float) -> bool:
+    """Time consolidate() on the folder's extractions; returns True if clusters match and it is within budget."""
+    builder = ProfileBuilder(str(folder), web_cache=False, incremental=False)
+    for path in builder.scan_files():
+        for field, items in builder.extract_from_file(path).items():
+            builder.extracted[field].extend(items)
+
+    best = float('inf')
+    for _ in range(repeat):
+        builder.conflicts, builder.gaps = [], []
+        start = time.perf_counter()
+        builder.consolidate()
+        best = min(best, time.perf_counter() - start)
+
+    clusterer, pairwise = ValueClusterer(), PairwiseClusterer()
+    mismatches = []
+    for field, items in builder.extracted.items():
+        normalized = [clusterer.normalize(value) for value in dict.fromkeys(i['value'] for i in items)]
+        if clusterer.cluster(normalized) != pairwise.cluster(normalized):
+            mismatches.append(field)
+
+    items = sum(len(i) for i in builder.extracted.values())
+    print(f"🧩 consolidate: {items:,} extracted values in {len(builder.extracted)} fields, "
+          f"{len(builder.conflicts)} conflicts")
+    print(f"   {best:.3f}s (budget {budget:.2f}s)")
+    ok = True
+    for field in mismatches:
+        print(f"   ❌ {field}: clusters differ from comparing every pair")
+        ok = False
+    if best > budget:
+        print("   ❌ Over budget")
+        ok = False
+    if ok:
+        print("   ✅ Identical clusters, within budget")
+    return ok
+
+
+def run(folder: Path, repeat: int) -> bool:
+    """Compare both on every document; returns True if all extractions match."""
+    documents = load_documents(folder)
+    engine = ProfileBuilder.extraction_engine()
+
+    mismatches = [name for name, content in documents.items()
+                  if engine_matches(engine, content) != plain_matches(content)]
+
+    # Compile outside the timed loop so both sides time matching only
+    compiled = [re.compile(p, ExtractionEngine.FLAGS) for _, p, _, _ in engine.compiled]
+    plain = timed(lambda c: [m for regex in compiled for m in regex.finditer(c)], documents, repeat)
+    prefiltered = timed(lambda c: list(engine.finditer(c)), documents, repeat)
+
+    size = sum(len(c) for c in documents.values())
+    print(f"🔎 {len(documents)} documents, {size / 1024:,.0f} KB, {len(compiled)} patterns")
+    print(f"   per-pattern re.finditer {plain:.3f}s, prefiltered engine {prefiltered:.3f}s "
+          f"({plain / prefiltered:.1f}x)")
+    if mismatches:
+        for name in mismatches[:20]:
+            print(f"   ❌ {name}: extractions differ")
+        print(f"   {len(mismatches)} document(s) differ")
+        return False
+    print("   ✅ Identical extractions")
+    return True
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare the prefiltered ExtractionEngine with plain per-pattern regex')
+    parser.add_argument('folder', help='Client folder (or any folder of exports) to scan')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per implementation; the best is reported (default: %(default)s)')
+    parser.add_argument('--consolidate-budget', type=float, default=1.0,
+                        help='Fail if consolidate() takes longer than this many seconds (default: %(default)s)')
+    args = parser.parse_args()
+
+    folder = Path(args.folder).expanduser().resolve()
+    if not folder.is_dir():
+        print(f"❌ Folder not found: {folder}")
+        sys.exit(1)
+    extraction_ok = run(folder, args.repeat)
+    consolidate_ok = run_consolidate(folder, args.repeat, args.consolidate_budget)
+    sys.exit(0 if extraction_ok and consolidate_ok else 1)
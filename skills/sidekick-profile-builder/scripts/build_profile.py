@@ -4,18 +4,40 @@ Build Client Profile from Notion Exports + Web Sources
 Extracts, consolidates, and generates a comprehensive 20-section unified client profile.
 """
 import argparse
+import base64
 import json
+import math
 import re
 import os
-import urllib.request
+import hashlib
+import tempfile
+import urllib.parse
 import urllib.error
+import urllib.request
+import http.client
 import ssl
+import threading
+import time
+from bisect import bisect_left
 from html.parser import HTMLParser
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import closing, contextmanager
+from itertools import chain
 from typing import Dict, List, Any, Optional
 
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse, sre_constants
+
+try:
+    from re._casefix import _EXTRA_CASES as _RE_EXTRA_CASES
+except ImportError:  # Python < 3.11
+    from sre_compile import _ignorecase_fixes as _RE_EXTRA_CASES
+
 
 class SimpleHTMLTextExtractor(HTMLParser):
     """Extract text content from HTML, stripping tags."""
@@ -44,67 +66,777 @@ class SimpleHTMLTextExtractor(HTMLParser):
         return '\n'.join(self.text_parts)
 
 
+class WebCache:
+    """On-disk cache of fetched web pages, keyed by URL.
+
+    Stores each page's extracted text with its ETag/Last-Modified headers.
+    Entries younger than `ttl` are served without a request; older ones are
+    revalidated with a conditional GET (a 304 keeps the cached text). The
+    least recently used entries are evicted once the cache exceeds
+    `max_bytes`. In offline mode only cached text is served.
+    """
+
+    INDEX_NAME = 'index.json'
+    TTL = 24 * 3600               # seconds before an entry is revalidated
+    MAX_BYTES = 50 * 1024 * 1024  # total size of cached text
+
+    def __init__(self, cache_dir: Path, ttl: float = TTL, max_bytes: int = MAX_BYTES, offline: bool = False):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self._lock = threading.Lock()
+        self.index = {}  # url -> {file, etag, last_modified, fetched_at, used_at, size}
+        index_path = self.cache_dir / self.INDEX_NAME
+        if index_path.exists():
+            try:
+                with open(index_path) as f:
+                    self.index = json.load(f)
+            except (OSError, ValueError):
+                self.index = {}
+
+    def lookup(self, url: str) -> Optional[dict]:
+        """Cache entry for `url` (with its text under 'text'), or None."""
+        with self._lock:
+            entry = self.index.get(url)
+        if not entry:
+            return None
+        try:
+            text = (self.cache_dir / entry['file']).read_text(encoding='utf-8')
+        except OSError:
+            return None
+        return {**entry, 'text': text}
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry['fetched_at'] < self.ttl
+
+    def validators(self, entry: dict) -> Dict[str, str]:
+        """Conditional request headers for revalidating `entry`."""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, text: str, headers=None):
+        """Save freshly fetched text; `headers` are the response headers (None keeps the old validators)."""
+        name = hashlib.sha1(url.encode()).hexdigest() + '.txt'
+        now = time.time()
+        with self._lock:
+            entry = self.index.get(url, {})
+            if headers is not None:
+                entry = {'etag': headers.get('ETag'), 'last_modified': headers.get('Last-Modified')}
+            if text is not None:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                (self.cache_dir / name).write_text(text, encoding='utf-8')
+                entry['size'] = len(text.encode('utf-8'))
+            entry.update(file=name, fetched_at=now, used_at=now)
+            self.index[url] = entry
+
+    def touch(self, url: str):
+        """Mark an entry as used (affects eviction order)."""
+        with self._lock:
+            if url in self.index:
+                self.index[url]['used_at'] = time.time()
+
+    def save(self):
+        """Evict least recently used entries over `max_bytes` and write the index."""
+        with self._lock:
+            total = sum(e.get('size', 0) for e in self.index.values())
+            for url, entry in sorted(self.index.items(), key=lambda item: item[1]['used_at']):
+                if total <= self.max_bytes:
+                    break
+                total -= entry.get('size', 0)
+                (self.cache_dir / entry['file']).unlink(missing_ok=True)
+                del self.index[url]
+            if not self.index and not self.cache_dir.exists():
+                return
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.index, f, indent=2)
+            os.replace(tmp, self.cache_dir / self.INDEX_NAME)
+
+
+class FetchBatch:
+    """Deadline of one WebFetcher.fetch_many() call, carried by each of its requests.
+
+    Requests still running when the batch gives up on them keep this
+    deadline after fetch_many() returns, so they stop at it rather than
+    running on without one.
+    """
+
+    def __init__(self, deadline: float = None):
+        self.deadline_at = None if deadline is None else time.monotonic() + deadline
+        self._lock = threading.Lock()
+        self._reported = set()  # URLs whose failure has been printed
+
+    def remaining(self, timeout: float) -> float:
+        """Socket timeout for the next operation: `timeout` capped by the deadline."""
+        if self.deadline_at is None:
+            return timeout
+        left = self.deadline_at - time.monotonic()
+        if left <= 0:
+            raise TimeoutError("deadline reached")
+        return min(timeout, left)
+
+    def first_report(self, url: str) -> bool:
+        """True the first time a failure of `url` is reported, so it is only printed once."""
+        with self._lock:
+            if url in self._reported:
+                return False
+            self._reported.add(url)
+            return True
+
+
 class WebFetcher:
-    """Fetch and extract content from web pages."""
+    """Fetch and extract content from web pages.
+
+    Batches of URLs are fetched concurrently on a thread pool. Connections
+    are kept alive and reused per host, requests are capped globally and per
+    host, and a whole batch is bounded by an overall deadline. Proxies from
+    HTTP_PROXY / HTTPS_PROXY are used unless NO_PROXY excludes the host
+    (HTTPS goes through a CONNECT tunnel).
+    """
+
+    MAX_WORKERS = 8     # concurrent requests overall
+    PER_HOST = 4        # concurrent requests to any one host
+    TIMEOUT = 15        # seconds per request
+    DEADLINE = 60       # seconds for a whole fetch_many() batch
+    MAX_REDIRECTS = 5
+    REDIRECT_CODES = {301, 302, 303, 307, 308}
+
+    # Add headers to look like a browser
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+        'Connection': 'keep-alive',
+    }
 
-    def __init__(self):
+    # Pages to try fetching on a website
+    WEBSITE_PAGES = {
+        'home': '',
+        'about': '/about',
+        'about-us': '/about-us',
+        'services': '/services',
+        'contact': '/contact',
+        'team': '/team',
+        'our-story': '/our-story',
+    }
+
+    def __init__(self, max_workers: int = MAX_WORKERS, per_host: int = PER_HOST,
+                 timeout: float = TIMEOUT, deadline: float = DEADLINE, cache: WebCache = None):
         # Create SSL context that doesn't verify (for simplicity)
         self.ssl_context = ssl.create_default_context()
         self.ssl_context.check_hostname = False
         self.ssl_context.verify_mode = ssl.CERT_NONE
 
-    def fetch_url(self, url: str) -> Optional[str]:
-        """Fetch URL and return text content."""
-        try:
-            # Add headers to look like a browser
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-            request = urllib.request.Request(url, headers=headers)
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self.deadline = deadline
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._idle = defaultdict(list)   # (scheme, host, port) -> idle keep-alive connections
+        self._host_slots = {}            # (scheme, host, port) -> BoundedSemaphore
+        self._closed = False             # set by close(); later connections are not kept
+        self._proxies = urllib.request.getproxies()  # scheme -> proxy URL
+
+    def fetch_url(self, url: str, batch: FetchBatch = None) -> Optional[str]:
+        """Fetch URL and return text content; `batch` bounds it by that batch's deadline."""
+        batch = batch or FetchBatch()
+        cached = self.cache.lookup(url) if self.cache else None
+        if cached and (self.cache.offline or self.cache.is_fresh(cached)):
+            self.cache.touch(url)
+            return cached['text']
+        if self.cache and self.cache.offline:
+            print(f"  ⚠️  Not cached (offline): {url}")
+            return None
 
-            with urllib.request.urlopen(request, timeout=15, context=self.ssl_context) as response:
-                html = response.read().decode('utf-8', errors='replace')
+        try:
+            status, headers, html = self._get(url, batch, self.cache.validators(cached) if cached else None)
+            if status == 304:
+                # Unchanged since it was cached
+                self.cache.store(url, None)
+                return cached['text']
 
             # Extract text from HTML
             parser = SimpleHTMLTextExtractor()
             parser.feed(html)
-            return parser.get_text()
+            text = parser.get_text()
+            if self.cache:
+                self.cache.store(url, text, headers)
+            return text
 
         except Exception as e:
-            print(f"  ⚠️  Could not fetch {url}: {e}")
+            if batch.first_report(url):  # Not if fetch_many() already gave up on it
+                print(f"  ⚠️  Could not fetch {url}: {e}")
+            if cached:
+                print(f"     Using cached copy of {url}")
+                self.cache.touch(url)
+                return cached['text']
             return None
 
-    def fetch_website(self, base_url: str) -> Dict[str, str]:
-        """Fetch main pages from a website."""
-        results = {}
+    def fetch_many(self, urls: List[str]) -> Dict[str, Optional[str]]:
+        """Fetch URLs concurrently; returns url -> text (None if it failed or hit the deadline)."""
+        urls = list(dict.fromkeys(urls))
+        results = {url: None for url in urls}
+        if not urls:
+            return results
 
+        batch = FetchBatch(self.deadline)
+        pool = ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls)))
+        try:
+            futures = {pool.submit(self.fetch_url, url, batch): url for url in urls}
+            done, pending = wait(futures, timeout=self.deadline)
+            for future in done:
+                results[futures[future]] = future.result()
+            for future in pending:
+                if batch.first_report(futures[future]):
+                    print(f"  ⚠️  Could not fetch {futures[future]}: deadline of {self.deadline}s reached")
+        finally:
+            # Requests still in flight stop at the batch deadline, which caps their socket timeouts
+            pool.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def website_pages(self, base_url: str) -> Dict[str, str]:
+        """Page name -> URL for the main pages of a website."""
         # Normalize URL
         if not base_url.startswith('http'):
             base_url = 'https://' + base_url
         base_url = base_url.rstrip('/')
+        return {name: base_url + path for name, path in self.WEBSITE_PAGES.items()}
 
-        # Pages to try fetching
-        pages = {
-            'home': '',
-            'about': '/about',
-            'about-us': '/about-us',
-            'services': '/services',
-            'contact': '/contact',
-            'team': '/team',
-            'our-story': '/our-story',
-        }
+    def fetch_website(self, base_url: str) -> Dict[str, str]:
+        """Fetch main pages from a website."""
+        results = {}
+        pages = self.website_pages(base_url)
 
-        print(f"  🌐 Fetching: {base_url}")
+        print(f"  🌐 Fetching: {pages['home']}")
+        fetched = self.fetch_many(list(pages.values()))
 
-        for page_name, path in pages.items():
-            url = base_url + path
-            content = self.fetch_url(url)
+        for page_name, url in pages.items():
+            content = fetched.get(url)
             if content and len(content) > 100:
                 results[f"[web:{page_name}]"] = content
                 print(f"     ✓ {page_name}")
 
         return results
 
+    def close(self):
+        """Close idle keep-alive connections; connections released later are closed, not kept."""
+        with self._lock:
+            self._closed = True
+            for connections in self._idle.values():
+                for conn in connections:
+                    conn.close()
+            self._idle.clear()
+
+    def _get(self, url: str, batch: FetchBatch, extra_headers: Dict[str, str] = None):
+        """GET a URL, following redirects; returns (status, headers, decoded body)."""
+        for _ in range(self.MAX_REDIRECTS + 1):
+            status, reason, headers, body = self._request(url, batch, extra_headers)
+            location = headers.get('Location')
+            if status in self.REDIRECT_CODES and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if status == 304 and extra_headers:
+                return status, headers, None
+            if status >= 400:
+                raise urllib.error.HTTPError(url, status, reason, headers, None)
+            return status, headers, body.decode('utf-8', errors='replace')
+        raise urllib.error.URLError(f"more than {self.MAX_REDIRECTS} redirects")
+
+    def _request(self, url: str, batch: FetchBatch, extra_headers: Dict[str, str] = None):
+        """One GET over a pooled connection; returns (status, reason, headers, body)."""
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise urllib.error.URLError(f"unsupported URL: {url}")
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = urllib.parse.urlunsplit(('', '', parts.path or '/', parts.query, ''))
+        proxy = self._proxy_for(parts.scheme, parts.hostname)
+        headers = {**self.HEADERS, **(extra_headers or {})}
+        if proxy and parts.scheme == 'http':
+            # Plain HTTP goes to the proxy with the absolute URL as the request target
+            path = urllib.parse.urlunsplit((parts.scheme, parts.netloc, parts.path or '/', parts.query, ''))
+            headers.update(proxy[2])
+
+        slot = self._host_slot(key)
+        if not slot.acquire(timeout=batch.remaining(self.timeout)):
+            raise TimeoutError("deadline reached waiting for a connection")
+        try:
+            while True:
+                conn, reused = self._checkout(key, batch, proxy)
+                try:
+                    if conn.sock is not None:
+                        conn.sock.settimeout(batch.remaining(self.timeout))
+                    conn.request('GET', path, headers=headers)
+                    response = conn.getresponse()
+                    body = response.read()
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    conn.close()
+                    if reused:
+                        continue  # Server dropped an idle keep-alive connection; retry on a new one
+                    raise
+                except BaseException:
+                    conn.close()
+                    raise
+
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._checkin(key, conn)
+                return response.status, response.reason, response.headers, body
+        finally:
+            slot.release()
+
+    def _host_slot(self, key) -> threading.BoundedSemaphore:
+        with self._lock:
+            if key not in self._host_slots:
+                self._host_slots[key] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[key]
+
+    def _checkout(self, key, batch: FetchBatch, proxy=None):
+        """An idle connection to the host if there is one, else a new one; returns (conn, reused)."""
+        with self._lock:
+            if self._idle[key]:
+                return self._idle[key].pop(), True
+        scheme, host, port = key
+        timeout = batch.remaining(self.timeout)
+        if proxy:
+            proxy_host, proxy_port, proxy_headers = proxy
+            if scheme == 'https':
+                conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=timeout, context=self.ssl_context)
+                conn.set_tunnel(host, port, headers=proxy_headers)
+                return conn, False
+            return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout), False
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _proxy_for(self, scheme: str, host: str):
+        """(host, port, headers) of the proxy to reach `host` through, or None to connect directly."""
+        proxy = self._proxies.get(scheme)
+        if not proxy or urllib.request.proxy_bypass(host):
+            return None
+        parts = urllib.parse.urlsplit(proxy if '://' in proxy else 'http://' + proxy)
+        headers = {}
+        if parts.username:
+            credentials = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+            headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(credentials.encode()).decode()
+        return parts.hostname, parts.port, headers
+
+    def _checkin(self, key, conn):
+        with self._lock:
+            if not self._closed:
+                self._idle[key].append(conn)
+                return
+        conn.close()
+
+
+class ExtractionEngine:
+    """Precompiled EXTRACTION_PATTERNS with a literal-keyword prefilter.
+
+    Each pattern is compiled once and tagged with the literals any match
+    must contain (e.g. {'dba', 'doing business as', 'trade name'}). A
+    document is case-folded once and patterns whose literals don't occur in
+    it are skipped without running the regex. Matches come out in the same
+    field/pattern/position order as running re.finditer per pattern.
+
+    Folding follows re's IGNORECASE rules rather than str.lower(): one
+    character in, one character out, using the simple lowercase mapping
+    ('İ' -> 'i', where str.lower() gives 'i̇'), with characters re treats as
+    equal ('ı'/'i', 'ſ'/'s', 'µ'/'μ', ...) mapped to one representative.
+    Text and literals are folded the same way, so a skipped pattern could
+    not have matched.
+    """
+
+    FLAGS = re.IGNORECASE | re.MULTILINE
+
+    # str.lower() maps these to more than one character; re uses the simple mapping
+    _SIMPLE_LOWER = str.maketrans({'\u0130': 'i'})
+    # Characters IGNORECASE matches beyond plain lowercasing -> smallest of each group
+    _CASE_FOLD = str.maketrans({cp: chr(min(cp, *others)) for cp, others in _RE_EXTRA_CASES.items()})
+
+    @classmethod
+    def fold(cls, text: str) -> str:
+        """Case-fold `text` exactly as IGNORECASE compares characters, length-preserving."""
+        return text.translate(cls._SIMPLE_LOWER).lower().translate(cls._CASE_FOLD)
+
+    def __init__(self, patterns: Dict[str, List[str]]):
+        self.compiled = []  # (field, pattern, regex, required literals or None)
+        for field, field_patterns in patterns.items():
+            for pattern in field_patterns:
+                try:
+                    regex = re.compile(pattern, self.FLAGS)
+                except re.error:
+                    continue
+                self.compiled.append((field, pattern, regex, self._required_literals(pattern)))
+
+    def finditer(self, content: str):
+        """Yield (field, pattern, match) for every pattern match in `content`."""
+        haystack = self.fold(content)
+        for field, pattern, regex, literals in self.compiled:
+            if literals is not None and not any(lit in haystack for lit in literals):
+                continue
+            for match in regex.finditer(content):
+                yield field, pattern, match
+
+    @classmethod
+    def _required_literals(cls, pattern: str) -> Optional[frozenset]:
+        """Folded strings of which every match contains at least one, or None."""
+        try:
+            parsed = sre_parse.parse(pattern, cls.FLAGS)
+        except Exception:
+            return None
+        literals = cls._literals_of(list(parsed))
+        return frozenset(literals) if literals else None
+
+    @classmethod
+    def _literals_of(cls, items) -> Optional[set]:
+        """Best required-literal set for a parsed sequence (longest shortest member)."""
+        candidates = []
+        run = ''
+        for op, av in items:
+            if op is sre_constants.LITERAL:
+                run += cls.fold(chr(av))
+                continue
+            if run:
+                candidates.append({run})
+                run = ''
+            if op is sre_constants.SUBPATTERN:
+                sub = cls._literals_of(list(av[-1]))
+                if sub:
+                    candidates.append(sub)
+            elif op is sre_constants.BRANCH:
+                alternatives = [cls._literals_of(list(branch)) for branch in av[1]]
+                if all(alternatives):
+                    candidates.append(set().union(*alternatives))
+            elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[0] >= 1:
+                sub = cls._literals_of(list(av[2]))
+                if sub:
+                    candidates.append(sub)
+        if run:
+            candidates.append({run})
+        if not candidates:
+            return None
+        return max(candidates, key=lambda c: min(len(s) for s in c))
+
+
+class LineIndex:
+    """Newline offsets of one document, for logarithmic offset -> line lookups.
+
+    Built once per document and shared by every extractor, instead of
+    counting newlines in content[:offset] for each match.
+    """
+
+    def __init__(self, content: str):
+        self.newlines = [m.start() for m in re.finditer('\n', content)]
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number of the character at `offset`."""
+        return bisect_left(self.newlines, offset) + 1
+
+
+class ExtractionCache:
+    """Per-file extraction results persisted between builds.
+
+    Stored as one JSON file: for each source file its size, mtime, sha256,
+    display path and the extractions it produced. An entry is reused when
+    size and mtime match, or when only the mtime changed but the content
+    hash is identical. The cache is tagged with a fingerprint of this script
+    (patterns, section rules, scoring), so any change to extraction logic
+    invalidates every entry. Entries for files that no longer exist are
+    dropped on save.
+    """
+
+    FILENAME = '_extraction_cache.json'
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = Path(cache_path)
+        self.fingerprint = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path) as f:
+                    cache = json.load(f)
+                if cache.get('fingerprint') == self.fingerprint:
+                    self.entries = cache.get('files', {})
+            except (OSError, ValueError) as e:
+                print(f"  ⚠️  Ignoring unreadable extraction cache: {e}")
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def lookup(self, path: Path, source: str, st: os.stat_result = None) -> Optional[Dict[str, List[dict]]]:
+        """Cached extractions for `path` if the file is unchanged, else None.
+
+        `st` is the file's stat when the caller already has it.
+        """
+        key = str(Path(path).resolve())
+        entry = self.entries.get(key)
+        try:
+            st = st or os.stat(path)
+            if entry and entry['source'] == source and entry['size'] == st.st_size:
+                if entry['mtime_ns'] != st.st_mtime_ns and entry['sha256'] != self._hash_file(path):
+                    entry = None
+                if entry:
+                    entry['mtime_ns'] = st.st_mtime_ns
+                    self.hits += 1
+                    return entry['extractions']
+        except OSError:
+            pass
+        self.misses += 1
+        return None
+
+    def record(self, path: Path, source: str, extractions: Dict[str, List[dict]]):
+        try:
+            st = os.stat(path)
+            sha256 = self._hash_file(path)
+        except OSError:
+            return  # Unreadable; retried next build
+        self.entries[str(Path(path).resolve())] = {
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'sha256': sha256,
+            'source': source,
+            'extractions': dict(extractions),
+        }
+
+    def save(self, paths: List[Path]):
+        """Write the cache, keeping only entries for `paths`."""
+        keep = {str(Path(p).resolve()) for p in paths}
+        self.entries = {key: entry for key, entry in self.entries.items() if key in keep}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'fingerprint': self.fingerprint, 'files': self.entries}, f)
+        os.replace(tmp, self.cache_path)
+
+
+class DirectorySnapshot:
+    """Every file under the scanned folders, with its classification.
+
+    Taken once per build and shared by extraction, the file manifest, the
+    profile's build metadata and the extraction audit, so the folders are
+    walked exactly once. The walk never descends into skipped directories
+    (.git, node_modules, 90_Archive, ...); they are listed as pruned instead.
+    Files reachable through more than one root or symlink are kept once.
+    """
+
+    # Supported extensions we can process
+    PROCESSABLE_EXTENSIONS = {'.md', '.txt', '.csv', '.json'}
+
+    # Extensions we acknowledge but can't process (logged for transparency)
+    UNPROCESSABLE_EXTENSIONS = {'.pdf', '.doc', '.docx', '.xlsx', '.xls', '.png', '.jpg', '.jpeg', '.gif', '.mp4', '.mov'}
+
+    # Skip patterns - folder/file names to ignore
+    SKIP_PATTERNS = {
+        '__pycache__', '.git', 'node_modules', '.DS_Store',
+        '_extraction_audit.md', '_conflicts.md', '_gaps.md',  # Skip our output files
+        '_file_manifest.md',  # Skip manifest output
+        '90_Archive',  # Skip archived files - outdated data
+    }
+
+    def __init__(self, roots: List[Path]):
+        self.roots = [Path(root) for root in roots]
+        self.total_found = 0
+        self.stats = {}          # path -> os.stat_result, for processable files
+        self.processable = []    # in walk order
+        self.unprocessable = []  # (path, reason)
+        self.skipped = []        # (path, reason)
+        self.pruned = []         # skipped directories, never entered
+        self._scan()
+        self.files = sorted(self.processable)
+
+    def _scan(self):
+        seen = set()     # resolved paths of files already found
+        visited = set()  # resolved directories already walked
+        for root in self.roots:
+            if not root.is_dir():
+                continue
+            stack = [(str(root), os.path.realpath(root))]
+            while stack:
+                path, real = stack.pop()
+                if real in visited:
+                    continue  # Overlapping root or symlink loop
+                visited.add(real)
+                try:
+                    with os.scandir(path) as it:
+                        entries = sorted(it, key=lambda e: e.name)
+                except OSError as e:
+                    print(f"  ⚠️  Could not scan {path}: {e}")
+                    continue
+
+                subdirs = []
+                for entry in entries:
+                    # Symlinks are the only entries whose real path isn't real/name
+                    entry_real = os.path.realpath(entry.path) if entry.is_symlink() else os.path.join(real, entry.name)
+                    try:
+                        is_dir = entry.is_dir()
+                        is_file = not is_dir and entry.is_file()
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if entry.name in self.SKIP_PATTERNS:
+                            self.pruned.append(Path(entry.path))
+                        else:
+                            subdirs.append((entry.path, entry_real))
+                    elif is_file and entry_real not in seen:
+                        seen.add(entry_real)
+                        self._classify(Path(entry.path), entry)
+                # Depth-first, in name order
+                stack.extend(reversed(subdirs))
+
+    def _classify(self, f: Path, entry: os.DirEntry):
+        self.total_found += 1
+        if entry.name in self.SKIP_PATTERNS:
+            self.skipped.append((f, 'system/output file'))
+            return
+
+        ext = f.suffix.lower()
+
+        if ext in self.PROCESSABLE_EXTENSIONS:
+            try:
+                self.stats[f] = entry.stat()
+            except OSError:
+                pass
+            self.processable.append(f)
+        elif ext in self.UNPROCESSABLE_EXTENSIONS:
+            self.unprocessable.append((f, f'format not supported ({ext})'))
+        elif ext:
+            self.skipped.append((f, f'unknown extension ({ext})'))
+        else:
+            self.skipped.append((f, 'no extension'))
+
+    def count_under(self, folder: Path) -> int:
+        """Number of processable files inside `folder`."""
+        folder = str(folder)
+        return sum(1 for f in self.files if str(f).startswith(folder))
+
+
+class ValueClusterer:
+    """Groups candidate values for a field into clusters of near-duplicates.
+
+    Values are normalized once (case, punctuation and markdown folded away),
+    so identical normalized values always share a cluster and are only
+    compared once. Two values are merged when the exact Jaccard similarity of
+    their shingles reaches THRESHOLD. Short values must also agree on every
+    digit, so different phone numbers, prices or dates are never merged.
+
+    Up to PAIRWISE_MAX distinct values are simply compared pairwise. Larger
+    fields only compare pairs whose bottom-k sketches overlap (see
+    _candidate_pairs), which finds every pair that can reach THRESHOLD, so
+    the clusters are the same as comparing all pairs.
+    """
+
+    SHORT_WORDS = 8    # shorter values are shingled by characters, longer ones by words
+    SHINGLE = 3
+    THRESHOLD = 0.6
+    PAIRWISE_MAX = 32  # up to this many distinct values, compare all pairs
+    NON_WORD = re.compile(r'[\W_]+')
+    NON_DIGIT = re.compile(r'\D+')
+
+    def __init__(self):
+        self._normalized = {}
+
+    def normalize(self, value: str) -> str:
+        """Lowercased value with every run of punctuation/whitespace folded to one space."""
+        norm = self._normalized.get(value)
+        if norm is None:
+            norm = self._normalized[value] = self.NON_WORD.sub(' ', value.lower()).strip()
+        return norm
+
+    def cluster(self, normalized: List[str]) -> List[int]:
+        """Cluster number for each normalized value, numbered in order of first appearance."""
+        distinct = list(dict.fromkeys(normalized))
+        parent = list(range(len(distinct)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        shingles = [self._shingles(value) for value in distinct]
+        # Only short values have to agree on their digits
+        digits = [self.NON_DIGIT.sub('', value) if len(value.split()) < self.SHORT_WORDS else None
+                  for value in distinct]
+        if len(distinct) <= self.PAIRWISE_MAX:
+            # Few enough to compare every pair directly
+            pairs = ((i, j) for j in range(len(distinct)) for i in range(j))
+        else:
+            pairs = self._candidate_pairs(shingles)
+
+        for i, j in pairs:
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j and self._similar(shingles[i], shingles[j], digits[i], digits[j]):
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        numbers = {}
+        cluster_of = {value: numbers.setdefault(find(i), len(numbers)) for i, value in enumerate(distinct)}
+        return [cluster_of[value] for value in normalized]
+
+    def _shingles(self, value: str) -> frozenset:
+        # Character shingles are at most SHINGLE long and word shingles longer, so they never collide
+        words = value.split()
+        if len(words) < self.SHORT_WORDS:
+            return frozenset([value[i:i + self.SHINGLE] for i in range(max(1, len(value) - self.SHINGLE + 1))])
+        return frozenset([' '.join(words[i:i + self.SHINGLE]) for i in range(len(words) - self.SHINGLE + 1)])
+
+    def _candidate_pairs(self, shingles: List[frozenset]):
+        """Yield (i, j) for every pair of shingle sets that could reach THRESHOLD.
+
+        Shingles are ranked rarest first and each set is sketched by its
+        lowest-ranked shingles. Sets with Jaccard similarity t share at least
+        t * |set| shingles, so the lowest-ranked shared one is within the
+        first |set| - ceil(t * |set|) + 1 of each (prefix filtering), and
+        only sets sharing a sketch shingle are paired. Sets are visited
+        smallest first, so a set only needs to index the shorter prefix
+        that a pair with a larger set requires, and pairs whose sizes or
+        remaining shingles cannot reach the overlap are skipped.
+        """
+        t = self.THRESHOLD
+        # Ties between equally common shingles can go either way, as long as every set uses the same order
+        counts = Counter(chain.from_iterable(shingles))
+        rank = {shingle: n for n, shingle in enumerate(sorted(counts, key=counts.__getitem__))}
+        index = defaultdict(list)  # shingle -> (set, position of the shingle in it)
+
+        def at_least(fraction, size):
+            # Tolerance: 0.6 * 10 is 6.000000000000001 in floating point
+            return math.ceil(fraction * size - 1e-9)
+
+        for j in sorted(range(len(shingles)), key=lambda n: len(shingles[n])):
+            size = len(shingles[j])
+            ordered = sorted(shingles[j], key=rank.__getitem__)
+            min_size = at_least(t, size)
+            seen = set()
+            for pos, shingle in enumerate(ordered[:size - min_size + 1]):
+                for i, i_pos in index.get(shingle, ()):
+                    if i in seen:
+                        continue
+                    seen.add(i)
+                    i_size = len(shingles[i])
+                    # This is the first shared shingle, so at most the rest of the shorter tail can follow
+                    if i_size >= min_size and min(i_size - i_pos, size - pos) >= at_least(t / (1 + t), i_size + size):
+                        yield i, j
+            for pos, shingle in enumerate(ordered[:size - at_least(2 * t / (1 + t), size) + 1]):
+                index[shingle].append((j, pos))
+
+    def _similar(self, a: frozenset, b: frozenset, digits_a: Optional[str], digits_b: Optional[str]) -> bool:
+        if digits_a != digits_b:
+            return False
+        return len(a & b) / len(a | b) >= self.THRESHOLD
+
+
 class ProfileBuilder:
     """Extracts and consolidates client data from multiple source files."""
 
@@ -361,7 +1093,96 @@ class ProfileBuilder:
         ],
     }
 
-    def __init__(self, client_folder: str, additional_folders: List[str] = None, urls: List[str] = None):
+    # Section header keywords -> section field, matched at the start of a
+    # header's text ("## Target Audience" -> target_audience_section)
+    SECTION_MAPPINGS = {
+        # Section 3: Target Audience
+        r'(?:target\s*)?audience': 'target_audience_section',
+        r'(?:ideal\s*customer|icp)': 'target_audience_section',
+        r'customer\s*(?:segments?|personas?)': 'customer_segments_section',
+        r'customer\s*journey': 'customer_journey_section',
+        r'(?:pain\s*points?|objections?)': 'objections_section',
+        # Section 4: Brand Voice
+        r'brand\s*(?:voice|tone|personality)': 'brand_voice_section',
+        r'(?:messaging|taglines?)': 'brand_voice_section',
+        # Section 5: Products & Services
+        r'(?:products?|services?|offerings?)': 'products_section',
+        r'(?:what\s*we\s*(?:do|offer)|our\s*services)': 'products_section',
+        # Section 6: Content Pillars
+        r'content\s*pillars?': 'content_pillars_section',
+        r'content\s*(?:strategy|themes?)': 'content_pillars_section',
+        # Section 7: SOW/Deliverables
+        r'(?:sow|scope|deliverables)': 'sow_section',
+        r'(?:contract|agreement|services\s*included)': 'sow_section',
+        # Section 8: KPIs & Goals
+        r'(?:kpis?|goals?|metrics?|objectives?)': 'kpis_section',
+        r'(?:targets?|benchmarks?)': 'kpis_section',
+        # Section 9: Competitors
+        r'competitors?': 'competitors_section',
+        r'(?:competitive\s*analysis|landscape)': 'competitors_section',
+        # Section 10: Seasonality
+        r'(?:seasonality|calendar|events?)': 'seasonality_section',
+        r'(?:key\s*dates?|holidays?|blackout)': 'seasonality_section',
+        # Section 11: Visual Brand
+        r'(?:visual|brand)\s*(?:guidelines?|identity|assets?)': 'visual_brand_section',
+        r'(?:colors?|typography|fonts?)': 'visual_brand_section',
+        # Section 12: Account Access
+        r'(?:account\s*access|credentials?|logins?)': 'account_access_section',
+        r'(?:social\s*(?:media\s*)?accounts?|platforms?)': 'account_access_section',
+        # Section 13: Guidelines & Constraints
+        r'(?:guidelines?|constraints?|rules?)': 'guidelines_section',
+        r'(?:approval|legal|compliance)': 'guidelines_section',
+        r'(?:do\s*not|avoid|prohibited)': 'guidelines_section',
+        # Section 14: Business Model & Revenue
+        r'(?:business\s*model|revenue|how.*make\s*money)': 'business_model_section',
+        r'(?:lead\s*sources?|where.*leads?\s*come)': 'lead_sources_section',
+        r'(?:pricing|price\s*points?)': 'pricing_section',
+        # Section 15: Origin Story
+        r'(?:origin|founder|our\s*story|about\s*us)': 'origin_story_section',
+        r'(?:history|milestones?|timeline)': 'milestones_section',
+        r'(?:mission|vision|why\s*we)': 'mission_section',
+        # Section 16: Local Presence & Reputation
+        r'(?:reviews?|reputation|ratings?)': 'reviews_section',
+        r'(?:community|local\s*(?:presence|involvement))': 'community_section',
+        r'(?:partnerships?|sponsors?)': 'partnerships_section',
+        # Section 17: Marketing History
+        r'(?:marketing\s*history|past\s*marketing|previous)': 'marketing_history_section',
+        r'(?:what.*worked|successes?)': 'what_worked_section',
+        r'(?:what.*(?:failed|flopped)|lessons?\s*learned)': 'what_flopped_section',
+        # Section 18: Content Bank & Assets
+        r'(?:content\s*(?:bank|library|assets?)|assets?)': 'content_bank_section',
+        r'(?:photos?|images?|video)': 'media_assets_section',
+        r'(?:testimonials?|case\s*stud)': 'testimonials_section',
+        r'(?:faqs?|frequently\s*asked|common\s*questions?)': 'faq_section',
+        # Section 19: Email & CRM
+        r'(?:email\s*(?:marketing)?|newsletter)': 'email_section',
+        r'(?:crm|customer\s*relationship|lead\s*management)': 'crm_section',
+        # Section 20: Relationship Notes
+        r'(?:relationship|client\s*(?:notes?|preferences?))': 'relationship_section',
+        r'(?:communication|contact\s*preferences?)': 'communication_section',
+        r'(?:working\s*style|how\s*to\s*work)': 'working_style_section',
+    }
+
+    SECTION_RULES = [(re.compile(pattern, re.IGNORECASE), field) for pattern, field in SECTION_MAPPINGS.items()]
+
+    # A markdown header line; group 1 is the header text after the #'s
+    HEADER_LINE = re.compile(r'^#+[ \t]*([^\n]*)$', re.MULTILINE)
+
+    _engine = None  # ExtractionEngine, compiled on first use
+
+    @classmethod
+    def extraction_engine(cls) -> ExtractionEngine:
+        """Compiled EXTRACTION_PATTERNS, shared by every builder in the process."""
+        if cls._engine is None:
+            cls._engine = ExtractionEngine(cls.EXTRACTION_PATTERNS)
+        return cls._engine
+
+    WEB_CACHE_DIRNAME = 'web_cache'
+
+    def __init__(self, client_folder: str, additional_folders: List[str] = None, urls: List[str] = None,
+                 fetch_deadline: float = WebFetcher.DEADLINE, web_cache: bool = True,
+                 web_cache_ttl: float = WebCache.TTL, offline: bool = False, incremental: bool = True,
+                 jobs: int = 1):
         self.client_folder = Path(client_folder)
         self.client_name = self.client_folder.name.replace('client-', '').upper()
         self.source_dir = self.client_folder / "notion_export"
@@ -382,77 +1203,46 @@ class ProfileBuilder:
 
         # URLs to fetch (client website, social profiles, etc.)
         self.urls = urls or []
+        self.fetch_deadline = fetch_deadline
+        self.web_cache = None
+        if web_cache or offline:
+            # Lives under 90_Archive, which scan_files() never reads
+            self.web_cache = WebCache(self.audit_dir / self.WEB_CACHE_DIRNAME, ttl=web_cache_ttl, offline=offline)
         self.web_content = {}  # source_name -> content
 
+        # Per-file extraction cache; only new or changed files are re-extracted
+        self.extraction_cache = ExtractionCache(self.audit_dir / ExtractionCache.FILENAME) if incremental else None
+        self.jobs = max(1, jobs)  # Processes used to extract new/changed files
+
+        self.snapshot = None  # DirectorySnapshot, taken by scan_files()
+        self.timings = {}     # build phase -> seconds
+
         # Storage for extracted data
         self.extracted = defaultdict(list)  # field -> [{value, source, line, confidence}]
         self.conflicts = []
         self.gaps = []
 
+    @classmethod
+    def extractor(cls, client_folder: str, additional_folders: List[str]) -> 'ProfileBuilder':
+        """A builder that only runs extract_from_file(), for extraction worker processes.
+
+        Skips __init__, so no audit folder is created, no cache is opened and
+        `additional_folders` are taken as already validated.
+        """
+        builder = cls.__new__(cls)
+        builder.client_folder = Path(client_folder)
+        builder.additional_folders = [Path(folder) for folder in additional_folders]
+        return builder
+
     def scan_files(self) -> List[Path]:
         """Find all processable files from client folder and additional folders.
 
         Scans the ENTIRE client folder recursively, not just notion_export.
-        Creates a complete file manifest to ensure nothing is missed.
+        The snapshot it takes (kept as self.snapshot) backs the file manifest,
+        so nothing is missed and nothing is walked twice.
         """
-        # Supported extensions we can process
-        processable_extensions = {'.md', '.txt', '.csv', '.json'}
-
-        # Extensions we acknowledge but can't process (logged for transparency)
-        unprocessable_extensions = {'.pdf', '.doc', '.docx', '.xlsx', '.xls', '.png', '.jpg', '.jpeg', '.gif', '.mp4', '.mov'}
-
-        files = []
-        skipped_files = []
-        unprocessable_files = []
-
-        # Skip patterns - folders/files to ignore
-        skip_patterns = {
-            '__pycache__', '.git', 'node_modules', '.DS_Store',
-            '_extraction_audit.md', '_conflicts.md', '_gaps.md',  # Skip our output files
-            '_file_manifest.md',  # Skip manifest output
-            '90_Archive',  # Skip archived files - outdated data
-        }
-
-        # Scan ENTIRE client folder (not just notion_export)
-        all_files_found = []
-        if self.client_folder.exists():
-            for f in self.client_folder.rglob('*'):
-                if f.is_file():
-                    all_files_found.append(f)
-
-        # Scan additional folders
-        for folder in self.additional_folders:
-            for f in folder.rglob('*'):
-                if f.is_file() and f not in all_files_found:
-                    all_files_found.append(f)
-
-        # Categorize all files
-        for f in all_files_found:
-            # Check if should skip
-            if any(skip in str(f) for skip in skip_patterns):
-                skipped_files.append((f, 'system/output file'))
-                continue
-
-            ext = f.suffix.lower()
-
-            if ext in processable_extensions:
-                files.append(f)
-            elif ext in unprocessable_extensions:
-                unprocessable_files.append((f, f'format not supported ({ext})'))
-            elif ext:
-                skipped_files.append((f, f'unknown extension ({ext})'))
-            else:
-                skipped_files.append((f, 'no extension'))
-
-        # Store for manifest generation
-        self.file_manifest = {
-            'total_found': len(all_files_found),
-            'processable': files,
-            'unprocessable': unprocessable_files,
-            'skipped': skipped_files,
-        }
-
-        return sorted(files)
+        self.snapshot = DirectorySnapshot([self.client_folder] + self.additional_folders)
+        return self.snapshot.files
 
     def _generate_file_manifest(self):
         """Generate a manifest of ALL files found - nothing missed."""
@@ -468,10 +1258,11 @@ This manifest shows EVERY file found in the client folder to ensure nothing is m
 
 | Category | Count |
 |----------|-------|
-| **Total Files Found** | {self.file_manifest['total_found']} |
-| **Files Processed** | {len(self.file_manifest['processable'])} |
-| **Unprocessable (need manual review)** | {len(self.file_manifest['unprocessable'])} |
-| **Skipped (system files)** | {len(self.file_manifest['skipped'])} |
+| **Total Files Found** | {self.snapshot.total_found} |
+| **Files Processed** | {len(self.snapshot.processable)} |
+| **Unprocessable (need manual review)** | {len(self.snapshot.unprocessable)} |
+| **Skipped (system files)** | {len(self.snapshot.skipped)} |
+| **Skipped folders (not scanned)** | {len(self.snapshot.pruned)} |
 
 ---
 
@@ -480,7 +1271,7 @@ This manifest shows EVERY file found in the client folder to ensure nothing is m
 These files were successfully scanned for client data:
 
 """
-        for f in self.file_manifest['processable']:
+        for f in self.snapshot.processable:
             rel = self._get_relative_path(f)
             manifest += f"- `{rel}`\n"
 
@@ -493,8 +1284,8 @@ These files were successfully scanned for client data:
 These files exist but couldn't be processed automatically. **Review them manually** to ensure no data is missed:
 
 """
-        if self.file_manifest['unprocessable']:
-            for f, reason in self.file_manifest['unprocessable']:
+        if self.snapshot.unprocessable:
+            for f, reason in self.snapshot.unprocessable:
                 rel = self._get_relative_path(f)
                 manifest += f"- [ ] `{rel}` - {reason}\n"
         else:
@@ -509,10 +1300,13 @@ These files exist but couldn't be processed automatically. **Review them manuall
 These files were intentionally skipped (system files, output files, etc.):
 
 """
-        if self.file_manifest['skipped']:
-            for f, reason in self.file_manifest['skipped']:
+        if self.snapshot.skipped or self.snapshot.pruned:
+            for f, reason in self.snapshot.skipped:
                 rel = self._get_relative_path(f)
                 manifest += f"- `{rel}` - {reason}\n"
+            for d in self.snapshot.pruned:
+                rel = self._get_relative_path(d)
+                manifest += f"- `{rel}/` - system/archive folder (not scanned)\n"
         else:
             manifest += "*None*\n"
 
@@ -538,36 +1332,50 @@ These files were intentionally skipped (system files, output files, etc.):
         return filepath.name
 
     def fetch_web_content(self):
-        """Fetch content from provided URLs."""
+        """Fetch content from provided URLs.
+
+        Every page of every URL is fetched in one concurrent batch, bounded
+        by `fetch_deadline`; results are kept in the order the URLs were given.
+        """
         if not self.urls:
             return
 
         print("")
         print("🌐 Fetching web content...")
 
-        fetcher = WebFetcher()
+        fetcher = WebFetcher(deadline=self.fetch_deadline, cache=self.web_cache)
 
+        plan = []  # (source_name, url, website page name or None)
         for url in self.urls:
             # Determine URL type
             if 'facebook.com' in url or 'fb.com' in url:
-                source_name = '[web:facebook]'
-                content = fetcher.fetch_url(url)
+                plan.append(('[web:facebook]', url, None))
             elif 'instagram.com' in url:
-                source_name = '[web:instagram]'
-                content = fetcher.fetch_url(url)
+                plan.append(('[web:instagram]', url, None))
             elif 'linkedin.com' in url:
-                source_name = '[web:linkedin]'
-                content = fetcher.fetch_url(url)
+                plan.append(('[web:linkedin]', url, None))
             elif 'google.com/maps' in url or 'goo.gl' in url:
-                source_name = '[web:gbp]'
-                content = fetcher.fetch_url(url)
+                plan.append(('[web:gbp]', url, None))
             else:
                 # Assume it's the main website - fetch multiple pages
-                pages = fetcher.fetch_website(url)
-                self.web_content.update(pages)
-                continue
+                pages = fetcher.website_pages(url)
+                print(f"  🌐 Fetching: {pages['home']}")
+                plan.extend((f"[web:{name}]", page_url, name) for name, page_url in pages.items())
 
-            if content:
+        try:
+            fetched = fetcher.fetch_many([url for _, url, _ in plan])
+        finally:
+            fetcher.close()
+            if self.web_cache:
+                self.web_cache.save()
+
+        for source_name, url, page_name in plan:
+            content = fetched.get(url)
+            if page_name:
+                if content and len(content) > 100:
+                    self.web_content[source_name] = content
+                    print(f"     ✓ {page_name}")
+            elif content:
                 self.web_content[source_name] = content
                 print(f"  ✓ {source_name}")
 
@@ -576,22 +1384,16 @@ These files were intentionally skipped (system files, output files, etc.):
         extractions = defaultdict(list)
 
         # Apply all extraction patterns
-        for field, patterns in self.EXTRACTION_PATTERNS.items():
-            for pattern in patterns:
-                try:
-                    matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-                    for match in matches:
-                        value = match.group(1).strip()
-                        if len(value) >= 3:
-                            extractions[field].append({
-                                'value': value,
-                                'source': source,
-                                'line': 0,  # No line numbers for web
-                                'pattern': pattern[:30] + '...',
-                                'confidence': self._calculate_confidence(field, value) * 0.9  # Slightly lower confidence for web
-                            })
-                except re.error:
-                    continue
+        for field, pattern, match in self.extraction_engine().finditer(content):
+            value = match.group(1).strip()
+            if len(value) >= 3:
+                extractions[field].append({
+                    'value': value,
+                    'source': source,
+                    'line': 0,  # No line numbers for web
+                    'pattern': pattern[:30] + '...',
+                    'confidence': self._calculate_confidence(field, value) * 0.9  # Slightly lower confidence for web
+                })
 
         # Also extract section-style content
         self._extract_sections(content, source, extractions)
@@ -609,33 +1411,43 @@ These files were intentionally skipped (system files, output files, etc.):
 
         rel_path = self._get_relative_path(filepath)
         extractions = defaultdict(list)
+        lines = LineIndex(content)
 
         # Apply all extraction patterns
-        for field, patterns in self.EXTRACTION_PATTERNS.items():
-            for pattern in patterns:
-                try:
-                    matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-                    for match in matches:
-                        value = match.group(1).strip()
-                        if len(value) >= 3:  # Minimum viable data
-                            # Calculate line number
-                            line_num = content[:match.start()].count('\n') + 1
-
-                            extractions[field].append({
-                                'value': value,
-                                'source': rel_path,
-                                'line': line_num,
-                                'pattern': pattern[:30] + '...',
-                                'confidence': self._calculate_confidence(field, value)
-                            })
-                except re.error:
-                    continue
+        for field, pattern, match in self.extraction_engine().finditer(content):
+            value = match.group(1).strip()
+            if len(value) >= 3:  # Minimum viable data
+                line_num = lines.line_of(match.start())
+
+                extractions[field].append({
+                    'value': value,
+                    'source': rel_path,
+                    'line': line_num,
+                    'pattern': pattern[:30] + '...',
+                    'confidence': self._calculate_confidence(field, value)
+                })
 
         # Also extract structured sections (headers with content)
-        self._extract_sections(content, rel_path, extractions)
+        self._extract_sections(content, rel_path, extractions, lines)
 
         return extractions
 
+    def _extract_files(self, files: List[Path]):
+        """Yield extract_from_file() results for `files`, in order.
+
+        With jobs > 1 the files are spread over a process pool; results are
+        still yielded in the order given.
+        """
+        jobs = min(self.jobs, len(files))
+        if jobs <= 1:
+            for filepath in files:
+                yield self.extract_from_file(filepath)
+            return
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_extract_worker,
+                                 initargs=(str(self.client_folder), [str(f) for f in self.additional_folders])) as pool:
+            yield from pool.map(_extract_in_worker, files, chunksize=max(1, len(files) // (jobs * 4)))
+
     def _calculate_confidence(self, field: str, value: str) -> float:
         """Score confidence of extraction (0-1)."""
         confidence = 0.5
@@ -654,87 +1466,29 @@ These files were intentionally skipped (system files, output files, etc.):
 
         return min(confidence, 1.0)
 
-    def _extract_sections(self, content: str, source: str, extractions: dict):
-        """Extract content under specific headers."""
-        section_mappings = {
-            # Section 3: Target Audience
-            r'##?\s*(?:target\s*)?audience': 'target_audience_section',
-            r'##?\s*(?:ideal\s*customer|icp)': 'target_audience_section',
-            r'##?\s*customer\s*(?:segments?|personas?)': 'customer_segments_section',
-            r'##?\s*customer\s*journey': 'customer_journey_section',
-            r'##?\s*(?:pain\s*points?|objections?)': 'objections_section',
-            # Section 4: Brand Voice
-            r'##?\s*brand\s*(?:voice|tone|personality)': 'brand_voice_section',
-            r'##?\s*(?:messaging|taglines?)': 'brand_voice_section',
-            # Section 5: Products & Services
-            r'##?\s*(?:products?|services?|offerings?)': 'products_section',
-            r'##?\s*(?:what\s*we\s*(?:do|offer)|our\s*services)': 'products_section',
-            # Section 6: Content Pillars
-            r'##?\s*content\s*pillars?': 'content_pillars_section',
-            r'##?\s*content\s*(?:strategy|themes?)': 'content_pillars_section',
-            # Section 7: SOW/Deliverables
-            r'##?\s*(?:sow|scope|deliverables)': 'sow_section',
-            r'##?\s*(?:contract|agreement|services\s*included)': 'sow_section',
-            # Section 8: KPIs & Goals
-            r'##?\s*(?:kpis?|goals?|metrics?|objectives?)': 'kpis_section',
-            r'##?\s*(?:targets?|benchmarks?)': 'kpis_section',
-            # Section 9: Competitors
-            r'##?\s*competitors?': 'competitors_section',
-            r'##?\s*(?:competitive\s*analysis|landscape)': 'competitors_section',
-            # Section 10: Seasonality
-            r'##?\s*(?:seasonality|calendar|events?)': 'seasonality_section',
-            r'##?\s*(?:key\s*dates?|holidays?|blackout)': 'seasonality_section',
-            # Section 11: Visual Brand
-            r'##?\s*(?:visual|brand)\s*(?:guidelines?|identity|assets?)': 'visual_brand_section',
-            r'##?\s*(?:colors?|typography|fonts?)': 'visual_brand_section',
-            # Section 12: Account Access
-            r'##?\s*(?:account\s*access|credentials?|logins?)': 'account_access_section',
-            r'##?\s*(?:social\s*(?:media\s*)?accounts?|platforms?)': 'account_access_section',
-            # Section 13: Guidelines & Constraints
-            r'##?\s*(?:guidelines?|constraints?|rules?)': 'guidelines_section',
-            r'##?\s*(?:approval|legal|compliance)': 'guidelines_section',
-            r'##?\s*(?:do\s*not|avoid|prohibited)': 'guidelines_section',
-            # Section 14: Business Model & Revenue
-            r'##?\s*(?:business\s*model|revenue|how.*make\s*money)': 'business_model_section',
-            r'##?\s*(?:lead\s*sources?|where.*leads?\s*come)': 'lead_sources_section',
-            r'##?\s*(?:pricing|price\s*points?)': 'pricing_section',
-            # Section 15: Origin Story
-            r'##?\s*(?:origin|founder|our\s*story|about\s*us)': 'origin_story_section',
-            r'##?\s*(?:history|milestones?|timeline)': 'milestones_section',
-            r'##?\s*(?:mission|vision|why\s*we)': 'mission_section',
-            # Section 16: Local Presence & Reputation
-            r'##?\s*(?:reviews?|reputation|ratings?)': 'reviews_section',
-            r'##?\s*(?:community|local\s*(?:presence|involvement))': 'community_section',
-            r'##?\s*(?:partnerships?|sponsors?)': 'partnerships_section',
-            # Section 17: Marketing History
-            r'##?\s*(?:marketing\s*history|past\s*marketing|previous)': 'marketing_history_section',
-            r'##?\s*(?:what.*worked|successes?)': 'what_worked_section',
-            r'##?\s*(?:what.*(?:failed|flopped)|lessons?\s*learned)': 'what_flopped_section',
-            # Section 18: Content Bank & Assets
-            r'##?\s*(?:content\s*(?:bank|library|assets?)|assets?)': 'content_bank_section',
-            r'##?\s*(?:photos?|images?|video)': 'media_assets_section',
-            r'##?\s*(?:testimonials?|case\s*stud)': 'testimonials_section',
-            r'##?\s*(?:faqs?|frequently\s*asked|common\s*questions?)': 'faq_section',
-            # Section 19: Email & CRM
-            r'##?\s*(?:email\s*(?:marketing)?|newsletter)': 'email_section',
-            r'##?\s*(?:crm|customer\s*relationship|lead\s*management)': 'crm_section',
-            # Section 20: Relationship Notes
-            r'##?\s*(?:relationship|client\s*(?:notes?|preferences?))': 'relationship_section',
-            r'##?\s*(?:communication|contact\s*preferences?)': 'communication_section',
-            r'##?\s*(?:working\s*style|how\s*to\s*work)': 'working_style_section',
-        }
+    def _extract_sections(self, content: str, source: str, extractions: dict, lines: LineIndex = None):
+        """Extract content under specific headers.
 
-        for pattern, field in section_mappings.items():
-            match = re.search(
-                f'({pattern}[^\n]*\n)(.*?)(?=\n##|\n#|\\Z)',
-                content,
-                re.IGNORECASE | re.DOTALL
-            )
-            if match:
-                header = match.group(1).strip()
-                section_content = match.group(2).strip()
-                if len(section_content) > 20:
-                    line_num = content[:match.start()].count('\n') + 1
+        The document is split into header/body blocks in one pass; each
+        header is classified against SECTION_RULES, so every matching
+        section is captured, not just the first one per header pattern.
+        """
+        lines = lines or LineIndex(content)
+        headers = list(self.HEADER_LINE.finditer(content))
+
+        for i, match in enumerate(headers):
+            title = match.group(1)
+            fields = dict.fromkeys(field for rule, field in self.SECTION_RULES if rule.match(title))
+            if not fields:
+                continue
+
+            # Body runs until the next header line (any level)
+            body_end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+            section_content = content[match.end():body_end].strip()
+            if len(section_content) > 20:
+                header = match.group(0).strip()
+                line_num = lines.line_of(match.start())
+                for field in fields:
                     extractions[field].append({
                         'value': section_content[:2000],  # Cap at 2000 chars
                         'source': source,
@@ -744,27 +1498,52 @@ These files were intentionally skipped (system files, output files, etc.):
                     })
 
     def consolidate(self):
-        """Merge extracted data, handling duplicates and conflicts."""
+        """Merge extracted data, handling duplicates and conflicts.
+
+        Candidates are ranked by confidence, then by recency of their source
+        (newest file mtime first; web pages count as fetched now), then by
+        path. Near-duplicate values are grouped by ValueClusterer, and a field
+        is only reported as a conflict when its candidates fall into more
+        than one group.
+        """
         consolidated = {}
+        clusterer = ValueClusterer()
+        fetched_at = time.time()
+        mtimes = {}
+        if self.snapshot:
+            mtimes = {self._get_relative_path(f): st.st_mtime for f, st in self.snapshot.stats.items()}
+
+        # Rank by confidence, then by recency (newer files first)
+        rank = lambda x: (-x['confidence'], -mtimes.get(x['source'], fetched_at), x['source'])
 
         for field, items in self.extracted.items():
             if not items:
                 self.gaps.append(field)
                 continue
 
-            # Sort by confidence, then by recency (newer files first)
-            sorted_items = sorted(items, key=lambda x: (-x['confidence'], x['source']))
-
-            # Check for conflicts (significantly different values)
-            unique_values = list(set(item['value'][:100].lower() for item in items))
-            if len(unique_values) > 1 and len(items) > 1:
+            # Normalize and cluster each distinct value once, then group near-duplicates
+            by_value = defaultdict(list)
+            for item in items:
+                by_value[item['value']].append(item)
+            clusters = clusterer.cluster([clusterer.normalize(value) for value in by_value])
+            groups = defaultdict(list)
+            for same_value, cluster in zip(by_value.values(), clusters):
+                groups[cluster].extend(same_value)
+            ranked = sorted(((min(group, key=rank), group) for group in groups.values()),
+                            key=lambda pair: rank(pair[0]))
+
+            # Several groups means a real conflict
+            if len(ranked) > 1:
                 self.conflicts.append({
                     'field': field,
-                    'values': [{'value': i['value'][:200], 'source': i['source']} for i in items[:5]]
+                    'values': [{'value': top['value'][:200], 'source': top['source'],
+                                'also_in': len({i['source'] for i in group} - {top['source']})}
+                               for top, group in ranked[:5]],
+                    'distinct': len(ranked),
                 })
 
-            # Take highest confidence value
-            best = sorted_items[0]
+            # Take highest-ranked value
+            best = ranked[0][0]
             consolidated[field] = {
                 'value': best['value'],
                 'source': best['source'],
@@ -774,9 +1553,20 @@ These files were intentionally skipped (system files, output files, etc.):
 
         return consolidated
 
+    @contextmanager
+    def _phase(self, name: str):
+        """Time one build phase into self.timings."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
     def build(self) -> dict:
         """Run full extraction and consolidation pipeline."""
-        files = self.scan_files()
+        self.timings = {}
+        with self._phase('scan'):
+            files = self.scan_files()
 
         if not files and not self.urls:
             print(f"❌ No files found and no URLs provided")
@@ -785,49 +1575,70 @@ These files were intentionally skipped (system files, output files, etc.):
             return None
 
         # Show what we're scanning
-        source_count = len([f for f in files if self.source_dir.exists() and str(f).startswith(str(self.source_dir))])
-        additional_count = len(files) - source_count
+        source_count = self.snapshot.count_under(self.source_dir)
 
         print(f"📂 Processing {len(files)} files + {len(self.urls)} URLs:")
         if self.source_dir.exists() and source_count > 0:
             print(f"   • notion_export/: {source_count} files")
         if self.additional_folders:
             for folder in self.additional_folders:
-                folder_count = len([f for f in files if str(f).startswith(str(folder))])
-                print(f"   • {folder.name}/: {folder_count} files")
+                print(f"   • {folder.name}/: {self.snapshot.count_under(folder)} files")
         if self.urls:
             print(f"   • web URLs: {len(self.urls)}")
         print("=" * 60)
 
-        # Extract from all files
-        for filepath in files:
-            rel = self._get_relative_path(filepath)
-            print(f"  📄 {rel}")
-            file_extractions = self.extract_from_file(filepath)
-
-            for field, items in file_extractions.items():
-                self.extracted[field].extend(items)
+        # Extract from all files (unchanged ones come from the extraction cache)
+        cache = self.extraction_cache
+        with self._phase('extract'):
+            cached = {}
+            if cache:
+                for filepath in files:
+                    hit = cache.lookup(filepath, self._get_relative_path(filepath), self.snapshot.stats.get(filepath))
+                    if hit is not None:
+                        cached[filepath] = hit
+            # closing() shuts the worker pool down here, even if merging fails
+            with closing(self._extract_files([f for f in files if f not in cached])) as fresh:
+                # Merge in path order, so the output is the same for any --jobs
+                for filepath in files:
+                    rel = self._get_relative_path(filepath)
+                    file_extractions = cached.get(filepath)
+                    if file_extractions is None:
+                        print(f"  📄 {rel}")
+                        file_extractions = next(fresh)
+                        if cache:
+                            cache.record(filepath, rel, file_extractions)
+
+                    for field, items in file_extractions.items():
+                        self.extracted[field].extend(items)
+
+            if cache:
+                cache.save(files)
+                if cache.hits:
+                    print(f"  ♻️  Reused {cache.hits} unchanged files, extracted {cache.misses}")
 
         # Fetch and extract from web content
-        self.fetch_web_content()
-        if self.web_content:
-            print("")
-            print("📊 Extracting from web pages...")
-            for source, content in self.web_content.items():
-                print(f"  🌐 {source}")
-                web_extractions = self.extract_from_web_content(source, content)
-                for field, items in web_extractions.items():
-                    self.extracted[field].extend(items)
+        with self._phase('web'):
+            self.fetch_web_content()
+            if self.web_content:
+                print("")
+                print("📊 Extracting from web pages...")
+                for source, content in self.web_content.items():
+                    print(f"  🌐 {source}")
+                    web_extractions = self.extract_from_web_content(source, content)
+                    for field, items in web_extractions.items():
+                        self.extracted[field].extend(items)
 
         # Consolidate
-        consolidated = self.consolidate()
+        with self._phase('consolidate'):
+            consolidated = self.consolidate()
 
         # Generate outputs
-        self._generate_profile(consolidated)
-        self._generate_extraction_audit(consolidated)
-        self._generate_conflicts_report()
-        self._generate_gaps_report()
-        self._generate_file_manifest()
+        with self._phase('write'):
+            self._generate_profile(consolidated)
+            self._generate_extraction_audit(consolidated)
+            self._generate_conflicts_report()
+            self._generate_gaps_report()
+            self._generate_file_manifest()
 
         print("\n" + "=" * 60)
         print("✅ PROFILE BUILD COMPLETE")
@@ -838,8 +1649,10 @@ These files were intentionally skipped (system files, output files, etc.):
             print(f"   ⚠️  Conflicts: {self.audit_dir}/_conflicts.md ({len(self.conflicts)} items)")
         if self.gaps:
             print(f"   ❓ Gaps: {self.audit_dir}/_gaps.md ({len(self.gaps)} fields)")
-        if self.file_manifest['unprocessable']:
-            print(f"   ⚠️  REVIEW MANUALLY: {len(self.file_manifest['unprocessable'])} files couldn't be auto-processed")
+        if self.snapshot.unprocessable:
+            print(f"   ⚠️  REVIEW MANUALLY: {len(self.snapshot.unprocessable)} files couldn't be auto-processed")
+        total = sum(self.timings.values())
+        print(f"   ⏱️  {total:.2f}s: " + ", ".join(f"{name} {secs:.2f}s" for name, secs in self.timings.items()))
 
         return consolidated
 
@@ -1286,7 +2099,7 @@ These files were intentionally skipped (system files, output files, etc.):
 
 | Metric | Value |
 |--------|-------|
-| Files Processed | {len(self.scan_files())} |
+| Files Processed | {len(self.snapshot.files)} |
 | Fields Extracted | {len(data)} |
 | Conflicts Detected | {len(self.conflicts)} |
 | Gaps Remaining | {len(self.gaps)} |
@@ -1306,7 +2119,7 @@ These files were intentionally skipped (system files, output files, etc.):
         audit = f"""# Extraction Audit Report
 **Client:** {self.client_name}
 **Generated:** {datetime.now().isoformat()}
-**Files Processed:** {len(self.scan_files())}
+**Files Processed:** {len(self.snapshot.files)}
 
 ---
 
@@ -1347,6 +2160,7 @@ These files were intentionally skipped (system files, output files, etc.):
 **Generated:** {datetime.now().isoformat()}
 
 These fields have conflicting values from different sources. Please review and resolve.
+Near-identical values are grouped into one option, ranked by confidence and source recency.
 
 ---
 
@@ -1354,8 +2168,11 @@ These fields have conflicting values from different sources. Please review and r
         for conflict in self.conflicts:
             report += f"## {conflict['field']}\n\n"
             for i, item in enumerate(conflict['values'], 1):
-                report += f"**Option {i}** (from `{item['source']}`):\n"
+                also = f", same value in {item['also_in']} other source(s)" if item['also_in'] else ""
+                report += f"**Option {i}** (from `{item['source']}`{also}):\n"
                 report += f"```\n{item['value']}\n```\n\n"
+            if conflict['distinct'] > len(conflict['values']):
+                report += f"*... and {conflict['distinct'] - len(conflict['values'])} more distinct values*\n\n"
             report += "---\n\n"
 
         with open(self.audit_dir / "_conflicts.md", 'w') as f:
@@ -1397,6 +2214,19 @@ Please add this information manually to the client profile.
             f.write(report)
 
 
+# Builder used by extraction worker processes, set up by _init_extract_worker()
+_worker = {}
+
+
+def _init_extract_worker(client_folder: str, additional_folders: List[str]):
+    _worker['builder'] = ProfileBuilder.extractor(client_folder, additional_folders)
+    ProfileBuilder.extraction_engine()  # Compile the patterns once, before the first file
+
+
+def _extract_in_worker(filepath: Path) -> Dict[str, List[dict]]:
+    return dict(_worker['builder'].extract_from_file(filepath))
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Build client profile from Notion exports + web")
     parser.add_argument('--client-folder', required=True, help="Path to client folder")
@@ -1404,7 +2234,22 @@ if __name__ == "__main__":
                         help="Additional folders to scan (beyond notion_export)")
     parser.add_argument('--urls', nargs='*', default=[],
                         help="URLs to fetch (client website, social profiles, GBP)")
+    parser.add_argument('--fetch-deadline', type=float, default=WebFetcher.DEADLINE,
+                        help="Seconds allowed for fetching all URLs (fetched concurrently; default: %(default)s)")
+    parser.add_argument('--web-cache-ttl', type=float, default=WebCache.TTL / 3600,
+                        help="Hours before cached pages are revalidated with the server (default: %(default)s)")
+    parser.add_argument('--no-web-cache', action='store_true',
+                        help="Always re-download web pages and don't update the cache")
+    parser.add_argument('--offline', action='store_true',
+                        help="Serve web pages from the cache only; never touch the network")
+    parser.add_argument('--full-rebuild', action='store_true',
+                        help="Re-extract every file instead of reusing results for unchanged ones")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="Processes used to extract files (0 = one per CPU; default: %(default)s)")
     args = parser.parse_args()
 
-    builder = ProfileBuilder(args.client_folder, args.additional_folders, args.urls)
+    builder = ProfileBuilder(args.client_folder, args.additional_folders, args.urls, args.fetch_deadline,
+                             web_cache=not args.no_web_cache, web_cache_ttl=args.web_cache_ttl * 3600,
+                             offline=args.offline, incremental=not args.full_rebuild,
+                             jobs=args.jobs or os.cpu_count() or 1)
     builder.build()
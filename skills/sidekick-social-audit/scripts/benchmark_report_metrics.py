@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Report Metrics Benchmark - Sidekick Social Audit
+Checks that Analyzer's single-pass groupby sections produce exactly the
+metrics JSON of the original filter-per-group implementation, and times both.
+
+Synthetic posts datasets are written to a temp folder: one spanning more than
+two years (YoY branch) and one under two years (first/second half branch),
+with many platforms, mixed post types and missing values.
+
+Usage:
+    python benchmark_report_metrics.py
+    python benchmark_report_metrics.py --posts 200000 --platforms 12 --repeat 3
+"""
+import argparse
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from generate_report_metrics import Analyzer, pd
+from posts_io import read_posts_frame
+
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class FilterPerGroupAnalyzer(Analyzer):
+    """The original Analyzer.analyze: one boolean filter per platform, format and YoY half.
+
+    Kept verbatim as the reference the groupby version must match.
+    """
+
+    def analyze(self, input_path, output_path):
+        df = read_posts_frame(input_path, ['date', 'platform', 'engagement_rate', 'post_type', 'likes', 'comments', 'shares'])
+        if df.empty: return
+        df['date'] = pd.to_datetime(df['date'])
+        df = df.sort_values('date')
+
+        # 1. Macro & YoY
+        total_days = (df['date'].max() - df['date'].min()).days
+        if total_days >= 730:
+            last_year = df[df['date'] > (df['date'].max() - pd.Timedelta(days=365))]['engagement_rate'].mean()
+            prev_year = df[df['date'] <= (df['date'].max() - pd.Timedelta(days=365))]['engagement_rate'].mean()
+            yoy = ((last_year - prev_year)/prev_year)*100 if prev_year > 0 else 0
+            yoy_str = f"{yoy:+.1f}% vs previous year"
+        else:
+            mid = df['date'].min() + (df['date'].max() - df['date'].min())/2
+            first = df[df['date'] < mid]['engagement_rate'].mean()
+            second = df[df['date'] >= mid]['engagement_rate'].mean()
+            yoy = ((second - first)/first)*100 if first > 0 else 0
+            yoy_str = f"{yoy:+.1f}% (first half vs second half)"
+
+        # 2. Seasonality
+        df['month'] = df['date'].dt.month_name()
+        monthly = df.groupby('month')['engagement_rate'].mean().sort_values(ascending=False)
+        peak = ", ".join(monthly.head(3).index) if len(monthly) >= 6 else "Insufficient data"
+        valley = ", ".join(monthly.tail(3).index) if len(monthly) >= 6 else "Insufficient data"
+
+        # 3. Platforms
+        platforms = []
+        for p in df['platform'].unique():
+            pdf = df[df['platform']==p]
+            avg = pdf['engagement_rate'].mean() if 'engagement_rate' in pdf else 0
+            target = self.benchmarks.get(p, {}).get('healthy_min', 2.0)
+            rec = "Scale up" if avg >= target else "Review strategy"
+            platforms.append({'platform':p, 'volume':len(pdf), 'avg_engagement':round(avg,2), 'recommendation':rec})
+
+        # 4. Formats
+        def get_fmt(pt):
+            s = str(pt).lower()
+            return 'Carousel' if 'carousel' in s else ('Reel' if 'reel' in s else 'Static')
+        if 'post_type' in df.columns:
+            df['fmt'] = df['post_type'].apply(get_fmt)
+        else:
+            df['fmt'] = 'Static'  # Default if no post_type column
+        formats = []
+        for f in ['Static','Carousel','Reel']:
+            fdf = df[df['fmt']==f]
+            if len(fdf)>0:
+                formats.append({'format':f, 'avg_engagement':round(fdf['engagement_rate'].mean(),2), 'percent_of_feed':round(len(fdf)/len(df)*100,1), 'verdict': "Keep" if fdf['engagement_rate'].mean() > 2 else "Improve"})
+
+        # 5. Hall of Fame
+        df['total_interact'] = df['likes'].fillna(0) + df['comments'].fillna(0) + df['shares'].fillna(0)
+        hof = []
+        for _, r in df.nlargest(5, 'total_interact').iterrows():
+            hof.append({
+                'date': r['date'].strftime('%Y-%m-%d'),
+                'metrics': f"{int(r['total_interact'])} interactions",
+                'format': r['fmt'],
+                'why_legendary': f"High engagement ({r['engagement_rate']}%)",
+                'reboot_action': f"Recreate this {r['fmt']}"
+            })
+
+        # 6. Red Flags
+        red_flags = []
+        fmt_dict = {f['format']:f for f in formats}
+        if 'Carousel' in fmt_dict and 'Static' in fmt_dict:
+            if fmt_dict['Carousel']['avg_engagement'] > fmt_dict['Static']['avg_engagement']:
+                if fmt_dict['Carousel']['percent_of_feed'] < 25:
+                    red_flags.append({'name':'Format Misallocation', 'fix':'Increase Carousel output'})
+
+        while len(red_flags) < 2: red_flags.append({'name':'Monitoring', 'fix':'Continue current strategy'})
+
+        # Output
+        metrics = {
+            'meta': {'start_date': str(df['date'].min().date()), 'end_date': str(df['date'].max().date()), 'total_months': round(total_days/30, 1)},
+            'macro': {'growth_status': "Trending Up" if yoy > 0 else "Trending Down", 'yoy_delta': f"{yoy:.1f}%", 'yoy_comparison': yoy_str, 'trajectory_analysis': f"Growth is {yoy:.1f}%"},
+            'seasonality': {'peak_months': peak, 'valley_months': valley, 'implications': "Align calendar with peaks"},
+            'mechanics': {'platforms': platforms, 'formats': formats},
+            'hall_of_fame': hof,
+            'red_flags': red_flags,
+            'strategic_pivot': {'diagnosis': 'Review format mix', 'core_strategy': 'Double down on top formats'}
+        }
+
+        with open(output_path, 'w') as f: json.dump(metrics, f, indent=2, default=str)
+
+
+def synthetic_posts(n, num_platforms, days, seed):
+    """`n` posts over `days` days with mixed platforms, post types and gaps."""
+    rng = random.Random(seed)
+    platforms = ['instagram', 'facebook', 'google_business_profile'] + [f'channel_{i}' for i in range(max(0, num_platforms - 3))]
+    post_types = ['Carousel', 'IG carousel', 'Reel', 'REELS', 'Image', 'Photo', 'Link', '', None]
+    start = datetime(2022, 1, 1)
+    posts = []
+    for i in range(n):
+        likes = rng.randint(0, 500)
+        posts.append({
+            'date': (start + timedelta(days=rng.randrange(days), minutes=rng.randrange(1440))).isoformat(),
+            'platform': rng.choice(platforms[:num_platforms]),
+            'post_type': rng.choice(post_types),
+            'likes': likes if rng.random() > 0.02 else None,
+            'comments': rng.randint(0, 60),
+            'shares': rng.randint(0, 30),
+            'engagement_rate': round(rng.uniform(0, 8), 2) if rng.random() > 0.01 else None,
+        })
+    return {'posts': posts}
+
+
+def timed(analyzer, input_path, output_path, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        analyzer.analyze(input_path, output_path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(posts, num_platforms, repeat, seed=7):
+    """Compare both implementations on each dataset; returns True if all outputs match."""
+    logging.getLogger('generate_report_metrics').setLevel(logging.WARNING)
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for label, days in [('3-year span (YoY)', 3 * 365), ('1-year span (halves)', 365)]:
+            input_path = tmp / f'posts_{days}.json'
+            with open(input_path, 'w') as f:
+                json.dump(synthetic_posts(posts, num_platforms, days, seed), f)
+
+            old_out, new_out = tmp / 'old.json', tmp / 'new.json'
+            old = timed(FilterPerGroupAnalyzer(), input_path, old_out, repeat)
+            new = timed(Analyzer(), input_path, new_out, repeat)
+            same = old_out.read_text() == new_out.read_text()
+            ok &= same
+            logger.info(f"{'✅' if same else '❌'} {label}: {posts:,} posts, {num_platforms} platforms - "
+                        f"filter-per-group {old:.3f}s, groupby {new:.3f}s ({old / new:.1f}x)"
+                        + ("" if same else " - metrics JSON differs"))
+    return ok
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare the groupby Analyzer with the filter-per-group original')
+    parser.add_argument('--posts', type=int, default=50000, help='Posts per synthetic dataset (default: %(default)s)')
+    parser.add_argument('--platforms', type=int, default=8, help='Distinct platforms (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per implementation; the best is reported (default: %(default)s)')
+    args = parser.parse_args()
+
+    sys.exit(0 if run(args.posts, args.platforms, args.repeat) else 1)
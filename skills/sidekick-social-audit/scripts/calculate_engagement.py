@@ -2,64 +2,220 @@
 """
 Calculate engagement rates for social media posts.
 Formula: (likes + comments + shares) / reach * 100
+
+Rates are computed a whole batch at a time with NumPy/pandas when available
+(pure-Python fallback otherwise). JSONL datasets are always streamed; with
+--chunk-size, columnar datasets (.parquet/.arrow) are too.
 """
-import argparse, json, sys, logging
+import argparse, sys, logging
+from itertools import chain
 from pathlib import Path
 
+from posts_io import (read_dataset, write_dataset, is_columnar, detect_format, iter_batches,
+                      iter_post_chunks, read_meta, write_posts, read_schema, count_rows,
+                      open_batch_writer)
+
+# Try importing numpy/pandas for the vectorized engine
+try:
+    import numpy as np
+    import pandas as pd
+    VECTOR_SUPPORT = True
+except ImportError:
+    VECTOR_SUPPORT = False
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
-def process(input_path, output_path):
+METRIC_FIELDS = ('likes', 'comments', 'shares', 'reach')
+DEFAULT_STREAM_CHUNK = 10000  # posts per batch when streaming JSONL
+
+def process(input_path, output_path, chunk_size=None):
     input_file = Path(input_path)
 
     if not input_file.exists():
         logger.error(f"Input file not found: {input_path}")
         sys.exit(1)
 
-    with open(input_file) as f:
-        data = json.load(f)
+    # Ensure output directory exists
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    if detect_format(input_file) == 'jsonl' and detect_format(output_file) == 'jsonl':
+        counts = _process_jsonl(input_file, output_file, chunk_size or DEFAULT_STREAM_CHUNK)
+    elif chunk_size and is_columnar(input_file) and is_columnar(output_file):
+        counts = _process_columnar(input_file, output_file, chunk_size)
+    else:
+        data = read_dataset(input_file)
+
+        if 'posts' not in data or not data['posts']:
+            logger.error("No posts found in input file")
+            sys.exit(1)
+
+        posts = data['posts']
+        step = chunk_size or len(posts)
+        counts = [0, 0, 0]
+        for start in range(0, len(posts), step):
+            batch = posts[start:start + step]
+            for i, n in enumerate(_enrich_posts(batch)):
+                counts[i] += n
+
+        write_dataset(output_file, data)
+
+    calculated, skipped, zero_reach = counts
+    logger.info(f"✅ Engagement calculated: {calculated} posts")
+    if skipped > 0:
+        logger.info(f"   Skipped (already had rate): {skipped}")
+    if zero_reach > 0:
+        logger.warning(f"   Zero reach (rate set to 0): {zero_reach}")
+
+def engagement_rates(columns):
+    """Compute rates for one batch given column sequences.
+
+    `columns` maps likes/comments/shares/reach/engagement_rate to equal-length
+    sequences (missing keys count as absent values). Returns (rates, keep,
+    has_reach): `keep` flags posts that already had a positive rate and must
+    be left alone; rates for the rest use Python's round(x, 2) semantics and
+    are 0.0 when reach is zero.
+    """
+    if not VECTOR_SUPPORT:
+        return _engagement_rates_python(columns)
+
+    size = max(len(v) for v in columns.values())
+    likes, comments, shares, reach = (
+        _to_int_array(columns[f]) if f in columns else np.zeros(size, dtype=np.int64)
+        for f in METRIC_FIELDS
+    )
+    existing = columns.get('engagement_rate')
+    if existing is None:
+        keep = np.zeros(size, dtype=bool)
+    else:
+        keep = (pd.to_numeric(pd.Series(existing, dtype=object), errors='coerce').fillna(0) > 0).to_numpy()
+
+    has_reach = reach > 0
+    total_interactions = likes + comments + shares
+    raw = np.where(has_reach, total_interactions / np.where(has_reach, reach, 1) * 100, 0.0)
+    return _round2(raw), keep, has_reach
 
-    if 'posts' not in data or not data['posts']:
+def _to_int_array(values):
+    """Vectorized _to_int: numbers truncate, strings drop commas, junk/None -> 0."""
+    s = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    num = pd.to_numeric(s, errors='coerce')
+    retry = num.isna() & s.notna()
+    if retry.any():
+        cleaned = s[retry].astype(str).str.replace(',', '', regex=False).str.strip().replace('', '0')
+        num = num.astype('float64')
+        num[retry] = pd.to_numeric(cleaned, errors='coerce')
+    arr = num.to_numpy(dtype='float64', na_value=0.0)
+    arr[~np.isfinite(arr)] = 0.0
+    return np.trunc(arr).astype(np.int64)
+
+def _round2(values):
+    """np.round(values, 2), corrected to Python round() where they can disagree.
+
+    np.round scales by 100 before rounding, which can flip results that sit
+    within float error of a half; those few elements are redone in Python.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_half):
+        rounded[i] = round(float(values[i]), 2)
+    return rounded
+
+def _engagement_rates_python(columns):
+    """Pure-Python engagement_rates() used when NumPy/pandas are unavailable."""
+    size = max(len(v) for v in columns.values())
+    get = lambda f: columns.get(f) or [None] * size
+    existing = get('engagement_rate')
+    rates, keep, has_reach = [], [], []
+    for i, (likes, comments, shares, reach) in enumerate(zip(*(get(f) for f in METRIC_FIELDS))):
+        rate = existing[i]
+        keep.append(bool(rate and rate > 0))
+        reach = _to_int(reach)
+        total_interactions = _to_int(likes) + _to_int(comments) + _to_int(shares)
+        has_reach.append(reach > 0)
+        rates.append(round((total_interactions / reach) * 100, 2) if reach > 0 else 0.0)
+    return rates, keep, has_reach
+
+def _enrich_posts(posts):
+    """Set engagement_rate on a batch of post dicts; returns (calculated, skipped, zero_reach)."""
+    fields = METRIC_FIELDS + ('engagement_rate',)
+    columns = {f: [post.get(f) for post in posts] for f in fields}
+    rates, keep, has_reach = engagement_rates(columns)
+    if VECTOR_SUPPORT:
+        rates = rates.tolist()
+
+    for post, rate, kept in zip(posts, rates, keep):
+        # Skip if already has valid engagement rate
+        if not kept:
+            post['engagement_rate'] = rate
+    return _tally(keep, has_reach)
+
+def _process_jsonl(input_file, output_file, chunk_size):
+    """Stream JSONL posts through in chunks; output lines are written as each chunk finishes."""
+    chunks = iter_post_chunks(input_file, chunk_size)
+    first = next(chunks, None)
+    if not first:
         logger.error("No posts found in input file")
         sys.exit(1)
 
-    calculated = 0
-    skipped = 0
-    zero_reach = 0
+    counts = [0, 0, 0]
 
-    for post in data['posts']:
-        # Skip if already has valid engagement rate
-        if post.get('engagement_rate') and post['engagement_rate'] > 0:
-            skipped += 1
-            continue
+    def enriched():
+        for batch in chain([first], chunks):
+            for i, n in enumerate(_enrich_posts(batch)):
+                counts[i] += n
+            yield from batch
 
-        # Safely get numeric values (handle None, strings, etc.)
-        likes = _to_int(post.get('likes', 0))
-        comments = _to_int(post.get('comments', 0))
-        shares = _to_int(post.get('shares', 0))
-        reach = _to_int(post.get('reach', 0))
+    write_posts(output_file, enriched(), read_meta(input_file))
+    return counts
 
-        total_interactions = likes + comments + shares
+def _process_columnar(input_file, output_file, chunk_size):
+    """Stream a .parquet/.arrow dataset through engagement_rates() batch by batch."""
+    import pyarrow as pa
 
-        if reach > 0:
-            post['engagement_rate'] = round((total_interactions / reach) * 100, 2)
-            calculated += 1
-        else:
-            post['engagement_rate'] = 0.0
-            zero_reach += 1
+    if not count_rows(input_file):
+        logger.error("No posts found in input file")
+        sys.exit(1)
 
-    # Ensure output directory exists
-    output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
+    schema = read_schema(input_file)
+    if schema.get_field_index('engagement_rate') < 0:
+        schema = schema.append(pa.field('engagement_rate', pa.float64()))
 
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
+    counts = [0, 0, 0]
+    with open_batch_writer(output_file, schema) as writer:
+        for batch in iter_batches(input_file, chunk_size):
+            columns = {f: _column(batch, f) for f in METRIC_FIELDS + ('engagement_rate',)
+                       if batch.schema.get_field_index(f) >= 0}
+            columns.setdefault('reach', [None] * batch.num_rows)
+            rates, keep, has_reach = engagement_rates(columns)
 
-    logger.info(f"✅ Engagement calculated: {calculated} posts")
-    if skipped > 0:
-        logger.info(f"   Skipped (already had rate): {skipped}")
-    if zero_reach > 0:
-        logger.warning(f"   Zero reach (rate set to 0): {zero_reach}")
+            existing = columns.get('engagement_rate', [None] * batch.num_rows)
+            if VECTOR_SUPPORT:
+                old = pd.to_numeric(pd.Series(existing, dtype=object), errors='coerce').to_numpy(dtype='float64')
+                merged = np.where(keep, old, rates)
+            else:
+                merged = [old if kept else rate for old, rate, kept in zip(existing, rates, keep)]
+            for i, n in enumerate(_tally(keep, has_reach)):
+                counts[i] += n
+
+            arrays = [pa.array(merged, type=pa.float64()) if f.name == 'engagement_rate'
+                      else batch.column(batch.schema.get_field_index(f.name)) for f in schema]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+    return counts
+
+def _tally(keep, has_reach):
+    """(calculated, skipped, zero_reach) counts for one batch."""
+    if VECTOR_SUPPORT:
+        keep, has_reach = np.asarray(keep), np.asarray(has_reach)
+        return (int(np.count_nonzero(~keep & has_reach)), int(np.count_nonzero(keep)),
+                int(np.count_nonzero(~keep & ~has_reach)))
+    return (sum(1 for k, r in zip(keep, has_reach) if not k and r), sum(1 for k in keep if k),
+            sum(1 for k, r in zip(keep, has_reach) if not k and not r))
+
+def _column(batch, field):
+    column = batch.column(batch.schema.get_field_index(field))
+    return column.to_pandas() if VECTOR_SUPPORT else column.to_pylist()
 
 def _to_int(val):
     """Safely convert value to int, handling strings, None, floats."""
@@ -74,7 +230,9 @@ def _to_int(val):
 
 if __name__ == "__main__":
     p = argparse.ArgumentParser(description="Calculate engagement rates for social posts")
-    p.add_argument('--json-file', required=True, help="Input JSON from parse_social_data.py")
-    p.add_argument('--output', required=True, help="Output path for enriched JSON")
+    p.add_argument('--json-file', required=True, help="Input from parse_social_data.py (.json, .jsonl, .parquet or .arrow)")
+    p.add_argument('--output', required=True, help="Output path for enriched data (format follows the extension)")
+    p.add_argument('--chunk-size', type=int,
+                   help="Posts per batch; .jsonl (always) and .parquet/.arrow input and output are streamed without loading the whole file")
     args = p.parse_args()
-    process(args.json_file, args.output)
+    process(args.json_file, args.output, args.chunk_size)
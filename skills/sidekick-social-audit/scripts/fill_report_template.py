@@ -6,19 +6,23 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
-def main():
-    p = argparse.ArgumentParser(); p.add_argument('--client-folder', required=True)
-    args = p.parse_args()
-    
-    client_path = Path(args.client_folder)
+TEMPLATE_PATH = Path(__file__).parent.parent / "references/social_audit_matrix.md"
+
+def load_template():
+    """Report template text; load once and pass to fill_report() when filling many clients."""
+    if not TEMPLATE_PATH.exists(): sys.exit("❌ Files missing")
+    with open(TEMPLATE_PATH) as f: return f.read()
+
+def fill_report(client_folder, template=None):
+    """Fill the template from the client's metrics_summary.json; returns the report path."""
+    client_path = Path(client_folder)
     audit_dir = client_path / "07_Marketing_Channels/Social_Media/04_Audit_Reports"
     metrics_path = audit_dir / "metrics_summary.json"
-    tpl_path = Path(__file__).parent.parent / "references/social_audit_matrix.md"
     
-    if not tpl_path.exists() or not metrics_path.exists(): sys.exit("❌ Files missing")
+    if not metrics_path.exists(): sys.exit("❌ Files missing")
+    text = template if template is not None else load_template()
     
     with open(metrics_path) as f: data = json.load(f)
-    with open(tpl_path) as f: text = f.read()
     
     rep = {
         '{{client_name}}': client_path.name.replace("client-","").title(),
@@ -77,6 +81,12 @@ def main():
     out_path = audit_dir / f"{client_path.name}_Audit_COMPLETE.md"
     with open(out_path, 'w') as f: f.write(text)
     logger.info(f"Report written: {out_path}")
+    return out_path
+
+def main():
+    p = argparse.ArgumentParser(); p.add_argument('--client-folder', required=True)
+    args = p.parse_args()
+    fill_report(args.client_folder)
 
 if __name__ == "__main__":
     main()
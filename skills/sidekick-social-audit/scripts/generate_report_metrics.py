@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 import sys, json, logging
 from pathlib import Path
-try: import pandas as pd
+try:
+    import numpy as np
+    import pandas as pd
 except: sys.exit("Error: pip install pandas")
+from posts_io import read_posts_frame
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+FORMATS = ['Static', 'Carousel', 'Reel']  # report order of the format breakdown
+
 class Analyzer:
     def __init__(self, bench_path=None):
         self.benchmarks = {"instagram": {"healthy_min": 3.0}, "facebook": {"healthy_min": 1.0}, "google_business_profile": {"healthy_min": 2.0}}
@@ -14,23 +19,21 @@ class Analyzer:
             with open(bench_path) as f: self.benchmarks = json.load(f)
 
     def analyze(self, input_path, output_path):
-        with open(input_path) as f: data = json.load(f)
-        if not data.get('posts'): return
-        df = pd.DataFrame(data['posts'])
+        # .json, .jsonl, .parquet or .arrow; only the columns analyzed are loaded
+        df = read_posts_frame(input_path, ['date', 'platform', 'engagement_rate', 'post_type', 'likes', 'comments', 'shares'])
+        if df.empty: return
         df['date'] = pd.to_datetime(df['date'])
         df = df.sort_values('date')
         
         # 1. Macro & YoY
         total_days = (df['date'].max() - df['date'].min()).days
         if total_days >= 730:
-            last_year = df[df['date'] > (df['date'].max() - pd.Timedelta(days=365))]['engagement_rate'].mean()
-            prev_year = df[df['date'] <= (df['date'].max() - pd.Timedelta(days=365))]['engagement_rate'].mean()
+            prev_year, last_year = self._split_means(df, df['date'] > (df['date'].max() - pd.Timedelta(days=365)))
             yoy = ((last_year - prev_year)/prev_year)*100 if prev_year > 0 else 0
             yoy_str = f"{yoy:+.1f}% vs previous year"
         else:
             mid = df['date'].min() + (df['date'].max() - df['date'].min())/2
-            first = df[df['date'] < mid]['engagement_rate'].mean()
-            second = df[df['date'] >= mid]['engagement_rate'].mean()
+            first, second = self._split_means(df, df['date'] >= mid)
             yoy = ((second - first)/first)*100 if first > 0 else 0
             yoy_str = f"{yoy:+.1f}% (first half vs second half)"
 
@@ -40,28 +43,29 @@ class Analyzer:
         peak = ", ".join(monthly.head(3).index) if len(monthly) >= 6 else "Insufficient data"
         valley = ", ".join(monthly.tail(3).index) if len(monthly) >= 6 else "Insufficient data"
 
-        # 3. Platforms
+        # 3. Platforms (one groupby pass, in order of first appearance)
+        df['platform'] = df['platform'].astype('category')
+        by_platform = self._group_stats(df, 'platform').reindex(df['platform'].unique()).fillna({'volume': 0})
         platforms = []
-        for p in df['platform'].unique():
-            pdf = df[df['platform']==p]
-            avg = pdf['engagement_rate'].mean() if 'engagement_rate' in pdf else 0
+        for p, row in by_platform.iterrows():
+            avg = row['avg']
             target = self.benchmarks.get(p, {}).get('healthy_min', 2.0)
             rec = "Scale up" if avg >= target else "Review strategy"
-            platforms.append({'platform':p, 'volume':len(pdf), 'avg_engagement':round(avg,2), 'recommendation':rec})
+            platforms.append({'platform':p, 'volume':int(row['volume']), 'avg_engagement':round(avg,2), 'recommendation':rec})
 
         # 4. Formats
-        def get_fmt(pt):
-            s = str(pt).lower()
-            return 'Carousel' if 'carousel' in s else ('Reel' if 'reel' in s else 'Static')
         if 'post_type' in df.columns:
-            df['fmt'] = df['post_type'].apply(get_fmt)
+            post_type = df['post_type'].astype(str).str.lower()
+            fmt = np.where(post_type.str.contains('carousel', regex=False), 'Carousel',
+                           np.where(post_type.str.contains('reel', regex=False), 'Reel', 'Static'))
         else:
-            df['fmt'] = 'Static'  # Default if no post_type column
+            fmt = 'Static'  # Default if no post_type column
+        df['fmt'] = pd.Categorical(np.broadcast_to(fmt, len(df)), categories=FORMATS)
+        by_format = self._group_stats(df, 'fmt')
         formats = []
-        for f in ['Static','Carousel','Reel']:
-            fdf = df[df['fmt']==f]
-            if len(fdf)>0:
-                formats.append({'format':f, 'avg_engagement':round(fdf['engagement_rate'].mean(),2), 'percent_of_feed':round(len(fdf)/len(df)*100,1), 'verdict': "Keep" if fdf['engagement_rate'].mean() > 2 else "Improve"})
+        for f, row in by_format.iterrows():
+            if row['volume']>0:
+                formats.append({'format':f, 'avg_engagement':round(row['avg'],2), 'percent_of_feed':round(int(row['volume'])/len(df)*100,1), 'verdict': "Keep" if row['avg'] > 2 else "Improve"})
 
         # 5. Hall of Fame
         df['total_interact'] = df['likes'].fillna(0) + df['comments'].fillna(0) + df['shares'].fillna(0)
@@ -99,6 +103,20 @@ class Analyzer:
         with open(output_path, 'w') as f: json.dump(metrics, f, indent=2, default=str)
         logger.info(f"✅ Metrics generated: {output_path}")
 
+    @staticmethod
+    def _group_stats(df, key):
+        """Post count and mean engagement per group of `key`, in a single groupby pass."""
+        grouped = df.groupby(key, observed=False, sort=True)
+        stats = pd.DataFrame({'volume': grouped.size()})
+        stats['avg'] = grouped['engagement_rate'].mean()
+        return stats
+
+    @staticmethod
+    def _split_means(df, mask):
+        """Mean engagement_rate of rows outside and inside `mask`, from one groupby."""
+        means = df.groupby(mask.to_numpy())['engagement_rate'].mean()
+        return means.get(False, float('nan')), means.get(True, float('nan'))
+
 if __name__ == "__main__":
     import argparse
     p = argparse.ArgumentParser()
@@ -9,15 +9,30 @@ Key Features:
 - Content-based deduplication (not just date+platform)
 - Column header-based platform detection fallback
 - Unique post_id for tracking
+- Streaming ingestion: rows flow straight into deduplication
+- Optional process pool (--workers) with output identical to serial runs
+- Date formats detected once per column instead of per row
+- Header layout resolved once per file/sheet (column_plans in the output)
+- Incremental re-runs: unchanged files are served from a content-hash cache
+- JSON output by default; .parquet/.arrow output paths write columnar datasets
+- .jsonl output writes one post per line plus a .meta.json sidecar for streaming
 """
 import argparse
+import calendar
 import json
 import csv
 import hashlib
 import logging
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from datetime import datetime
-from collections import defaultdict
+from datetime import date, datetime
+from collections import defaultdict, deque
+
+from posts_io import write_dataset
 
 # Try importing openpyxl for Excel support
 try:
@@ -29,6 +44,309 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+_MONTH_NUMBERS = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
+
+
+def _date_layout(order):
+    """Build a converter from regex groups to 'YYYY-MM-DD' for a field order.
+
+    `order` names each captured group: y/m/d for the date, B for a full month
+    name, H/M/S for time parts (validated only, like strptime would).
+    """
+    y, d = order.index('y'), order.index('d')
+    month_name = 'B' in order
+    m = order.index('B') if month_name else order.index('m')
+    limits = [(order.index(part), limit) for part, limit in (('H', 23), ('M', 59), ('S', 59)) if part in order]
+
+    def convert(groups):
+        for idx, limit in limits:
+            if int(groups[idx]) > limit:
+                return None
+        month = _MONTH_NUMBERS.get(groups[m].lower()) if month_name else int(groups[m])
+        if not month:
+            return None
+        try:
+            return date(int(groups[y]), month, int(groups[d])).strftime('%Y-%m-%d')
+        except ValueError:
+            return None
+
+    return convert
+
+
+class DateResolver:
+    """Resolves raw date cells to 'YYYY-MM-DD', caching the winning shape per column.
+
+    Each supported format has a regex "shape". The shape that matched last is
+    remembered per column, so a typical row costs one fullmatch plus one
+    date() call instead of a string of failed strptime attempts. Rows that
+    deviate are re-classified; values no shape recognizes fall back to the
+    full strptime loop, so results match trying FORMATS in order.
+    """
+
+    # Precedence order (ambiguous shapes try these in the same order)
+    FORMATS = [
+        '%m/%d/%Y %H:%M', '%Y-%m-%d', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S',
+        '%B %d, %Y', '%Y-%m-%d %H:%M', '%d/%m/%Y', '%Y/%m/%d'
+    ]
+
+    # (shape, converters in FORMATS precedence). Separators differ between
+    # shapes, so a value matching one shape can only parse with its formats.
+    SHAPES = [
+        (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4}) (\d{1,2}):(\d{2})'), [_date_layout('mdyHM')]),
+        (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'), [_date_layout('ymd')]),
+        (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), [_date_layout('mdy'), _date_layout('dmy')]),
+        (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2}) (\d{1,2}):(\d{2}):(\d{2})'), [_date_layout('ymdHMS')]),
+        (re.compile(r'([A-Za-z]+) (\d{1,2}), (\d{4})'), [_date_layout('Bdy')]),
+        (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2}) (\d{1,2}):(\d{2})'), [_date_layout('ymdHM')]),
+        (re.compile(r'(\d{4})/(\d{1,2})/(\d{1,2})'), [_date_layout('ymd')]),
+    ]
+
+    def __init__(self):
+        self._column_shapes = {}  # column -> (shape, converters)
+
+    def resolve(self, column, raw_val):
+        """Parse a raw cell from `column`; returns 'YYYY-MM-DD' or None."""
+        value = raw_val.strip()
+        cached = self._column_shapes.get(column)
+        match = cached[0].fullmatch(value) if cached else None
+
+        if not match:
+            for shape, converters in self.SHAPES:
+                match = shape.fullmatch(value)
+                if match:
+                    cached = self._column_shapes[column] = (shape, converters)
+                    break
+            else:
+                return self._strptime_any(value)
+
+        groups = match.groups()
+        for convert in cached[1]:
+            parsed = convert(groups)
+            if parsed:
+                return parsed
+        return None
+
+    def _strptime_any(self, value):
+        """Slow path: try every format in precedence order."""
+        for fmt in self.FORMATS:
+            try:
+                return datetime.strptime(value, fmt).strftime('%Y-%m-%d')
+            except ValueError:
+                continue
+        return None
+
+
+def _to_count(val):
+    """Coerce a metric cell ('1,234', '$5', None) to int; unparseable -> 0."""
+    try:
+        cleaned = str(val or '0').replace(',', '').replace('$', '').strip()
+        return int(float(cleaned or 0))
+    except (ValueError, TypeError):
+        return 0
+
+
+def _to_text(val):
+    """Coerce a text cell to a stripped string."""
+    return str(val or '').strip()
+
+
+class ColumnPlan:
+    """Header layout for one file or sheet, resolved once from its header row.
+
+    Records which column feeds the date and each post field and how each
+    value is coerced, so rows are projected with index lookups instead of
+    re-matching header names on every row.
+
+    Rows are sequences of cells. CSV rows read missing trailing cells as
+    None; sheet rows (`from_sheet=True`) treat them as absent columns and
+    ignore blank headers, mirroring how each reader builds its row dicts.
+    """
+
+    DATE_KEYS = ['publish time', 'publish date', 'posted date', 'created', 'date', 'timestamp', 'post date']
+
+    # Metric Mapping: field -> header aliases, in priority order
+    FIELD_ALIASES = {
+        'likes': ['likes', 'reactions', 'like count', 'total likes'],
+        'comments': ['comments', 'comment count', 'total comments'],
+        'shares': ['shares', 'share count', 'total shares'],
+        'reach': ['reach', 'impressions', 'views', 'total reach'],
+        'post_type': ['type', 'format', 'post type', 'media type'],
+        'caption': ['caption', 'text', 'description', 'message', 'content'],
+    }
+    NUMERIC_FIELDS = {'likes', 'comments', 'shares', 'reach'}
+
+    # Summary-row markers; valid columns on GBP exports
+    AGGREGATE_COLUMNS = ['Store code', 'Business name']
+
+    def __init__(self, headers, platform, from_sheet=False):
+        self.headers = list(headers)
+        self.platform = platform
+        self.from_sheet = from_sheet
+        self.dates = DateResolver()
+
+        # Duplicate headers: the last column wins (dict semantics)
+        self.columns = {}
+        for i, h in enumerate(self.headers):
+            if h or not from_sheet:
+                self.columns[h] = i
+        self.value_columns = list(self.columns.values())
+
+        # Normalize keys to lower case for searching
+        lookup = {str(h).lower().strip(): h for h in self.columns if h}
+
+        self.date_columns = [self.columns[lookup[k]] for k in self.DATE_KEYS if k in lookup]
+        self.fields = []  # (field, candidate column indices, coercer)
+        for field, aliases in self.FIELD_ALIASES.items():
+            indices = [self.columns[lookup[a]] for a in aliases if a in lookup]
+            if indices:
+                coerce = _to_count if field in self.NUMERIC_FIELDS else _to_text
+                self.fields.append((field, indices, coerce))
+
+        self.aggregate_columns = []
+        if platform != 'google_business_profile':
+            self.aggregate_columns = [self.columns[k] for k in self.AGGREGATE_COLUMNS if k in self.columns]
+
+    def values(self, row):
+        """Cell values as the row's dict would hold them (for garbage checks)."""
+        n = len(row)
+        values = [row[i] for i in self.value_columns if i < n]
+        if not self.from_sheet and n > len(self.headers):
+            values.append(row[len(self.headers):])  # csv.DictReader's restkey list
+        return values
+
+    def describe(self):
+        """JSON-friendly summary of which header feeds each field."""
+        return {
+            'platform': self.platform,
+            'date_columns': [self.headers[i] for i in self.date_columns],
+            'fields': {field: self.headers[indices[0]] for field, indices, _ in self.fields},
+        }
+
+
+class ParseCache:
+    """Per-file parse results persisted between runs.
+
+    Layout of the cache directory:
+        manifest.json   - one entry per export: size, mtime, sha256, and the
+                          file's stats/skipped_files/column_plans contribution
+        <key>.jsonl     - that file's normalized posts, one JSON object per line
+
+    An entry is reused when size and mtime match, or when only the mtime
+    changed but the content hash is identical. The manifest is tagged with a
+    fingerprint of this script and the parser options, so any change to
+    normalization logic invalidates every entry.
+    """
+
+    MANIFEST = 'manifest.json'
+
+    def __init__(self, cache_dir, options):
+        self.cache_dir = Path(cache_dir)
+        self.fingerprint = hashlib.sha256(
+            Path(__file__).read_bytes() + json.dumps(options, sort_keys=True).encode()
+        ).hexdigest()
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+        manifest_path = self.cache_dir / self.MANIFEST
+        if manifest_path.exists():
+            try:
+                with open(manifest_path) as f:
+                    manifest = json.load(f)
+                if manifest.get('fingerprint') == self.fingerprint:
+                    self.entries = manifest.get('files', {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable parse cache: {e}")
+
+    @staticmethod
+    def _hash_file(path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _posts_path(self, path):
+        return self.cache_dir / (hashlib.sha256(str(path).encode()).hexdigest()[:16] + '.jsonl')
+
+    def lookup(self, path):
+        """Return the cached entry for `path` if it is still valid, else None."""
+        key = str(Path(path).resolve())
+        entry = self.entries.get(key)
+        st = os.stat(path)
+        if entry and entry['size'] == st.st_size and self._posts_path(key).exists():
+            if entry['mtime_ns'] == st.st_mtime_ns:
+                self.hits += 1
+                return entry
+            if entry['sha256'] == self._hash_file(path):
+                entry['mtime_ns'] = st.st_mtime_ns
+                self.hits += 1
+                return entry
+        self.misses += 1
+        return None
+
+    def iter_posts(self, entry):
+        """Stream a cached file's posts back from disk."""
+        with open(self.cache_dir / entry['posts_file']) as f:
+            for line in f:
+                yield json.loads(line)
+
+    def record(self, path, posts, stats_of):
+        """Pass `posts` through while writing them to the cache.
+
+        `stats_of` is called once the posts are exhausted and must return the
+        file's (stats, skipped_files, column_plans) contribution. Files that
+        failed to parse are not cached, so they are retried next run.
+        """
+        key = str(Path(path).resolve())
+        st = os.stat(path)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as sink:
+                for post in posts:
+                    sink.write(json.dumps(post, default=str) + '\n')
+                    yield post
+            stats, skipped, plans = stats_of()
+            if stats.get('files_failed'):
+                return
+            posts_path = self._posts_path(key)
+            os.replace(tmp, posts_path)
+            self.entries[key] = {
+                'size': st.st_size,
+                'mtime_ns': st.st_mtime_ns,
+                'sha256': self._hash_file(path),
+                'posts_file': posts_path.name,
+                'stats': stats,
+                'skipped_files': skipped,
+                'column_plans': plans,
+            }
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def save(self, paths, roots=()):
+        """Write the manifest, dropping entries (and posts) for files no longer present.
+
+        An entry is dropped when its file is gone, or when it lies under one of
+        `roots` (the folders this run scanned) but is not among `paths`.
+        Entries for other folders sharing the cache directory are kept.
+        """
+        keep = {str(Path(p).resolve()) for p in paths}
+        roots = [Path(r).resolve() for r in roots]
+        for key in list(self.entries):
+            source = Path(key)
+            if key in keep or (source.exists() and not any(source.is_relative_to(r) for r in roots)):
+                continue
+            stale = self.cache_dir / self.entries.pop(key)['posts_file']
+            if stale.exists():
+                stale.unlink()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'fingerprint': self.fingerprint, 'files': self.entries}, f)
+        os.replace(tmp, self.cache_dir / self.MANIFEST)
+
 
 class SocialDataParser:
     """Parses and normalizes social media export data."""
@@ -40,9 +358,18 @@ class SocialDataParser:
         'google_business_profile': ['gbp', 'google business', 'local post', 'store code'],
     }
 
-    def __init__(self, verbose=True, default_platform=None):
+    # Files parsed ahead per worker process; bounds results waiting to be consumed
+    IN_FLIGHT_PER_WORKER = 2
+
+    # Default cache location, created next to the output file
+    CACHE_DIRNAME = '.parse_cache'
+
+    def __init__(self, verbose=True, default_platform=None, workers=1, cache_dir=None):
         self.verbose = verbose
         self.default_platform = default_platform
+        self.workers = max(1, int(workers))
+        self.cache_dir = cache_dir  # None: default location next to output; False: disabled
+        self.cache = None
         self.stats = {
             'files_processed': 0,
             'files_failed': 0,
@@ -52,6 +379,7 @@ class SocialDataParser:
             'duplicates_removed': 0,
         }
         self.skipped_files = []  # Track why files were skipped
+        self.column_plans = []  # Which header fed each field, per file/sheet
 
         if not EXCEL_SUPPORT:
             logger.warning("openpyxl not installed. Excel files will be skipped. Run: pip install openpyxl")
@@ -119,92 +447,63 @@ class SocialDataParser:
 
         return None
 
-    def _normalize_post(self, row, filename, platform):
-        """Normalize a single row into standard post format."""
-        # Skip aggregate/summary rows
-        if any(k in row for k in ['Store code', 'Business name']):
-            if platform == 'google_business_profile':
-                # These are valid GBP columns, don't skip the whole row
-                pass
-            else:
-                return None
+    def _normalize_post(self, row, filename, plan):
+        """Project a single row through its file's ColumnPlan into standard post format."""
+        n = len(row)
 
-        # Normalize keys to lower case for searching
-        row_map = {str(k).lower().strip(): k for k in row.keys() if k}
+        # Skip aggregate/summary rows (those columns are valid on GBP exports)
+        if plan.aggregate_columns:
+            if not plan.from_sheet or any(i < n for i in plan.aggregate_columns):
+                return None
 
         # Date Finding Logic
-        date = None
-        date_keys = ['publish time', 'publish date', 'posted date', 'created', 'date', 'timestamp', 'post date']
-        for key in date_keys:
-            if key in row_map:
-                raw_val = str(row[row_map[key]] or '')
-                if 'lifetime' in raw_val.lower() or not raw_val.strip():
-                    continue
+        post_date = None
+        for i in plan.date_columns:
+            if i >= n:
+                continue
+            raw_val = str(row[i] or '')
+            if 'lifetime' in raw_val.lower() or not raw_val.strip():
+                continue
 
-                # Try multiple date formats
-                for fmt in [
-                    '%m/%d/%Y %H:%M', '%Y-%m-%d', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S',
-                    '%B %d, %Y', '%Y-%m-%d %H:%M', '%d/%m/%Y', '%Y/%m/%d'
-                ]:
-                    try:
-                        date = datetime.strptime(raw_val.strip(), fmt).strftime('%Y-%m-%d')
-                        break
-                    except ValueError:
-                        continue
-                if date:
-                    break
+            post_date = plan.dates.resolve(i, raw_val)
+            if post_date:
+                break
 
-        if not date:
+        if not post_date:
             return None
 
         post = {
-            'date': date,
-            'platform': platform,
+            'date': post_date,
+            'platform': plan.platform,
             'source_file': filename,
         }
 
-        # Metric Mapping
-        mapping = {
-            'likes': ['likes', 'reactions', 'like count', 'total likes'],
-            'comments': ['comments', 'comment count', 'total comments'],
-            'shares': ['shares', 'share count', 'total shares'],
-            'reach': ['reach', 'impressions', 'views', 'total reach'],
-            'post_type': ['type', 'format', 'post type', 'media type'],
-            'caption': ['caption', 'text', 'description', 'message', 'content'],
-        }
-
-        for field, lookup_keys in mapping.items():
-            for key in lookup_keys:
-                if key in row_map:
-                    val = row[row_map[key]]
-                    try:
-                        if field in ['likes', 'comments', 'shares', 'reach']:
-                            cleaned = str(val or '0').replace(',', '').replace('$', '').strip()
-                            post[field] = int(float(cleaned or 0))
-                        else:
-                            post[field] = str(val or '').strip()
-                    except (ValueError, TypeError):
-                        post[field] = 0 if field in ['likes', 'comments', 'shares', 'reach'] else ''
-                    break
+        for field, indices, coerce in plan.fields:
+            if plan.from_sheet:
+                i = next((i for i in indices if i < n), None)
+                if i is None:
+                    continue
+            else:
+                i = indices[0]
+            post[field] = coerce(row[i] if i < n else None)
 
         return post
 
-    def _is_garbage_row(self, row):
+    def _is_garbage_row(self, values):
         """Detects summary/aggregate rows often found in exports."""
-        s = ' '.join(str(v).lower() for v in row.values() if v)
+        s = ' '.join(str(v).lower() for v in values if v)
         garbage_indicators = ['number of', 'total count', 'interactions with', 'sum of', 'average']
         return any(x in s for x in garbage_indicators)
 
-    def parse_csv(self, path):
-        """Parse a CSV file into normalized posts."""
-        posts = []
+    def iter_csv(self, path):
+        """Stream normalized posts from a CSV file, one row at a time."""
         try:
             with open(path, 'r', encoding='utf-8-sig', errors='replace') as f:
                 sample = f.read(2048)
                 f.seek(0)
                 delim = ',' if sample.count(',') > sample.count(';') else ';'
-                reader = csv.DictReader(f, delimiter=delim)
-                headers = reader.fieldnames or []
+                reader = csv.reader(f, delimiter=delim)
+                headers = next(reader, None) or []
 
                 platform = self._detect_platform(path.name, headers)
                 if not platform:
@@ -213,15 +512,17 @@ class SocialDataParser:
                         'file': path.name,
                         'reason': 'Could not detect platform from filename or columns'
                     })
-                    return []
+                    return
 
+                plan = ColumnPlan(headers, platform)
+                self.column_plans.append({'file': path.name, **plan.describe()})
                 for row in reader:
-                    if self._is_garbage_row(row):
+                    if not row or self._is_garbage_row(plan.values(row)):
                         continue
-                    p = self._normalize_post(row, path.name, platform)
+                    p = self._normalize_post(row, path.name, plan)
                     if p:
-                        posts.append(p)
                         self.stats['posts_parsed'] += 1
+                        yield p
                     else:
                         self.stats['posts_skipped'] += 1
 
@@ -229,24 +530,33 @@ class SocialDataParser:
         except Exception as e:
             self.stats['files_failed'] += 1
             logger.error(f"Failed CSV {path.name}: {e}")
-        return posts
 
-    def parse_excel(self, path):
-        """Parse an Excel file into normalized posts."""
-        posts = []
+    def parse_csv(self, path):
+        """Parse a CSV file into normalized posts."""
+        return list(self.iter_csv(path))
+
+    def iter_excel(self, path):
+        """Stream normalized posts from an Excel file.
+
+        Sheets are read through openpyxl's read-only reader, which parses rows
+        as they are iterated: the header row is pulled first, then each data
+        row is normalized and handed on, so memory doesn't grow with sheet size.
+        """
         if not EXCEL_SUPPORT:
-            return []
+            return
 
+        parsed = 0
+        wb = None
         try:
             wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
 
             for sheet_name in wb.sheetnames:
-                sheet = wb[sheet_name]
-                rows = list(sheet.iter_rows(values_only=True))
-                if not rows:
+                rows = wb[sheet_name].iter_rows(values_only=True)
+                header_row = next(rows, None)
+                if header_row is None:
                     continue
 
-                headers = [str(h) if h else '' for h in rows[0]]
+                headers = [str(h) if h else '' for h in header_row]
                 platform = self._detect_platform(path.name, headers)
 
                 if not platform:
@@ -266,23 +576,21 @@ class SocialDataParser:
                     })
                     continue
 
-                for row_data in rows[1:]:
-                    row_dict = {}
-                    for i, h in enumerate(headers):
-                        if h and i < len(row_data):
-                            row_dict[h] = row_data[i]
-
-                    if self._is_garbage_row(row_dict):
+                plan = ColumnPlan(headers, platform, from_sheet=True)
+                self.column_plans.append({'file': f"{path.name} / {sheet_name}", **plan.describe()})
+                for row_data in rows:
+                    if self._is_garbage_row(plan.values(row_data)):
                         continue
 
-                    p = self._normalize_post(row_dict, path.name, platform)
+                    p = self._normalize_post(row_data, path.name, plan)
                     if p:
-                        posts.append(p)
+                        parsed += 1
                         self.stats['posts_parsed'] += 1
+                        yield p
                     else:
                         self.stats['posts_skipped'] += 1
 
-            if posts:
+            if parsed:
                 self.stats['files_processed'] += 1
             else:
                 self.stats['files_skipped'] += 1
@@ -290,12 +598,80 @@ class SocialDataParser:
         except Exception as e:
             self.stats['files_failed'] += 1
             logger.error(f"Failed Excel {path.name}: {e}")
+        finally:
+            # Read-only workbooks keep the file handle open until closed
+            if wb is not None:
+                wb.close()
 
-        return posts
+    def parse_excel(self, path):
+        """Parse an Excel file into normalized posts."""
+        return list(self.iter_excel(path))
+
+    def _merge(self, stats, skipped, plans):
+        """Fold one file's stats, skipped_files and column_plans into the run totals."""
+        for key, value in stats.items():
+            self.stats[key] += value
+        self.skipped_files.extend(skipped)
+        self.column_plans.extend(plans)
+
+    def _iter_parallel(self, files):
+        """Parse files across a process pool, yielding per-file results in order.
+
+        Each item is (posts, stats, skipped_files, column_plans) for one file.
+        Only IN_FLIGHT_PER_WORKER files per worker are submitted ahead of the
+        consumer, so finished results never pile up beyond that window.
+        Results are yielded in submission order, so merging them as they are
+        consumed keeps the output identical to a single-process run.
+        """
+        options = {'default_platform': self.default_platform}
+        workers = min(self.workers, len(files))
+        remaining = iter(files)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight = deque(pool.submit(_parse_file_worker, f, options)
+                              for f in islice(remaining, self.IN_FLIGHT_PER_WORKER * workers))
+            while in_flight:
+                result = in_flight.popleft().result()
+                for f in islice(remaining, 1):
+                    in_flight.append(pool.submit(_parse_file_worker, f, options))
+                yield result
+
+    def _iter_file(self, path):
+        """Stream one file's posts, recording them in the cache when enabled."""
+        posts = self.iter_csv(path) if path.suffix.lower() == '.csv' else self.iter_excel(path)
+        if not self.cache:
+            return posts
+
+        stats_before = dict(self.stats)
+        skipped_at, plans_at = len(self.skipped_files), len(self.column_plans)
+
+        def contribution():
+            stats = {k: self.stats[k] - stats_before[k] for k in self.stats}
+            return stats, self.skipped_files[skipped_at:], self.column_plans[plans_at:]
+
+        return self.cache.record(path, posts, contribution)
+
+    def _iter_posts(self, files):
+        """Yield posts from every file in order, reusing valid cache entries."""
+        cached = {f: self.cache.lookup(f) for f in files} if self.cache else {}
+        misses = [f for f in files if not cached.get(f)]
+        fresh = self._iter_parallel(misses) if self.workers > 1 and len(misses) > 1 else None
+
+        for f in files:
+            entry = cached.get(f)
+            if entry:
+                self._merge(entry['stats'], entry['skipped_files'], entry['column_plans'])
+                yield from self.cache.iter_posts(entry)
+            elif fresh:
+                posts, stats, skipped, plans = next(fresh)
+                if self.cache:
+                    posts = self.cache.record(f, posts, lambda s=stats, k=skipped, p=plans: (s, k, p))
+                self._merge(stats, skipped, plans)
+                yield from posts
+            else:
+                yield from self._iter_file(f)
 
     def run(self, search_dir, output):
         """Run the full parsing pipeline."""
-        posts = []
         path = Path(search_dir)
 
         if not path.exists():
@@ -309,7 +685,7 @@ class SocialDataParser:
         # Categorize files
         processable_extensions = {'.csv', '.xlsx', '.xls'}
         unprocessable_extensions = {'.json', '.md', '.txt', '.pdf', '.doc', '.docx', '.png', '.jpg', '.jpeg'}
-        skip_patterns = {'.DS_Store', '__pycache__', '.git'}
+        skip_patterns = {'.DS_Store', '__pycache__', '.git', self.CACHE_DIRNAME}
 
         file_manifest = {
             'total_found': len(all_files),
@@ -341,29 +717,31 @@ class SocialDataParser:
         # Store for output
         self.file_manifest = file_manifest
 
-        # 1. Parse CSVs
+        # 1. Parse CSVs, then 2. Excels - streamed so only unique posts are held
         csv_files = [f for f in file_manifest['processable'] if f.suffix.lower() == '.csv']
-        for f in csv_files:
-            posts.extend(self.parse_csv(f))
-
-        # 2. Parse Excels
+        xlsx_files = []
         if EXCEL_SUPPORT:
             xlsx_files = [f for f in file_manifest['processable'] if f.suffix.lower() in {'.xlsx', '.xls'}]
-            for f in xlsx_files:
-                posts.extend(self.parse_excel(f))
+        out = Path(output)
+        if self.cache_dir is not False:
+            options = {'default_platform': self.default_platform}
+            self.cache = ParseCache(self.cache_dir or out.parent / self.CACHE_DIRNAME, options)
+        posts = self._iter_posts(csv_files + xlsx_files)
 
         # 3. Deduplicate (content-aware)
         unique = self._smart_deduplicate(posts)
         unique.sort(key=lambda x: x['date'])
+        if self.cache:
+            self.cache.save(csv_files + xlsx_files, [path])
 
         # 4. Save output
-        out = Path(output)
         out.parent.mkdir(parents=True, exist_ok=True)
 
         result = {
             'posts': unique,
             'stats': self.stats,
             'skipped_files': self.skipped_files,
+            'column_plans': self.column_plans,
             'file_manifest': {
                 'total_found': self.file_manifest['total_found'],
                 'processable_count': len(self.file_manifest['processable']),
@@ -374,13 +752,14 @@ class SocialDataParser:
             'generated_at': datetime.now().isoformat(),
         }
 
-        with open(out, 'w') as f:
-            json.dump(result, f, indent=2, default=str)
+        write_dataset(out, result)
 
         # 5. Summary logging
         logger.info("=" * 60)
         logger.info("✅ PARSING COMPLETE")
         logger.info(f"   📊 Parsed {len(unique)} unique posts from {self.stats['files_processed']} files")
+        if self.cache and self.cache.hits:
+            logger.info(f"   ♻️ Reused {self.cache.hits} unchanged files from cache, parsed {self.cache.misses}")
         if self.stats['duplicates_removed']:
             logger.info(f"   🔄 Removed {self.stats['duplicates_removed']} duplicates")
         if self.stats['files_skipped']:
@@ -402,23 +781,49 @@ class SocialDataParser:
                 logger.info(f"  - {skip['file']}: {skip['reason']}")
 
 
+def _parse_file_worker(path, options):
+    """Parse a single export in a worker process.
+
+    A fresh parser is used per file so the returned stats are exactly this
+    file's contribution and can be summed by the parent.
+    """
+    worker = SocialDataParser(verbose=False, **options)
+    parse = worker.iter_csv if path.suffix.lower() == '.csv' else worker.iter_excel
+    posts = list(parse(path))
+    return posts, worker.stats, worker.skipped_files, worker.column_plans
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
         description='Parse social media export files (CSV, Excel) into normalized JSON'
     )
     parser.add_argument('--search-dir', required=True, help='Directory containing export files')
-    parser.add_argument('--output', required=True, help='Output JSON file path')
+    parser.add_argument(
+        '--output', required=True,
+        help='Output file path (.json, .jsonl with a .meta.json sidecar, or .parquet/.arrow for a columnar dataset)'
+    )
     parser.add_argument(
         '--platform',
         choices=['instagram', 'facebook', 'google_business_profile'],
         help='Default platform if auto-detection fails'
     )
     parser.add_argument('--quiet', action='store_true', help='Reduce logging output')
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help='Parse files across N processes; output matches a serial run (default: 1)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        help=f'Per-file parse cache for incremental re-runs (default: {SocialDataParser.CACHE_DIRNAME}/ next to --output)'
+    )
+    parser.add_argument('--no-cache', action='store_true', help='Re-parse every file and skip the cache')
 
     args = parser.parse_args()
 
     parser_instance = SocialDataParser(
         verbose=not args.quiet,
-        default_platform=args.platform
+        default_platform=args.platform,
+        workers=args.workers,
+        cache_dir=False if args.no_cache else args.cache_dir
     )
     parser_instance.run(args.search_dir, args.output)
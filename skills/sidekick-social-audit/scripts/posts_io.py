@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Posts Dataset I/O - Sidekick Social Audit
+Reads and writes the normalized posts dataset passed between audit stages
+(parse_social_data.py -> calculate_engagement.py -> generate_report_metrics.py).
+
+The format is chosen by file extension:
+- .json                 One JSON document: {"posts": [...], "stats": ..., ...} (default)
+- .jsonl / .ndjson      One post per line, other sections in a <name>.meta.json sidecar
+- .parquet              Columnar Parquet, posts as typed columns
+- .arrow / .feather     Arrow IPC file, same layout as Parquet
+
+Columnar files keep everything except `posts` (stats, skipped_files,
+file_manifest, ...) as JSON in the schema metadata, so every format
+round-trips the same dataset. JSONL and columnar datasets can be streamed
+with iter_posts()/write_posts() without holding every post in memory.
+"""
+import json
+import os
+import sys
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+
+# Try importing pyarrow for columnar formats
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.feather as feather
+    ARROW_SUPPORT = True
+except ImportError:
+    ARROW_SUPPORT = False
+
+PARQUET_SUFFIXES = {'.parquet', '.pq'}
+ARROW_SUFFIXES = {'.arrow', '.feather', '.ipc'}
+JSONL_SUFFIXES = {'.jsonl', '.ndjson'}
+
+# Schema metadata key holding the non-post sections as JSON
+META_KEY = b'sidekick_meta'
+
+# Known post columns and their types; any other keys are inferred
+POST_COLUMNS = {
+    'date': 'string',
+    'platform': 'string',
+    'source_file': 'string',
+    'likes': 'int64',
+    'comments': 'int64',
+    'shares': 'int64',
+    'reach': 'int64',
+    'post_type': 'string',
+    'caption': 'string',
+    'post_id': 'string',
+    'engagement_rate': 'float64',
+}
+
+
+def detect_format(path):
+    """Return 'parquet', 'arrow', 'jsonl' or 'json' for a dataset path."""
+    suffix = Path(path).suffix.lower()
+    if suffix in PARQUET_SUFFIXES:
+        return 'parquet'
+    if suffix in ARROW_SUFFIXES:
+        return 'arrow'
+    if suffix in JSONL_SUFFIXES:
+        return 'jsonl'
+    return 'json'
+
+
+def is_columnar(path):
+    return detect_format(path) in {'parquet', 'arrow'}
+
+
+def meta_path(path):
+    """Sidecar holding a JSONL dataset's non-post sections (data.jsonl -> data.meta.json)."""
+    path = Path(path)
+    return path.with_name(path.stem + '.meta.json')
+
+
+def _require_arrow(path):
+    if not ARROW_SUPPORT:
+        sys.exit(f"Error: pip install pyarrow (needed to read/write {Path(path).name})")
+
+
+def posts_to_table(posts, meta=None):
+    """Build an Arrow table from post dicts, with `meta` in the schema metadata."""
+    columns = {}
+    for post in posts:
+        for key in post:
+            columns.setdefault(key, None)
+
+    arrays, fields = [], []
+    for key in columns:
+        values = [post.get(key) for post in posts]
+        if key in POST_COLUMNS:
+            arrays.append(pa.array(values, type=POST_COLUMNS[key]))
+        else:
+            arrays.append(pa.array(values))
+        fields.append(pa.field(key, arrays[-1].type))
+
+    metadata = {META_KEY: json.dumps(meta or {}, default=str).encode()}
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields, metadata=metadata))
+
+
+def table_meta(table):
+    """Non-post sections stored in a columnar file's schema metadata."""
+    raw = (table.schema.metadata or {}).get(META_KEY)
+    return json.loads(raw) if raw else {}
+
+
+def read_table(path):
+    """Read a columnar dataset as an Arrow table."""
+    _require_arrow(path)
+    if detect_format(path) == 'parquet':
+        return pq.read_table(path)
+    return feather.read_table(path)
+
+
+def write_table(path, table):
+    """Write an Arrow table in the format implied by `path`."""
+    _require_arrow(path)
+    if detect_format(path) == 'parquet':
+        pq.write_table(table, path, compression='zstd')
+    else:
+        feather.write_feather(table, path, compression='zstd')
+
+
+def iter_batches(path, batch_size):
+    """Stream a columnar dataset as Arrow record batches of at most `batch_size` rows."""
+    _require_arrow(path)
+    if detect_format(path) == 'parquet':
+        yield from pq.ParquetFile(path).iter_batches(batch_size=batch_size)
+        return
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            for start in range(0, batch.num_rows, batch_size):
+                yield batch.slice(start, batch_size)
+
+
+def read_schema(path):
+    """Schema (including dataset metadata) of a columnar file, without reading rows."""
+    _require_arrow(path)
+    if detect_format(path) == 'parquet':
+        return pq.read_schema(path)
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).schema
+
+
+def count_rows(path):
+    """Number of posts in a columnar file, read from its footer."""
+    _require_arrow(path)
+    if detect_format(path) == 'parquet':
+        return pq.ParquetFile(path).metadata.num_rows
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+
+
+@contextmanager
+def replacing(path):
+    """Yield a temporary path next to `path` that replaces it when the block succeeds.
+
+    Streaming stages write through this, so their output can be the very
+    file their input is still being read from; on error `path` is untouched.
+    """
+    path = Path(path)
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+@contextmanager
+def open_batch_writer(path, schema):
+    """Incremental writer for a columnar dataset; use as a context manager.
+
+    Batches go to a temporary file that only replaces `path` once the writer
+    has closed cleanly (see replacing()).
+    """
+    _require_arrow(path)
+    with replacing(path) as tmp:
+        if detect_format(path) == 'parquet':
+            writer = pq.ParquetWriter(str(tmp), schema, compression='zstd')
+        else:
+            options = pa.ipc.IpcWriteOptions(compression='zstd')
+            writer = pa.ipc.new_file(str(tmp), schema, options=options)
+        with writer:
+            yield writer
+
+
+def read_meta(path):
+    """Everything except `posts` (stats, skipped_files, file_manifest, ...)."""
+    fmt = detect_format(path)
+    if fmt == 'jsonl':
+        sidecar = meta_path(path)
+        if not sidecar.exists():
+            return {}
+        with open(sidecar) as f:
+            return json.load(f)
+    if fmt == 'json':
+        with open(path) as f:
+            return {k: v for k, v in json.load(f).items() if k != 'posts'}
+    return table_meta(read_schema(path))
+
+
+def iter_posts(path, batch_size=10000):
+    """Yield post dicts one at a time; JSONL and columnar files are streamed."""
+    fmt = detect_format(path)
+    if fmt == 'jsonl':
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif fmt == 'json':
+        with open(path) as f:
+            yield from json.load(f).get('posts') or []
+    else:
+        for batch in iter_batches(path, batch_size):
+            # Drop nulls so posts look like the JSON ones (absent field, not None)
+            for row in batch.to_pylist():
+                yield {k: v for k, v in row.items() if v is not None}
+
+
+def iter_post_chunks(path, chunk_size):
+    """Yield lists of at most `chunk_size` posts."""
+    posts = iter_posts(path)
+    while True:
+        chunk = list(islice(posts, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_posts(path, posts, meta):
+    """Write posts from any iterable plus the dataset's other sections.
+
+    JSONL is written line by line as posts arrive, so a stage can start
+    emitting output before its input is fully read. The lines and the
+    sidecar go through replacing(), so `posts` may be streamed from `path`
+    itself. Other formats collect the posts first.
+    """
+    if detect_format(path) != 'jsonl':
+        write_dataset(path, {'posts': list(posts), **meta})
+        return
+
+    with replacing(path) as tmp, open(tmp, 'w') as f:
+        for post in posts:
+            f.write(json.dumps(post, default=str) + '\n')
+    with replacing(meta_path(path)) as tmp, open(tmp, 'w') as f:
+        json.dump(meta, f, indent=2, default=str)
+
+
+def read_dataset(path):
+    """Load a dataset as a dict: {'posts': [post dicts], **metadata}."""
+    fmt = detect_format(path)
+    if fmt == 'json':
+        with open(path) as f:
+            return json.load(f)
+    if fmt == 'jsonl':
+        return {'posts': list(iter_posts(path)), **read_meta(path)}
+
+    table = read_table(path)
+    # Drop nulls so posts look like the JSON ones (absent field, not None)
+    posts = [{k: v for k, v in row.items() if v is not None} for row in table.to_pylist()]
+    return {'posts': posts, **table_meta(table)}
+
+
+def write_dataset(path, data):
+    """Write a dataset dict ({'posts': [...], **metadata}) to `path`."""
+    fmt = detect_format(path)
+    if fmt == 'json':
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+        return
+
+    meta = {k: v for k, v in data.items() if k != 'posts'}
+    if fmt == 'jsonl':
+        write_posts(path, data.get('posts', []), meta)
+        return
+
+    _require_arrow(path)
+    write_table(path, posts_to_table(data.get('posts', []), meta))
+
+
+def read_posts_frame(path, columns=None):
+    """Load posts straight into a pandas DataFrame with typed columns.
+
+    `columns` limits what is kept; for JSONL and columnar files only those
+    columns are ever materialized.
+    """
+    import pandas as pd
+
+    fmt = detect_format(path)
+    if fmt == 'json':
+        with open(path) as f:
+            df = pd.DataFrame(json.load(f).get('posts') or [])
+        return df[[c for c in columns if c in df.columns]] if columns else df
+    if fmt == 'jsonl':
+        chunks = []
+        for chunk in iter_post_chunks(path, 50000):
+            df = pd.DataFrame(chunk)
+            chunks.append(df[[c for c in columns if c in df.columns]] if columns else df)
+        return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+    table = read_table(path)
+    if columns:
+        table = table.select([c for c in columns if c in table.column_names])
+    return table.to_pandas()
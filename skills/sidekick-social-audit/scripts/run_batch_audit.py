@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Batch Audit Runner - Sidekick Social Audit
+Runs the complete audit pipeline for every client-* folder under a root.
+
+Each client goes through the same stages as run_complete_audit.sh
+(validate -> parse -> enrich -> analyze -> report -> validate report),
+but in-process: clients are spread across a process pool and each worker
+loads the report template and benchmarks once, then reuses them for every
+client it handles.
+
+Writes a consolidated summary (status + per-stage timings per client) to
+audit_batch_summary.json in the clients root.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime
+from io import StringIO
+from pathlib import Path
+
+from validate_folder_structure import validate as validate_folder
+from parse_social_data import SocialDataParser
+from calculate_engagement import process as calculate_engagement
+from generate_report_metrics import Analyzer
+from fill_report_template import load_template, fill_report
+from validate_report import validate as validate_report
+
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+PERF_DATA = "07_Marketing_Channels/Social_Media/02_Performance_Data"
+AUDIT_OUTPUT = "07_Marketing_Channels/Social_Media/04_Audit_Reports"
+STAGES = ['validate', 'parse', 'enrich', 'analyze', 'report', 'validate_report']
+SUMMARY_NAME = 'audit_batch_summary.json'
+
+# Loaded once per worker process by _init_worker()
+_shared = {}
+
+
+class StageFailed(Exception):
+    """A pipeline stage reported failure (the CLI equivalent exits non-zero)."""
+
+
+def _init_worker(bench_path, quiet):
+    _shared['template'] = load_template()
+    _shared['analyzer'] = Analyzer(bench_path)
+    if quiet:
+        # Quiet the stage modules but keep this runner's own progress/summary
+        logging.getLogger().setLevel(logging.WARNING)
+        logger.setLevel(logging.INFO)
+
+
+def _stage_output(fn, *args):
+    """Run a stage that reports through print(); returns (result, captured text)."""
+    buf = StringIO()
+    with redirect_stdout(buf):
+        result = fn(*args)
+    return result, buf.getvalue().strip()
+
+
+def _mtime_ns(path):
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _rewritten(path, before):
+    """True if `path` exists and changed since its mtime was `before` (None: it didn't exist)."""
+    after = _mtime_ns(path)
+    return after is not None and after != before
+
+
+def audit_client(client_path):
+    """Run every stage for one client; never raises, failures land in the result."""
+    client = Path(client_path)
+    audit_dir = client / AUDIT_OUTPUT
+    normalized = audit_dir / 'data_normalized.json'
+    enriched = audit_dir / 'data_enriched.json'
+    metrics = audit_dir / 'metrics_summary.json'
+    report = {}
+
+    def validate():
+        ok, out = _stage_output(validate_folder, str(client))
+        if not ok:
+            raise StageFailed(out)
+        audit_dir.mkdir(parents=True, exist_ok=True)
+
+    def parse():
+        # One process per client already; parse each client's files serially.
+        # The stage reports failure by not writing, so a file left by an earlier run doesn't count.
+        before = _mtime_ns(normalized)
+        SocialDataParser(verbose=False).run(client / PERF_DATA, normalized)
+        if not _rewritten(normalized, before):
+            raise StageFailed("Parser produced no output")
+
+    def analyze():
+        before = _mtime_ns(metrics)
+        _shared['analyzer'].analyze(enriched, metrics)
+        if not _rewritten(metrics, before):
+            raise StageFailed("No posts to analyze")
+
+    def fill():
+        report['path'] = fill_report(client, _shared['template'])
+
+    def check_report():
+        # Validate the report just written, not whichever *_Audit_COMPLETE.md a glob finds first
+        code, out = _stage_output(validate_report, str(report['path']))
+        if code:
+            raise StageFailed(out)
+
+    steps = {
+        'validate': validate,
+        'parse': parse,
+        'enrich': lambda: calculate_engagement(normalized, enriched),
+        'analyze': analyze,
+        'report': fill,
+        'validate_report': check_report,
+    }
+
+    result = {'client': client.name, 'status': 'ok', 'failed_stage': None, 'error': None, 'timings': {}}
+    for name in STAGES:
+        start = time.perf_counter()
+        try:
+            steps[name]()
+        except SystemExit as e:
+            # Stage scripts exit on fatal input problems; keep the batch going
+            error = e.code if isinstance(e.code, str) else f"exited with status {e.code}"
+            result.update(status='failed', failed_stage=name, error=error)
+        except Exception as e:
+            result.update(status='failed', failed_stage=name, error=str(e) or type(e).__name__)
+        result['timings'][name] = round(time.perf_counter() - start, 3)
+        if result['status'] != 'ok':
+            break
+    result['total_seconds'] = round(sum(result['timings'].values()), 3)
+    return result
+
+
+def find_clients(root, pattern='client-*'):
+    return sorted(p for p in Path(root).glob(pattern) if p.is_dir())
+
+
+def run_batch(root, workers=None, bench_path=None, pattern='client-*', quiet=False):
+    """Audit every client folder under `root`; returns the summary dict."""
+    clients = find_clients(root, pattern)
+    if not clients:
+        logger.error(f"No {pattern} folders found in {root}")
+        return None
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(clients)))
+    logger.info(f"📁 Auditing {len(clients)} clients with {workers} worker(s)")
+
+    start = time.perf_counter()
+    if workers == 1:
+        _init_worker(bench_path, quiet)
+        results = [audit_client(c) for c in clients]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(bench_path, quiet)) as pool:
+            # map() keeps the summary in client order
+            results = list(pool.map(audit_client, clients))
+    wall = time.perf_counter() - start
+
+    stage_totals = {s: round(sum(r['timings'].get(s, 0) for r in results), 3) for s in STAGES}
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'clients_root': str(root),
+        'workers': workers,
+        'wall_seconds': round(wall, 3),
+        'succeeded': sum(1 for r in results if r['status'] == 'ok'),
+        'failed': sum(1 for r in results if r['status'] != 'ok'),
+        'stage_totals': stage_totals,
+        'clients': results,
+    }
+
+
+def log_summary(summary):
+    logger.info("=" * 60)
+    logger.info(f"✅ BATCH COMPLETE: {summary['succeeded']} succeeded, {summary['failed']} failed "
+                f"in {summary['wall_seconds']:.1f}s")
+    width = max(len(r['client']) for r in summary['clients'])
+    logger.info(f"   {'client':<{width}}  " + "  ".join(f"{s:>15}" for s in STAGES))
+    for r in summary['clients']:
+        cells = "  ".join(f"{r['timings'][s]:>14.2f}s" if s in r['timings'] else f"{'-':>15}" for s in STAGES)
+        logger.info(f"   {r['client']:<{width}}  {cells}")
+    logger.info(f"   {'total':<{width}}  " + "  ".join(f"{summary['stage_totals'][s]:>14.2f}s" for s in STAGES))
+    for r in summary['clients']:
+        if r['status'] != 'ok':
+            logger.error(f"   ❌ {r['client']}: {r['failed_stage']} - {r['error']}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the social audit pipeline for every client folder under a root')
+    parser.add_argument('--clients-root', required=True, help='Directory containing client-* folders')
+    parser.add_argument('--workers', type=int, help='Clients audited in parallel (default: CPU count)')
+    parser.add_argument('--benchmarks', help='Benchmarks JSON passed to the analyzer')
+    parser.add_argument('--pattern', default='client-*', help='Glob for client folders (default: %(default)s)')
+    parser.add_argument('--summary', help=f'Summary JSON path (default: <clients-root>/{SUMMARY_NAME})')
+    parser.add_argument('--quiet', action='store_true', help='Only log warnings from the pipeline stages')
+    args = parser.parse_args()
+
+    summary = run_batch(args.clients_root, args.workers, args.benchmarks, args.pattern, args.quiet)
+    if summary is None:
+        sys.exit(1)
+    log_summary(summary)
+
+    summary_path = Path(args.summary or Path(args.clients_root) / SUMMARY_NAME)
+    with open(summary_path, 'w') as f:
+        json.dump(summary, f, indent=2)
+    logger.info(f"Summary written: {summary_path}")
+    sys.exit(1 if summary['failed'] else 0)